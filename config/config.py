@@ -16,11 +16,60 @@ class Config:
     BROWSER: str = os.getenv("BROWSER", "chrome")
     HEADLESS: bool = os.getenv("HEADLESS", "false").lower() == "true"
     WINDOW_SIZE: str = os.getenv("WINDOW_SIZE", "1920,1080")
+    BROWSER_PROFILE: str = os.getenv("BROWSER_PROFILE", "default")
+    
+    # Remote execution (Selenium Grid / standalone server), empty runs locally
+    REMOTE_URL: str = os.getenv("REMOTE_URL", "")
+    REMOTE_POOL_SIZE: int = int(os.getenv("REMOTE_POOL_SIZE", "0"))  # 0 sizes the pool from PREWARM_DRIVERS
+    REMOTE_GZIP: bool = os.getenv("REMOTE_GZIP", "false").lower() == "true"
+    
+    # Session reuse
+    REUSE_DRIVER: bool = os.getenv("REUSE_DRIVER", "true").lower() == "true"
+    MAX_BROWSER_RSS_MB: int = int(os.getenv("MAX_BROWSER_RSS_MB", "1500"))
+    MAX_JS_HEAP_MB: int = int(os.getenv("MAX_JS_HEAP_MB", "300"))
+    PREWARM_DRIVERS: int = int(os.getenv("PREWARM_DRIVERS", "0"))  # browsers kept booting for the next acquire()
+    BROWSER_CONTEXTS: bool = os.getenv("BROWSER_CONTEXTS", "false").lower() == "true"
+    SHARED_DRIVER_SERVICE: bool = os.getenv("SHARED_DRIVER_SERVICE", "true").lower() == "true"
+    PROFILE_TEMPLATE: bool = os.getenv("PROFILE_TEMPLATE", "false").lower() == "true"
+    PROFILE_TEMPLATE_DIR: str = os.getenv(
+        "PROFILE_TEMPLATE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "demoqa-selenium", "profile-template")
+    )
+    DRIVER_CACHE_FILE: str = os.getenv(
+        "DRIVER_CACHE_FILE",
+        os.path.join(os.path.expanduser("~"), ".cache", "demoqa-selenium", "driver_paths.json")
+    )
     
     # Timeouts
     IMPLICIT_WAIT: int = 10
     EXPLICIT_WAIT: int = 20
     PAGE_LOAD_TIMEOUT: int = 30
+    COMMAND_TIMEOUT: int = int(os.getenv("COMMAND_TIMEOUT", "30"))  # watchdog deadline per WebDriver command, 0 disables
+    NETWORK_IDLE_MS: int = int(os.getenv("NETWORK_IDLE_MS", "500"))  # quiet window before the network counts as idle
+    NETWORK_STALL_S: int = int(os.getenv("NETWORK_STALL_S", "10"))  # requests open longer than this are not waited for
+    WAIT_MODE: str = os.getenv("WAIT_MODE", "poll")  # poll (WebDriverWait) or observer (in-page MutationObserver)
+    DOM_QUIET_MS: int = int(os.getenv("DOM_QUIET_MS", "300"))  # no DOM mutation for this long counts as settled
+    WAIT_INITIAL_POLL: float = float(os.getenv("WAIT_INITIAL_POLL", "0.025"))  # first page-object poll, in seconds
+    WAIT_BACKOFF: float = float(os.getenv("WAIT_BACKOFF", "1.5"))  # each poll interval is this much longer than the last
+    WAIT_MAX_POLL: float = float(os.getenv("WAIT_MAX_POLL", "0.5"))
+    
+    ELEMENT_CACHE: bool = os.getenv("ELEMENT_CACHE", "true").lower() == "true"  # reuse page-object handles until navigation
+    FORM_FILL_MODE: str = os.getenv("FORM_FILL_MODE", "script")  # script (one call per form) or keys (send_keys per field)
+    COMPILE_XPATH: bool = os.getenv("COMPILE_XPATH", "true").lower() == "true"  # rewrite XPath locators to CSS where equivalent
+    GESTURE_STEPS: int = int(os.getenv("GESTURE_STEPS", "10"))  # pointer moves between press and release of a drag
+    GESTURE_STEP_MS: int = int(os.getenv("GESTURE_STEP_MS", "20"))  # duration of each of those moves
+    
+    SLEEP_PROFILE: bool = os.getenv("SLEEP_PROFILE", "false").lower() == "true"  # profile sleeps/waits outside pytest
+    
+    # Adaptive per-locator timeouts learned from earlier runs
+    ADAPTIVE_TIMEOUTS: bool = os.getenv("ADAPTIVE_TIMEOUTS", "false").lower() == "true"
+    ADAPTIVE_SAFETY_FACTOR: float = float(os.getenv("ADAPTIVE_SAFETY_FACTOR", "3"))
+    ADAPTIVE_MIN_SAMPLES: int = int(os.getenv("ADAPTIVE_MIN_SAMPLES", "5"))
+    ADAPTIVE_MIN_TIMEOUT: float = float(os.getenv("ADAPTIVE_MIN_TIMEOUT", "2"))
+    TIMEOUT_HISTORY_FILE: str = os.getenv(
+        "TIMEOUT_HISTORY_FILE",
+        os.path.join(os.path.expanduser("~"), ".cache", "demoqa-selenium", "locator_timings.json")
+    )
     
     # Directories
     REPORTS_DIR: str = "reports"
@@ -4,17 +4,18 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
 import os
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class DemoQADemo:
     """Simple demo to show the project is working"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_homepage_navigation(self):
         """Test basic homepage navigation"""
@@ -22,7 +23,7 @@ class DemoQADemo:
         self.driver.get("https://demoqa.com")
         
         # Wait for page to load
-        time.sleep(3)
+        self.waits.settle(wc.element_visible((By.CLASS_NAME, "card")), 3)
         
         # Check if main cards are visible
         try:
@@ -54,7 +55,7 @@ class DemoQADemo:
         
         try:
             # Wait for page to load
-            time.sleep(2)
+            self.waits.settle(wc.element_visible((By.ID, "userName")), 2)
             
             # Fill text fields
             name_field = self.driver.find_element(By.ID, "userName")
@@ -88,13 +89,13 @@ class DemoQADemo:
         
         try:
             # Wait for page to load
-            time.sleep(2)
+            self.waits.settle(wc.element_visible((By.CSS_SELECTOR, "button[title='Expand all']")), 2)
             
             # Try to expand and select checkboxes
             try:
                 expand_all = self.driver.find_element(By.CSS_SELECTOR, "button[title='Expand all']")
                 expand_all.click()
-                time.sleep(1)
+                self.waits.until(wc.element_count((By.CSS_SELECTOR, ".rct-node"), lambda n: n > 3), replaces=1)
                 print("   - Expanded checkbox tree")
             except:
                 print("   - Expand button not found, continuing...")
@@ -103,7 +104,7 @@ class DemoQADemo:
             try:
                 home_checkbox = self.driver.find_element(By.XPATH, "//span[text()='Home']/../span[@class='rct-checkbox']")
                 self.driver.execute_script("arguments[0].click();", home_checkbox)
-                time.sleep(1)
+                self.waits.settle(wc.element_visible((By.ID, "result")), 1)
                 print("   - Home checkbox selected")
             except:
                 print("   - Home checkbox interaction skipped")
@@ -164,7 +165,7 @@ class DemoQADemo:
         
         finally:
             print(f"\n🔚 Closing browser...")
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Run the demo
@@ -6,12 +6,75 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import Select
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    ElementClickInterceptedException, ElementNotInteractableException, NoSuchElementException,
+    StaleElementReferenceException, TimeoutException,
+)
+from selenium.webdriver.remote.webelement import WebElement
 from config.config import Config
+from utils.dom_snapshot import DomSnapshot
+from utils.element_cache import ElementCache
+from utils.gestures import Gestures
+from utils.locators import compile_locator
+from utils.web_table import WebTable
+from utils.waits import AdaptiveTimeouts, AttributeStream, DomObserver, Waiter, WaitStrategy, conditions as wc
+from utils.waits.dom_observer import translate_locator
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Shared by the batch scripts below: resolve a translate_locator() pair
+_FIND = """
+const find = (using, value) => using === 'xpath'
+    ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(value);
+"""
+
+# Resolves and reads every locator inside the page, so N values cost one command
+_READ_MANY_SCRIPT = _FIND + """
+const [locators, attributes] = arguments;
+const visible = el => !!el && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+    && getComputedStyle(el).visibility !== 'hidden';
+const result = {};
+for (const [name, [using, value]] of Object.entries(locators)) {
+    const el = find(using, value);
+    result[name] = {
+        present: !!el,
+        visible: visible(el),
+        text: visible(el) ? el.innerText.trim() : '',
+        value: el && 'value' in el ? el.value : null,
+        attributes: Object.fromEntries(attributes.map(a => [a, el ? el.getAttribute(a) : null])),
+    };
+}
+return result;
+"""
+
+# Sets each value through the prototype's native setter, which React's value
+# tracking sees, then fires input/change so controlled components update.
+# Returns the indexes of fields that need real keystrokes instead.
+_FILL_MANY_SCRIPT = _FIND + """
+const setters = new Map([HTMLInputElement, HTMLTextAreaElement, HTMLSelectElement].map(
+    type => [type.prototype, Object.getOwnPropertyDescriptor(type.prototype, 'value').set]
+));
+const missed = [];
+arguments[0].forEach(([using, value, text], index) => {
+    const el = find(using, value);
+    const setter = el && setters.get(Object.getPrototypeOf(el));
+    if (!setter || el.disabled || el.readOnly || el.type === 'file') {
+        missed.push(index);
+        return;
+    }
+    el.focus();
+    setter.call(el, text);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+    if (el.value !== text) missed.push(index);
+});
+return missed;
+"""
+
 
 class BasePage:
     """Base page class with common functionality."""
@@ -19,55 +82,161 @@ class BasePage:
     def __init__(self, driver: webdriver.Remote):
         self.driver = driver
         self.wait = WebDriverWait(driver, Config.EXPLICIT_WAIT)
+        # Poll schedule for the element waits below; pass timeout/initial_interval/... per call to override
+        self.wait_strategy = WaitStrategy()
         self.actions = ActionChains(driver)
+        # WAIT_MODE=observer answers element waits from an in-page MutationObserver
+        self.observer = DomObserver(driver) if Config.WAIT_MODE == "observer" else None
+        # Handles found by this driver's page objects, kept until the next navigation or frame switch
+        self.element_cache = ElementCache.for_driver(driver) if Config.ELEMENT_CACHE else None
     
-    def find_element(self, locator: tuple) -> webdriver.Remote:
+    def find_element(self, locator: tuple, **wait) -> webdriver.Remote:
         """Find element with explicit wait."""
         try:
-            return self.wait.until(EC.presence_of_element_located(locator))
+            return self._wait_for(locator, EC.presence_of_element_located, "present", **wait)
         except TimeoutException:
             logger.error(f"Element not found: {locator}")
             raise
     
-    def find_elements(self, locator: tuple) -> list:
+    def _wait_for(self, locator: tuple, condition, observe: str = None, **wait):
+        """
+        Wait for a locator under its learned deadline (see AdaptiveTimeouts)
+        and record how long it took.
+
+        Args:
+            condition: expected_conditions factory taking the locator
+            observe: DomObserver method to use instead when WAIT_MODE=observer
+            **wait: WaitStrategy overrides for this call; an explicit timeout beats the learned one
+        """
+        key = AdaptiveTimeouts.key(type(self).__name__, locator)
+        default = wait.get("timeout") or self.wait_strategy.timeout
+        timeout = wait.get("timeout") or AdaptiveTimeouts.timeout_for(key, default)
+        wait["timeout"] = timeout
+        started = time.perf_counter()
+        try:
+            if self.observer and observe:
+                result = getattr(self.observer, observe)(compile_locator(locator), timeout=timeout)
+            else:
+                result = self.wait_strategy.until(self.driver, condition(compile_locator(locator)), **wait)
+        except TimeoutException:
+            if timeout < default:
+                logger.error(f"{locator} missed its learned deadline of {timeout}s")
+            raise
+        AdaptiveTimeouts.record(key, time.perf_counter() - started)
+        if self.element_cache and isinstance(result, WebElement):
+            self.element_cache.store(locator, result)
+        return result
+    
+    def _element(self, locator: tuple, **wait) -> WebElement:
+        """Element from the element cache, else waited for (and cached) like find_element."""
+        if self.element_cache:
+            element = self.element_cache.lookup(type(self).__name__, locator)
+            if element is not None:
+                return element
+        return self.find_element(locator, **wait)
+    
+    def _on_element(self, locator: tuple, action, **wait):
+        """Run action(element), finding the element again once if its handle has gone stale."""
+        try:
+            return action(self._element(locator, **wait))
+        except StaleElementReferenceException:
+            if self.element_cache:
+                self.element_cache.evict(type(self).__name__, locator)
+            return action(self.find_element(locator, **wait))
+    
+    def find_elements(self, locator: tuple, **wait) -> list:
         """Find multiple elements."""
         try:
-            return self.wait.until(EC.presence_of_all_elements_located(locator))
+            return self.wait_strategy.until(self.driver, EC.presence_of_all_elements_located(compile_locator(locator)), **wait)
         except TimeoutException:
             logger.error(f"Elements not found: {locator}")
             return []
     
-    def click_element(self, locator: tuple) -> None:
-        """Click element with explicit wait."""
-        element = self.wait.until(EC.element_to_be_clickable(locator))
+    def click_element(self, locator: tuple, **wait) -> None:
+        """Click element with explicit wait; a cached handle is clicked straight away."""
+        page = type(self).__name__
+        element = self.element_cache.lookup(page, locator) if self.element_cache else None
+        if element is not None:
+            try:
+                element.click()
+                logger.info(f"Clicked element: {locator}")
+                return
+            except (StaleElementReferenceException, ElementNotInteractableException, ElementClickInterceptedException):
+                # Gone or not clickable yet: wait for it as usual
+                self.element_cache.evict(page, locator)
+        element = self._wait_for(locator, EC.element_to_be_clickable, **wait)
         element.click()
         logger.info(f"Clicked element: {locator}")
     
     def send_keys(self, locator: tuple, text: str) -> None:
         """Send keys to element."""
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(text)
+        def type_text(element):
+            element.clear()
+            element.send_keys(text)
+        self._on_element(locator, type_text)
         logger.info(f"Sent keys '{text}' to element: {locator}")
     
+    def fill_many(self, values: dict, keystrokes: tuple = ()) -> None:
+        """
+        Fill several fields in one script call instead of clear() + send_keys() per field.
+
+        Args:
+            values: {locator: text}
+            keystrokes: Locators that need real key events (autocompletes, masks); they are typed
+                with send_keys, as is every field with FORM_FILL_MODE=keys and any field
+                the script could not set (file inputs, missing or read-only elements)
+        """
+        if Config.FORM_FILL_MODE == "keys":
+            keystrokes = tuple(values)
+        scripted = [locator for locator in values if locator not in keystrokes]
+        fields = [(*translate_locator(compile_locator(locator)), str(values[locator])) for locator in scripted]
+        missed = self.driver.execute_script(_FILL_MANY_SCRIPT, fields) if fields else []
+        typed = [locator for locator in values if locator in keystrokes] + [scripted[i] for i in missed]
+        for locator in typed:
+            self.send_keys(locator, str(values[locator]))
+        logger.info(f"Filled {len(scripted) - len(missed)} fields in one call, typed {len(typed)}")
+    
     def get_text(self, locator: tuple) -> str:
         """Get text from element."""
-        element = self.find_element(locator)
-        text = element.text
+        text = self._on_element(locator, lambda element: element.text)
         logger.info(f"Got text '{text}' from element: {locator}")
         return text
     
     def get_attribute(self, locator: tuple, attribute: str) -> str:
         """Get attribute value from element."""
-        element = self.find_element(locator)
-        value = element.get_attribute(attribute)
+        value = self._on_element(locator, lambda element: element.get_attribute(attribute))
         logger.info(f"Got attribute '{attribute}' = '{value}' from element: {locator}")
         return value
     
-    def is_element_visible(self, locator: tuple) -> bool:
+    def read_many(self, locators: dict, attributes: tuple = ()) -> dict:
+        """
+        Read several elements in a single script call instead of a find plus a read per element.
+
+        Args:
+            locators: {name: locator}; css-translatable or xpath locators only
+            attributes: Attribute names to read from every element
+
+        Returns:
+            {name: {"present", "visible", "text", "value", "attributes": {attribute: value}}};
+            text is the rendered text like WebElement.text, empty when hidden or missing
+        """
+        translated = {name: translate_locator(compile_locator(locator)) for name, locator in locators.items()}
+        values = self.driver.execute_script(_READ_MANY_SCRIPT, translated, list(attributes))
+        logger.info(f"Read {len(values)} elements in one call: {list(values)}")
+        return values
+    
+    def snapshot(self) -> DomSnapshot:
+        """Copy of the current document for structure checks that need no live element."""
+        return DomSnapshot.take(self.driver)
+    
+    def read_table(self, selector: str = ".rt-table") -> WebTable:
+        """Headers and the rows of every page of a react-table, in one script call."""
+        return WebTable.read(self.driver, selector)
+    
+    def is_element_visible(self, locator: tuple, **wait) -> bool:
         """Check if element is visible."""
         try:
-            self.wait.until(EC.visibility_of_element_located(locator))
+            self._wait_for(locator, EC.visibility_of_element_located, "visible", **wait)
             return True
         except TimeoutException:
             return False
@@ -75,50 +244,69 @@ class BasePage:
     def is_element_present(self, locator: tuple) -> bool:
         """Check if element is present in DOM."""
         try:
-            self.driver.find_element(*locator)
+            self.driver.find_element(*compile_locator(locator))
             return True
         except NoSuchElementException:
             return False
     
-    def wait_for_element_to_disappear(self, locator: tuple) -> bool:
+    def wait_for_element_to_disappear(self, locator: tuple, **wait) -> bool:
         """Wait for element to disappear."""
+        if self.element_cache:
+            self.element_cache.forget(locator)
+        try:
+            if self.observer:
+                return self.observer.gone(compile_locator(locator), timeout=wait.get("timeout"))
+            self.wait_strategy.until(self.driver, EC.invisibility_of_element_located(compile_locator(locator)), **wait)
+            return True
+        except TimeoutException:
+            return False
+    
+    def wait_for_network_idle(self, quiet_ms: int = None, timeout: float = None) -> bool:
+        """Wait until no request has been in flight for quiet_ms (default Config.NETWORK_IDLE_MS)."""
         try:
-            self.wait.until(EC.invisibility_of_element_located(locator))
+            Waiter(self.driver, timeout=timeout).until(wc.network_idle(quiet_ms))
             return True
         except TimeoutException:
+            logger.warning(f"Network still busy after {timeout or Config.EXPLICIT_WAIT}s")
             return False
     
+    def wait_for_dom_quiet(self, quiet_ms: int = None, timeout: float = None) -> bool:
+        """Wait until the DOM has stopped changing for quiet_ms (default Config.DOM_QUIET_MS)."""
+        return (self.observer or DomObserver(self.driver)).quiet(quiet_ms, timeout)
+    
+    def stream_attributes(self, locator: tuple, *attributes: str) -> AttributeStream:
+        """Start recording attribute changes of an element; use as a context manager."""
+        return AttributeStream(self.driver, self._element(locator), *attributes).start()
+    
     def scroll_to_element(self, locator: tuple) -> None:
         """Scroll to element."""
-        element = self.find_element(locator)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        self._on_element(locator, lambda element: self.driver.execute_script("arguments[0].scrollIntoView(true);", element))
         logger.info(f"Scrolled to element: {locator}")
     
     def hover_over_element(self, locator: tuple) -> None:
         """Hover over element."""
-        element = self.find_element(locator)
-        self.actions.move_to_element(element).perform()
+        self._on_element(locator, lambda element: self.actions.move_to_element(element).perform())
         logger.info(f"Hovered over element: {locator}")
     
     def select_dropdown_by_text(self, locator: tuple, text: str) -> None:
         """Select dropdown option by visible text."""
-        element = self.find_element(locator)
-        select = Select(element)
-        select.select_by_visible_text(text)
+        self._on_element(locator, lambda element: Select(element).select_by_visible_text(text))
         logger.info(f"Selected '{text}' from dropdown: {locator}")
     
     def select_dropdown_by_value(self, locator: tuple, value: str) -> None:
         """Select dropdown option by value."""
-        element = self.find_element(locator)
-        select = Select(element)
-        select.select_by_value(value)
+        self._on_element(locator, lambda element: Select(element).select_by_value(value))
         logger.info(f"Selected value '{value}' from dropdown: {locator}")
     
     def drag_and_drop(self, source_locator: tuple, target_locator: tuple) -> None:
-        """Drag and drop element."""
-        source = self.find_element(source_locator)
-        target = self.find_element(target_locator)
-        self.actions.drag_and_drop(source, target).perform()
+        """Drag and drop element once both are present: one geometry script and one action sequence."""
+        try:
+            Gestures(self.driver).drag(self._element(source_locator), self._element(target_locator))
+        except StaleElementReferenceException:
+            if self.element_cache:
+                self.element_cache.evict(type(self).__name__, source_locator)
+                self.element_cache.evict(type(self).__name__, target_locator)
+            Gestures(self.driver).drag(self.find_element(source_locator), self.find_element(target_locator))
         logger.info(f"Dragged from {source_locator} to {target_locator}")
     
     def switch_to_frame(self, frame_locator: tuple) -> None:
@@ -127,6 +315,16 @@ class BasePage:
         self.driver.switch_to.frame(frame)
         logger.info(f"Switched to frame: {frame_locator}")
     
+    def wait_for_new_window(self, known_handles: list, timeout: float = None) -> str:
+        """Wait for a window not in known_handles, switch to it and return its handle."""
+        handle = Waiter(self.driver, timeout=timeout).new_window(known_handles)
+        logger.info(f"Switched to new window: {handle}")
+        return handle
+    
+    def wait_for_alert(self, timeout: float = None):
+        """Wait for a JavaScript alert and return it."""
+        return Waiter(self.driver, timeout=timeout).alert()
+    
     def switch_to_default_content(self) -> None:
         """Switch back to default content."""
         self.driver.switch_to.default_content()
@@ -23,6 +23,12 @@ class TextBoxPage(BasePage):
     OUTPUT_EMAIL = (By.ID, "email")
     OUTPUT_CURRENT_ADDRESS = (By.XPATH, "//p[@id='currentAddress']")
     OUTPUT_PERMANENT_ADDRESS = (By.XPATH, "//p[@id='permanentAddress']")
+    OUTPUT_FIELDS = {
+        "name": OUTPUT_NAME,
+        "email": OUTPUT_EMAIL,
+        "current_address": OUTPUT_CURRENT_ADDRESS,
+        "permanent_address": OUTPUT_PERMANENT_ADDRESS,
+    }
     
     def navigate_to_text_box(self):
         """Navigate to Text Box section."""
@@ -50,11 +56,13 @@ class TextBoxPage(BasePage):
         self.click_element(self.SUBMIT_BUTTON)
     
     def fill_form(self, name: str, email: str, current_address: str, permanent_address: str):
-        """Fill complete form."""
-        self.fill_full_name(name)
-        self.fill_email(email)
-        self.fill_current_address(current_address)
-        self.fill_permanent_address(permanent_address)
+        """Fill complete form in one call and submit it."""
+        self.fill_many({
+            self.FULL_NAME_INPUT: name,
+            self.EMAIL_INPUT: email,
+            self.CURRENT_ADDRESS_TEXTAREA: current_address,
+            self.PERMANENT_ADDRESS_TEXTAREA: permanent_address,
+        })
         self.click_submit()
     
     def get_output_name(self) -> str:
@@ -73,6 +81,10 @@ class TextBoxPage(BasePage):
         """Get output permanent address text."""
         return self.get_text(self.OUTPUT_PERMANENT_ADDRESS)
     
+    def get_output(self) -> dict:
+        """Get all output lines in one call: {field: text}, empty for fields not shown."""
+        return {name: read["text"] for name, read in self.read_many(self.OUTPUT_FIELDS).items()}
+    
     def is_output_visible(self) -> bool:
         """Check if output section is visible."""
         return self.is_element_visible(self.OUTPUT_SECTION)
\ No newline at end of file
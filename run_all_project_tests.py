@@ -20,6 +20,14 @@ Options:
     --individual-only               Run only individual tests
     --allure-only                   Run only allure tests
     --section SECTION               Run specific section (elements, forms, alerts_frames, widgets, interactions, bookstore)
+    --profile default|fast|fidelity Browser launch profile (default: default)
+    --compare-profiles              Compare startup and page-load time of each profile and exit
+    --benchmark-template            Compare browser startup on a fresh vs template profile and exit
+    --show-timeouts                 Print the learned per-locator timeouts and exit
+    --sleep-profile                 Rank where the tests block in sleeps and waits
+    --benchmark-waits               Compare BasePage wait latency: fixed 500 ms polls vs backoff polling and exit
+    --benchmark-reads               Compare driver round trips: one get_text per element vs read_many and exit
+    --benchmark-locators            Compare lookup latency of page-object XPath locators vs their compiled CSS and exit
     --verbose                       Verbose output
     --generate-report              Generate final HTML report
 """
@@ -261,6 +269,13 @@ class MasterTestRunner:
         print(f"🐍 Python executable: {self.python_exe}")
         print(f"📁 Project root: {self.project_root}")
         
+        from utils.waits import WaitSavings
+        from utils.sleep_profiler import SleepProfiler
+        from utils.element_cache import ElementCache
+        WaitSavings.clear()
+        SleepProfiler.clear()
+        ElementCache.clear()
+        
         # Define test sections
         sections = ['elements', 'forms', 'alerts_frames', 'widgets', 'interactions', 'bookstore']
         
@@ -294,6 +309,9 @@ class MasterTestRunner:
         # Calculate final results
         self.results['end_time'] = datetime.now()
         self.results['total_duration'] = (self.results['end_time'] - self.results['start_time']).total_seconds()
+        self.results['wait_savings'] = WaitSavings.aggregate()
+        self.results['sleep_profile'] = SleepProfiler.aggregate()
+        self.results['element_cache'] = ElementCache.aggregate()
         
         if self.results['summary']['total_tests'] > 0:
             self.results['summary']['success_rate'] = (
@@ -303,6 +321,329 @@ class MasterTestRunner:
         self._print_final_summary()
         return True
     
+    def compare_profiles(self, profiles=None):
+        """Measure browser startup and page-load time for each launch profile"""
+        sys.path.insert(0, self.project_root)
+        from config.config import Config
+        from utils.browser_profiles import PROFILES
+        from utils.driver_factory import DriverFactory
+        
+        profiles = profiles or list(PROFILES)
+        timings = {}
+        
+        print("\n" + "=" * 80)
+        print("⏱️  BROWSER PROFILE COMPARISON")
+        print("=" * 80)
+        
+        for name in profiles:
+            try:
+                start = time.perf_counter()
+                driver = DriverFactory.create_driver(name)
+                startup = time.perf_counter() - start
+                
+                start = time.perf_counter()
+                driver.get(Config.BASE_URL)
+                page_load = time.perf_counter() - start
+                driver.quit()
+                
+                timings[name] = {'startup': startup, 'page_load': page_load}
+            except Exception as e:
+                print(f"❌ {name}: could not start browser - {e}")
+        
+        baseline = timings.get('fidelity') or next(iter(timings.values()), None)
+        for name, timing in timings.items():
+            startup_diff = timing['startup'] - baseline['startup']
+            page_load_diff = timing['page_load'] - baseline['page_load']
+            print(f"   {name:<10} startup: {timing['startup']:.2f}s ({startup_diff:+.2f}s)   "
+                  f"page load: {timing['page_load']:.2f}s ({page_load_diff:+.2f}s)")
+        
+        self.results['profiles'] = timings
+        return timings
+    
+    def benchmark_profile_template(self, runs=3):
+        """Compare browser startup on a fresh profile against a copy of the template profile"""
+        sys.path.insert(0, self.project_root)
+        from config.config import Config
+        from utils.driver_factory import DriverFactory
+        
+        original = Config.PROFILE_TEMPLATE
+        timings = {}
+        
+        print("\n" + "=" * 80)
+        print("⏱️  PROFILE TEMPLATE STARTUP BENCHMARK")
+        print("=" * 80)
+        
+        try:
+            for label, use_template in (('fresh', False), ('template', True)):
+                Config.PROFILE_TEMPLATE = use_template
+                # Untimed warm-up: starts the driver service and builds the template
+                DriverFactory.create_driver().quit()
+                
+                samples = []
+                for _ in range(runs):
+                    start = time.perf_counter()
+                    driver = DriverFactory.create_driver()
+                    samples.append(time.perf_counter() - start)
+                    driver.quit()
+                timings[label] = sorted(samples)[len(samples) // 2]
+        except Exception as e:
+            print(f"❌ Benchmark could not start browser - {e}")
+        finally:
+            Config.PROFILE_TEMPLATE = original
+        
+        for label, median in timings.items():
+            print(f"   {label:<10} median startup: {median:.2f}s over {runs} runs")
+        if len(timings) == 2:
+            print(f"   Template saves {timings['fresh'] - timings['template']:+.2f}s per browser start")
+        
+        self.results['profile_template'] = timings
+        return timings
+    
+    def benchmark_wait_strategy(self, runs=15):
+        """Median latency of BasePage waits on a local page, fixed 500 ms polling vs the backoff strategy"""
+        sys.path.insert(0, self.project_root)
+        import tempfile
+        from selenium.webdriver.common.by import By
+        from config.config import Config
+        from pages.base_page import BasePage
+        from utils.driver_factory import DriverFactory
+        from utils.waits import WaitStrategy
+        from utils.waits.strategy import FIXED_HALF_SECOND
+        
+        # Element appears, shows and enables `delay` ms after load (delay from the query string)
+        page = """<html><body>
+            <button id="enabled" disabled>go</button><div id="shown" style="display:none">shown</div>
+            <script>
+                setTimeout(() => {
+                    const el = document.createElement('div');
+                    el.id = 'present';
+                    document.body.appendChild(el);
+                    document.getElementById('shown').style.display = 'block';
+                    document.getElementById('enabled').disabled = false;
+                }, Number(location.search.slice(1)));
+            </script>
+        </body></html>"""
+        with tempfile.NamedTemporaryFile("w", suffix=".html", delete=False) as f:
+            f.write(page)
+        url = f"file://{f.name}"
+        delays = [30, 80, 150, 300, 600]
+        calls = {
+            'find_element': lambda p: p.find_element((By.ID, "present")),
+            'click_element': lambda p: p.click_element((By.ID, "enabled")),
+            'is_element_visible': lambda p: p.is_element_visible((By.ID, "shown")),
+        }
+        strategies = {'fixed 500ms': FIXED_HALF_SECOND, 'backoff': WaitStrategy()}
+        timings = {}
+        
+        print("\n" + "=" * 80)
+        print("⏱️  WAIT STRATEGY BENCHMARK")
+        print("=" * 80)
+        
+        adaptive = Config.ADAPTIVE_TIMEOUTS
+        Config.ADAPTIVE_TIMEOUTS = False  # keep benchmark waits out of the learned history
+        driver = None
+        try:
+            driver = DriverFactory.create_driver()
+            base_page = BasePage(driver)
+            for method, call in calls.items():
+                for label, strategy in strategies.items():
+                    base_page.wait_strategy = strategy
+                    samples = []
+                    for run in range(runs):
+                        driver.get(f"{url}?{delays[run % len(delays)]}")
+                        start = time.perf_counter()
+                        call(base_page)
+                        samples.append(time.perf_counter() - start)
+                    timings.setdefault(method, {})[label] = sorted(samples)[len(samples) // 2]
+        except Exception as e:
+            print(f"❌ Benchmark could not run - {e}")
+        finally:
+            Config.ADAPTIVE_TIMEOUTS = adaptive
+            if driver:
+                driver.quit()
+            os.remove(f.name)
+        
+        for method, medians in timings.items():
+            if len(medians) == 2:
+                fixed, backoff = medians['fixed 500ms'], medians['backoff']
+                print(f"   {method:<20} fixed 500ms: {fixed * 1000:6.0f} ms   backoff: {backoff * 1000:6.0f} ms   "
+                      f"({(fixed - backoff) / fixed:.0%} faster)")
+        
+        self.results['wait_strategy'] = timings
+        return timings
+    
+    def benchmark_batched_reads(self, fields=8, runs=5):
+        """Driver commands and time to read a page's output lines one by one vs with one read_many"""
+        sys.path.insert(0, self.project_root)
+        import tempfile
+        from selenium.webdriver.common.by import By
+        from config.config import Config
+        from pages.base_page import BasePage
+        from utils.driver_factory import DriverFactory
+        
+        page = "<html><body>" + "".join(
+            f'<p id="field{i}" class="line" data-index="{i}">Value {i}</p>' for i in range(fields)
+        ) + "</body></html>"
+        with tempfile.NamedTemporaryFile("w", suffix=".html", delete=False) as f:
+            f.write(page)
+        locators = {f"field{i}": (By.ID, f"field{i}") for i in range(fields)}
+        reads = {
+            'get_text each': lambda p: {name: p.get_text(locator) for name, locator in locators.items()},
+            'read_many': lambda p: p.read_many(locators),
+        }
+        results = {}
+        
+        print("\n" + "=" * 80)
+        print("📖 BATCHED READ BENCHMARK")
+        print("=" * 80)
+        
+        adaptive, element_cache = Config.ADAPTIVE_TIMEOUTS, Config.ELEMENT_CACHE
+        Config.ADAPTIVE_TIMEOUTS = False  # keep benchmark waits out of the learned history
+        Config.ELEMENT_CACHE = False  # cached finds would hide the per-read round trips being compared
+        driver = None
+        try:
+            driver = DriverFactory.create_driver()
+            driver.get(f"file://{f.name}")
+            base_page = BasePage(driver)
+            execute = driver.execute
+            commands = []
+            
+            def counting_execute(command, params=None):
+                commands.append(command)
+                return execute(command, params)
+            driver.execute = counting_execute
+            for label, read in reads.items():
+                samples = []
+                for _ in range(runs):
+                    commands.clear()
+                    start = time.perf_counter()
+                    read(base_page)
+                    samples.append(time.perf_counter() - start)
+                results[label] = {'commands': len(commands), 'median_s': sorted(samples)[len(samples) // 2]}
+        except Exception as e:
+            print(f"❌ Benchmark could not run - {e}")
+        finally:
+            Config.ADAPTIVE_TIMEOUTS, Config.ELEMENT_CACHE = adaptive, element_cache
+            if driver:
+                driver.quit()
+            os.remove(f.name)
+        
+        for label, result in results.items():
+            print(f"   {label:<15} {result['commands']:3d} commands   {result['median_s'] * 1000:6.1f} ms   ({fields} elements)")
+        if len(results) == 2:
+            each, batched = results['get_text each'], results['read_many']
+            print(f"   read_many saves {each['commands'] - batched['commands']} round trips per read "
+                  f"({(each['median_s'] - batched['median_s']) / each['median_s']:.0%} faster)")
+        
+        self.results['batched_reads'] = results
+        return results
+    
+    def benchmark_locator_compiler(self, runs=15, evaluations=500):
+        """Lookup latency of every compilable page-object XPath locator, as XPath and as compiled CSS"""
+        sys.path.insert(0, self.project_root)
+        import importlib
+        import pkgutil
+        import pages
+        from selenium.webdriver.common.by import By
+        from config.config import Config
+        from pages.base_page import BasePage
+        from utils.driver_factory import DriverFactory
+        from utils.locators import xpath_to_css
+        
+        for module in pkgutil.walk_packages(pages.__path__, 'pages.'):
+            importlib.import_module(module.name)
+        urls = {'HomePage': Config.BASE_URL, 'TextBoxPage': f"{Config.BASE_URL}/text-box"}
+        
+        # In-page cost of the two engines, without the driver round trip
+        evaluate = """
+            const [xpath, css, n] = arguments;
+            let start = performance.now();
+            for (let i = 0; i < n; i++) document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const xpathMs = performance.now() - start;
+            start = performance.now();
+            for (let i = 0; i < n; i++) document.querySelectorAll(css);
+            return [xpathMs, performance.now() - start];
+        """
+        results = {}
+        
+        print("\n" + "=" * 80)
+        print("🧭 LOCATOR COMPILER BENCHMARK")
+        print("=" * 80)
+        
+        driver = None
+        try:
+            driver = DriverFactory.create_driver()
+            for page_class in BasePage.__subclasses__():
+                locators = {
+                    name: value for name, value in vars(page_class).items()
+                    if isinstance(value, tuple) and len(value) == 2 and value[0] == By.XPATH
+                }
+                compiled = {name: xpath_to_css(xpath) for name, (_, xpath) in locators.items()}
+                print(f"   {page_class.__name__}: {sum(css is not None for css in compiled.values())}/{len(locators)} "
+                      f"XPath locators compile to CSS")
+                if page_class.__name__ not in urls or not any(compiled.values()):
+                    continue
+                driver.get(urls[page_class.__name__])
+                for name, css in compiled.items():
+                    if css is None:
+                        continue
+                    xpath = locators[name][1]
+                    if driver.find_elements(By.XPATH, xpath) != driver.find_elements(By.CSS_SELECTOR, css):
+                        print(f"   ⚠️ {page_class.__name__}.{name}: XPath and CSS match different elements")
+                    samples = {'xpath': [], 'css': []}
+                    for _ in range(runs):
+                        for label, locator in (('xpath', (By.XPATH, xpath)), ('css', (By.CSS_SELECTOR, css))):
+                            start = time.perf_counter()
+                            driver.find_elements(*locator)
+                            samples[label].append(time.perf_counter() - start)
+                    xpath_ms, css_ms = driver.execute_script(evaluate, xpath, css, evaluations)
+                    results[f"{page_class.__name__}.{name}"] = {
+                        'css': css,
+                        'xpath_lookup_ms': sorted(samples['xpath'])[runs // 2] * 1000,
+                        'css_lookup_ms': sorted(samples['css'])[runs // 2] * 1000,
+                        'xpath_eval_us': xpath_ms * 1000 / evaluations,
+                        'css_eval_us': css_ms * 1000 / evaluations,
+                    }
+        except Exception as e:
+            print(f"❌ Benchmark could not run - {e}")
+        finally:
+            if driver:
+                driver.quit()
+        
+        for name, result in results.items():
+            print(f"   {name:<40} lookup {result['xpath_lookup_ms']:5.1f} -> {result['css_lookup_ms']:5.1f} ms   "
+                  f"in page {result['xpath_eval_us']:6.1f} -> {result['css_eval_us']:6.1f} µs")
+        if results:
+            xpath_total = sum(result['xpath_eval_us'] for result in results.values())
+            css_total = sum(result['css_eval_us'] for result in results.values())
+            print(f"   In-page evaluation {(xpath_total - css_total) / xpath_total:.0%} faster as CSS")
+        
+        self.results['locator_compiler'] = results
+        return results
+    
+    def show_learned_timeouts(self):
+        """Print the per-locator deadlines learned from earlier runs"""
+        sys.path.insert(0, self.project_root)
+        from config.config import Config
+        from utils.waits import AdaptiveTimeouts
+        
+        table = AdaptiveTimeouts.table()
+        
+        print("\n" + "=" * 80)
+        print("⏱️  LEARNED LOCATOR TIMEOUTS")
+        print("=" * 80)
+        print(f"   History: {Config.TIMEOUT_HISTORY_FILE}")
+        print(f"   Deadline = p99 x {Config.ADAPTIVE_SAFETY_FACTOR}, at least {Config.ADAPTIVE_MIN_TIMEOUT}s, "
+              f"after {Config.ADAPTIVE_MIN_SAMPLES} samples (default {Config.EXPLICIT_WAIT}s)")
+        if not table:
+            print("   No locator timings recorded yet")
+        for key, row in table.items():
+            print(f"   {key:<60} n={row['samples']:<4} p50={row['p50_s']:.2f}s "
+                  f"p99={row['p99_s']:.2f}s -> {row['timeout_s']:.2f}s")
+        
+        self.results['learned_timeouts'] = table
+        return table
+    
     def _print_final_summary(self):
         """Print the final test execution summary"""
         print("\n" + "=" * 80)
@@ -328,6 +669,33 @@ class MasterTestRunner:
                 status = "✅ PASSED" if stats['failed'] == 0 and stats['total'] > 0 else "❌ FAILED"
                 print(f"   {section.upper()}: {status} - {stats['passed']}/{stats['total']} ({stats['success_rate']:.1f}%)")
         
+        wait_savings = self.results.get('wait_savings')
+        if wait_savings:
+            print(f"\n⏳ WAIT SAVINGS VS FIXED SLEEPS:")
+            for section, entry in sorted(wait_savings.items()):
+                print(f"   {section.upper()}: {entry['saved_s']:.1f}s saved over {entry['waits']} waits "
+                      f"({entry['actual_s']:.1f}s waited instead of {entry['baseline_s']:.1f}s)")
+            total_saved = sum(entry['saved_s'] for entry in wait_savings.values())
+            print(f"   TOTAL: {total_saved:.1f}s saved")
+        
+        sleep_profile = self.results.get('sleep_profile')
+        if sleep_profile and sleep_profile['sites']:
+            print(f"\n💤 BIGGEST SLEEP/WAIT HOTSPOTS:")
+            for site, entry in list(sleep_profile['sites'].items())[:10]:
+                print(f"   {entry['total_s']:7.1f}s {entry['kind']:<8} x{entry['calls']:<4} {site}")
+            total_blocked = sum(sum(totals.values()) for totals in sleep_profile['tests'].values())
+            print(f"   TOTAL: {total_blocked:.1f}s blocked across {len(sleep_profile['tests'])} tests "
+                  f"(full ranking in reports/sleep_profile/)")
+        
+        element_cache = self.results.get('element_cache')
+        if element_cache:
+            print(f"\n♻️  ELEMENT CACHE HIT RATE:")
+            for page, entry in sorted(element_cache.items(), key=lambda item: -item[1]['hits']):
+                print(f"   {page}: {entry['hits']}/{entry['lookups']} lookups ({entry['hit_rate']:.0%}), "
+                      f"{entry['stale']} stale handles re-found")
+            saved = sum(entry['hits'] - entry['stale'] for entry in element_cache.values())
+            print(f"   TOTAL: {saved} element finds skipped")
+        
         # Overall result
         if self.results['summary']['failed_tests'] == 0 and self.results['summary']['total_tests'] > 0:
             print(f"\n🎉 ALL TESTS PASSED! 🎉")
@@ -370,6 +738,22 @@ def main():
                        help='Run only allure tests')
     parser.add_argument('--section', choices=['elements', 'forms', 'alerts_frames', 'widgets', 'interactions', 'bookstore'],
                        help='Run specific section only')
+    parser.add_argument('--profile', choices=['default', 'fast', 'fidelity'],
+                       help='Browser launch profile')
+    parser.add_argument('--compare-profiles', action='store_true',
+                       help='Compare startup and page-load time of each launch profile and exit')
+    parser.add_argument('--benchmark-template', action='store_true',
+                       help='Compare browser startup on a fresh vs template profile and exit')
+    parser.add_argument('--benchmark-waits', action='store_true',
+                       help='Compare BasePage wait latency: fixed 500 ms polls vs backoff polling and exit')
+    parser.add_argument('--benchmark-reads', action='store_true',
+                       help='Compare driver round trips of per-element reads vs BasePage.read_many and exit')
+    parser.add_argument('--benchmark-locators', action='store_true',
+                       help='Compare lookup latency of page-object XPath locators vs their compiled CSS and exit')
+    parser.add_argument('--sleep-profile', action='store_true',
+                       help='Rank where the tests block in sleeps and waits')
+    parser.add_argument('--show-timeouts', action='store_true',
+                       help='Print the learned per-locator timeouts and exit')
     parser.add_argument('--verbose', action='store_true',
                        help='Verbose output')
     parser.add_argument('--generate-report', action='store_true',
@@ -384,9 +768,30 @@ def main():
         os.environ['HEADLESS'] = 'true'
     if args.verbose:
         os.environ['VERBOSE'] = 'true'
+    if args.profile:
+        os.environ['BROWSER_PROFILE'] = args.profile
+    if args.sleep_profile:
+        os.environ['SLEEP_PROFILE'] = 'true'
     
     # Create and run master test runner
     runner = MasterTestRunner()
+    
+    if args.show_timeouts:
+        runner.show_learned_timeouts()
+        sys.exit(0)
+    if args.compare_profiles:
+        runner.compare_profiles()
+    if args.benchmark_template:
+        runner.benchmark_profile_template()
+    if args.benchmark_waits:
+        runner.benchmark_wait_strategy()
+    if args.benchmark_reads:
+        runner.benchmark_batched_reads()
+    if args.benchmark_locators:
+        runner.benchmark_locator_compiler()
+    if any((args.compare_profiles, args.benchmark_template, args.benchmark_waits, args.benchmark_reads, args.benchmark_locators)):
+        # Benchmarks report and stop; they never go on to run the suite
+        sys.exit(0)
     success = runner.run_all_tests(
         individual_only=args.individual_only,
         allure_only=args.allure_only,
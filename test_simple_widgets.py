@@ -5,6 +5,7 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from utils.driver_factory import DriverFactory
 
 
 @allure.epic("DemoQA Automation")
@@ -14,24 +15,12 @@ class TestSimpleWidgets:
     
     def setup_method(self):
         """Setup for each test"""
-        from selenium.webdriver.chrome.options import Options
-        chrome_options = Options()
-        
-        if os.environ.get('HEADLESS', '').lower() == 'true':
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        if not os.environ.get('HEADLESS', '').lower() == 'true':
-            self.driver.maximize_window()
     
     def teardown_method(self):
         """Teardown for each test"""
-        self.driver.quit()
+        DriverFactory.release(self.driver)
     
     @allure.story("Accordion")
     @allure.title("Test Accordion Functionality")
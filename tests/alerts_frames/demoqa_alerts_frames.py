@@ -4,15 +4,19 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class DemoQAAlertsFrames:
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_browser_windows(self):
         """Test Browser Windows functionality"""
@@ -25,7 +29,7 @@ class DemoQAAlertsFrames:
 
         # Switch to new tab
         self.driver.switch_to.window(self.driver.window_handles[1])
-        time.sleep(1)
+        self.waits.until(wc.element_visible((By.ID, "sampleHeading")), replaces=1)
 
         # Verify new tab content
         page_text = self.driver.find_element(By.ID, "sampleHeading")
@@ -42,7 +46,7 @@ class DemoQAAlertsFrames:
 
         # Switch to new window
         self.driver.switch_to.window(self.driver.window_handles[1])
-        time.sleep(1)
+        self.waits.until(wc.element_visible((By.ID, "sampleHeading")), replaces=1)
 
         # Verify new window content
         page_text = self.driver.find_element(By.ID, "sampleHeading")
@@ -223,7 +227,7 @@ class DemoQAAlertsFrames:
         except Exception as e:
             print(f"\n❌ Test failed: {str(e)}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
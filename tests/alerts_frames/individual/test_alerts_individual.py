@@ -1,18 +1,21 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.alert import Alert
 import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter
 
 
 class AlertsTest:
     """Individual test for Alerts functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
-        self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.driver = DriverFactory.acquire()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_simple_alert(self):
         """Test simple alert functionality"""
@@ -26,7 +29,7 @@ class AlertsTest:
             print("  ✓ Simple alert button clicked")
             
             # Wait for alert and switch to it
-            alert = self.wait.until(EC.alert_is_present())
+            alert = self.waits.alert()
             alert_text = alert.text
             print(f"  ✓ Alert text: '{alert_text}'")
             
@@ -57,7 +60,7 @@ class AlertsTest:
             
             # Wait for alert to appear (it appears after 5 seconds)
             print("  ⏳ Waiting for timer alert to appear...")
-            alert = self.wait.until(EC.alert_is_present())
+            alert = self.waits.alert(timeout=10)
             alert_text = alert.text
             print(f"  ✓ Timer alert text: '{alert_text}'")
             
@@ -87,7 +90,7 @@ class AlertsTest:
             print("  ✓ Confirm alert button clicked")
             
             # Wait for alert and switch to it
-            alert = self.wait.until(EC.alert_is_present())
+            alert = self.waits.alert()
             alert_text = alert.text
             print(f"  ✓ Confirm alert text: '{alert_text}'")
             
@@ -122,7 +125,7 @@ class AlertsTest:
             print("  ✓ Confirm alert button clicked")
             
             # Wait for alert and switch to it
-            alert = self.wait.until(EC.alert_is_present())
+            alert = self.waits.alert()
             alert_text = alert.text
             print(f"  ✓ Confirm alert text: '{alert_text}'")
             
@@ -157,7 +160,7 @@ class AlertsTest:
             print("  ✓ Prompt alert button clicked")
             
             # Wait for alert and switch to it
-            alert = self.wait.until(EC.alert_is_present())
+            alert = self.waits.alert()
             alert_text = alert.text
             print(f"  ✓ Prompt alert text: '{alert_text}'")
             
@@ -215,7 +218,7 @@ class AlertsTest:
         except Exception as e:
             print(f"❌ Alerts test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
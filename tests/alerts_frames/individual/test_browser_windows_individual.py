@@ -4,17 +4,21 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class BrowserWindowsTest:
     """Individual test for Browser Windows functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_new_tab(self):
         """Test new tab functionality"""
@@ -32,13 +36,7 @@ class BrowserWindowsTest:
             print("  ✓ New tab button clicked")
             
             # Wait for new tab to open and switch to it
-            self.wait.until(EC.number_of_windows_to_be(2))
-            
-            # Loop through all window handles and switch to new tab
-            for window_handle in self.driver.window_handles:
-                if window_handle != original_window:
-                    self.driver.switch_to.window(window_handle)
-                    break
+            self.waits.new_window([original_window])
             
             print(f"  ✓ Switched to new tab: {self.driver.current_window_handle}")
             
@@ -74,13 +72,7 @@ class BrowserWindowsTest:
             print("  ✓ New window button clicked")
             
             # Wait for new window to open and switch to it
-            self.wait.until(EC.number_of_windows_to_be(2))
-            
-            # Loop through all window handles and switch to new window
-            for window_handle in self.driver.window_handles:
-                if window_handle != original_window:
-                    self.driver.switch_to.window(window_handle)
-                    break
+            self.waits.new_window([original_window])
             
             print(f"  ✓ Switched to new window: {self.driver.current_window_handle}")
             
@@ -116,14 +108,8 @@ class BrowserWindowsTest:
             print("  ✓ New window message button clicked")
             
             # Wait for new window to open and switch to it
-            self.wait.until(EC.number_of_windows_to_be(2))
-            time.sleep(2)  # Give some time for the window to fully load
-            
-            # Loop through all window handles and switch to new window
-            for window_handle in self.driver.window_handles:
-                if window_handle != original_window:
-                    self.driver.switch_to.window(window_handle)
-                    break
+            self.waits.new_window([original_window])
+            self.waits.until(wc.page_ready(), replaces=2)  # New window finished loading
             
             print(f"  ✓ Switched to new window message: {self.driver.current_window_handle}")
             
@@ -176,7 +162,7 @@ class BrowserWindowsTest:
         except Exception as e:
             print(f"❌ Browser Windows test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -3,15 +3,19 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
 
 
 class FramesTest:
     """Individual test for Frames functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
 
     def test_frame1(self):
         """Test frame1 functionality"""
@@ -190,7 +194,7 @@ class FramesTest:
         except Exception as e:
             print(f"❌ Frames test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
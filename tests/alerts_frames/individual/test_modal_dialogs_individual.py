@@ -1,18 +1,20 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import DomObserver
 
 
 class ModalDialogsTest:
     """Individual test for Modal Dialogs functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
-        self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.driver = DriverFactory.acquire()
+        self.dom = DomObserver(self.driver, timeout=10)
 
     def test_small_modal(self):
         """Test small modal functionality"""
@@ -26,7 +28,7 @@ class ModalDialogsTest:
             print("  ✓ Small modal button clicked")
             
             # Wait for modal to appear
-            modal = self.wait.until(EC.visibility_of_element_located((By.CLASS_NAME, "modal-content")))
+            modal = self.dom.visible((By.CLASS_NAME, "modal-content"))
             print("  ✓ Small modal appeared")
             
             # Verify modal title
@@ -47,7 +49,7 @@ class ModalDialogsTest:
             print("  ✓ Modal closed using close button")
             
             # Wait for modal to disappear
-            self.wait.until(EC.invisibility_of_element_located((By.CLASS_NAME, "modal-content")))
+            self.dom.gone((By.CLASS_NAME, "modal-content"))
             print("  ✓ Modal disappeared")
             
             print("✅ Small modal test PASSED")
@@ -75,7 +77,7 @@ class ModalDialogsTest:
             print("  ✓ Large modal button clicked")
             
             # Wait for modal to appear
-            modal = self.wait.until(EC.visibility_of_element_located((By.CLASS_NAME, "modal-content")))
+            modal = self.dom.visible((By.CLASS_NAME, "modal-content"))
             print("  ✓ Large modal appeared")
             
             # Verify modal title
@@ -96,7 +98,7 @@ class ModalDialogsTest:
             print("  ✓ Modal closed using close button")
             
             # Wait for modal to disappear
-            self.wait.until(EC.invisibility_of_element_located((By.CLASS_NAME, "modal-content")))
+            self.dom.gone((By.CLASS_NAME, "modal-content"))
             print("  ✓ Modal disappeared")
             
             print("✅ Large modal test PASSED")
@@ -124,7 +126,7 @@ class ModalDialogsTest:
             print("  ✓ Small modal opened")
             
             # Wait for modal to appear
-            self.wait.until(EC.visibility_of_element_located((By.CLASS_NAME, "modal-content")))
+            self.dom.visible((By.CLASS_NAME, "modal-content"))
             
             # Close modal using X button
             x_button = self.driver.find_element(By.CSS_SELECTOR, ".modal-header .close")
@@ -132,7 +134,7 @@ class ModalDialogsTest:
             print("  ✓ Modal closed using X button")
             
             # Wait for modal to disappear
-            self.wait.until(EC.invisibility_of_element_located((By.CLASS_NAME, "modal-content")))
+            self.dom.gone((By.CLASS_NAME, "modal-content"))
             print("  ✓ Modal disappeared")
             
             print("✅ Modal close with X test PASSED")
@@ -159,14 +161,14 @@ class ModalDialogsTest:
             print("  ✓ Small modal opened")
             
             # Wait for modal to appear
-            modal = self.wait.until(EC.visibility_of_element_located((By.CLASS_NAME, "modal-content")))
+            modal = self.dom.visible((By.CLASS_NAME, "modal-content"))
             
             # Press Escape key to close modal (send to body element instead)
             self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
             print("  ✓ Escape key pressed")
             
             # Wait for modal to disappear
-            self.wait.until(EC.invisibility_of_element_located((By.CLASS_NAME, "modal-content")))
+            self.dom.gone((By.CLASS_NAME, "modal-content"))
             print("  ✓ Modal closed with Escape key")
             
             print("✅ Modal close with Escape test PASSED")
@@ -194,7 +196,7 @@ class ModalDialogsTest:
             print("  ✓ Small modal opened")
             
             # Wait for modal to appear
-            self.wait.until(EC.visibility_of_element_located((By.CLASS_NAME, "modal-content")))
+            self.dom.visible((By.CLASS_NAME, "modal-content"))
             
             # Try to click on backdrop (outside modal content)
             try:
@@ -204,7 +206,7 @@ class ModalDialogsTest:
                 print("  ✓ Clicked on modal backdrop")
                 
                 # Check if modal is still visible (some modals don't close on backdrop click)
-                time.sleep(1)
+                self.dom.gone((By.CLASS_NAME, "modal-content"), timeout=1, replaces=1, required=False)
                 try:
                     modal_content = self.driver.find_element(By.CLASS_NAME, "modal-content")
                     if modal_content.is_displayed():
@@ -224,7 +226,7 @@ class ModalDialogsTest:
                 close_btn.click()
             
             # Wait for modal to disappear
-            self.wait.until(EC.invisibility_of_element_located((By.CLASS_NAME, "modal-content")))
+            self.dom.gone((By.CLASS_NAME, "modal-content"))
             print("  ✓ Modal is closed")
             
             print("✅ Modal backdrop click test PASSED")
@@ -270,7 +272,7 @@ class ModalDialogsTest:
         except Exception as e:
             print(f"❌ Modal Dialogs test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -3,15 +3,20 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.dom_snapshot import DomSnapshot
+from utils.driver_factory import DriverFactory
 
 
 class NestedFramesTest:
     """Individual test for Nested Frames functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
 
     def test_parent_frame(self):
         """Test parent frame functionality"""
@@ -184,7 +189,7 @@ class NestedFramesTest:
             if parent_frames:
                 # Switch to parent frame and check for child frames
                 self.driver.switch_to.frame(parent_frames[0])
-                child_frames = self.driver.find_elements(By.TAG_NAME, "iframe")
+                child_frames = DomSnapshot.take(self.driver).find_elements(By.TAG_NAME, "iframe")
                 print(f"  ✓ Found {len(child_frames)} child frame(s) in parent frame")
                 
                 # Check frame attributes
@@ -238,7 +243,7 @@ class NestedFramesTest:
         except Exception as e:
             print(f"❌ Nested Frames test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -15,13 +15,11 @@ class TestAlertsFramesWindows:
     """Allure test suite for Alerts, Frames & Windows functionality"""
 
     @pytest.fixture(autouse=True)
-    def setup_method(self):
+    def setup_method(self, driver):
         """Setup method to initialize WebDriver"""
-        self.driver = webdriver.Chrome()
+        self.driver = driver
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
         yield
-        self.driver.quit()
 
     @allure.story("Browser Windows")
     @allure.title("Test New Tab Functionality")
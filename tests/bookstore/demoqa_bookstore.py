@@ -4,17 +4,21 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
 import os
 import random
 import string
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class DemoQABookStore:
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
         self.username = None
         self.password = None
 
@@ -81,7 +85,7 @@ class DemoQABookStore:
         # Test search functionality
         search_box = self.driver.find_element(By.ID, "searchBox")
         search_box.send_keys("Git")
-        time.sleep(2)
+        self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=2)
 
         # Check filtered results
         filtered_books = self.driver.find_elements(By.CSS_SELECTOR, ".rt-tr-group")
@@ -92,7 +96,7 @@ class DemoQABookStore:
         # Clear search
         search_box.clear()
         search_box.send_keys(Keys.ENTER)
-        time.sleep(1)
+        self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=1)
 
         # Test clicking on a book
         try:
@@ -101,7 +105,7 @@ class DemoQABookStore:
             print(f"  Clicking on book: {book_title}")
             
             first_book_link.click()
-            time.sleep(2)
+            self.waits.until(wc.url_changed("https://demoqa.com/books"), replaces=2)
             
             # Verify we're on book details page
             assert "/books" in self.driver.current_url
@@ -109,7 +113,7 @@ class DemoQABookStore:
             
             # Go back to book store
             self.driver.back()
-            time.sleep(1)
+            self.waits.until(wc.element_visible((By.CSS_SELECTOR, ".rt-tbody .rt-td a")), replaces=1)
             
         except Exception as e:
             print(f"  Book click test skipped: {e}")
@@ -122,7 +126,7 @@ class DemoQABookStore:
         self.driver.get("https://demoqa.com/books")
 
         # Wait for page to load
-        time.sleep(2)
+        self.waits.until(wc.element_visible((By.CSS_SELECTOR, ".rt-tbody .rt-td a")), replaces=2)
 
         # Test rows per page dropdown
         try:
@@ -132,7 +136,7 @@ class DemoQABookStore:
             # Select 5 rows per page
             option_5 = self.driver.find_element(By.XPATH, "//option[@value='5']")
             option_5.click()
-            time.sleep(2)
+            self.waits.until(wc.element_count((By.CSS_SELECTOR, ".rt-tr-group"), lambda n: n == 5), replaces=2)
             
             print("  ✓ Rows per page changed to 5")
             
@@ -141,14 +145,14 @@ class DemoQABookStore:
                 next_btn = self.driver.find_element(By.CSS_SELECTOR, ".-next button")
                 if next_btn.is_enabled():
                     next_btn.click()
-                    time.sleep(1)
+                    self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=1)
                     print("  ✓ Next page button clicked")
                     
                     # Go back to first page
                     prev_btn = self.driver.find_element(By.CSS_SELECTOR, ".-previous button")
                     if prev_btn.is_enabled():
                         prev_btn.click()
-                        time.sleep(1)
+                        self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=1)
                         print("  ✓ Previous page button clicked")
                         
             except Exception as e:
@@ -172,7 +176,7 @@ class DemoQABookStore:
             # Test login button
             login_btn = self.driver.find_element(By.ID, "login")
             login_btn.click()
-            time.sleep(2)
+            self.waits.until(wc.url_changed("https://demoqa.com/profile"), replaces=2)
             
             assert "/login" in self.driver.current_url
             print("  ✓ Redirected to login page")
@@ -214,7 +218,7 @@ class DemoQABookStore:
         
         # Go to a specific book (using direct URL)
         self.driver.get("https://demoqa.com/books?book=9781449325862")
-        time.sleep(2)
+        self.waits.settle(wc.element_visible((By.ID, "ISBN-wrapper")), 2)
         
         try:
             # Check if book details are displayed
@@ -261,7 +265,7 @@ class DemoQABookStore:
         except Exception as e:
             print(f"\n❌ Test failed: {str(e)}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
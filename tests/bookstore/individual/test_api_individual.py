@@ -3,18 +3,24 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-import time
 import requests
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import NetworkMonitor, Waiter, conditions as wc
 
 
 class APITest:
     """Individual test for Book Store API functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        # Most checks only use requests; the browser starts on first use
+        self.driver = DriverFactory.lazy()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
         self.base_api_url = "https://demoqa.com"
 
     def test_api_documentation_access(self):
@@ -32,7 +38,7 @@ class APITest:
             for url in api_docs_urls:
                 try:
                     self.driver.get(url)
-                    time.sleep(3)
+                    self.waits.until(wc.page_ready(), replaces=3)
                     
                     current_url = self.driver.current_url
                     page_title = self.driver.title
@@ -66,19 +72,18 @@ class APITest:
         try:
             # Check network requests when using the book store
             self.driver.get("https://demoqa.com/books")
-            time.sleep(3)
+            self.waits.settle(wc.element_visible((By.CSS_SELECTOR, ".rt-tbody .rt-td a")), 3)
             
-            # Try to enable browser logs to capture network requests
+            # Rows render from the books response, so it is in the performance log by now
             try:
-                logs = self.driver.get_log('performance')
-                api_requests = []
-                
-                for log in logs:
-                    message = json.loads(log['message'])
-                    if message['message']['method'] == 'Network.responseReceived':
-                        url = message['message']['params']['response']['url']
-                        if 'api' in url.lower() or 'bookstore' in url.lower():
-                            api_requests.append(url)
+                monitor = NetworkMonitor.for_driver(self.driver)
+                monitor.poll()
+                if not monitor.available:
+                    raise RuntimeError("performance log is not enabled for this browser")
+                api_requests = [
+                    url for url in monitor.responses
+                    if 'api' in url.lower() or 'bookstore' in url.lower()
+                ]
                 
                 if api_requests:
                     print(f"  ✓ Found {len(api_requests)} potential API requests:")
@@ -301,7 +306,7 @@ class APITest:
         except Exception as e:
             print(f"❌ API test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -4,43 +4,28 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.chrome.options import Options
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class AuthenticationTest:
     """Individual test for Book Store Authentication functionality"""
     
     def __init__(self):
-        # Configure Chrome options to block ads but keep JavaScript enabled
-        chrome_options = Options()
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values": {
-                "notifications": 2,
-                "media_stream": 2,
-                "ads": 2,
-                "popups": 2
-            }
-        })
-        # Add ad blocker rules
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 15)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=15)
         
     def safe_click(self, element):
         """Safely click an element, handling overlays"""
         try:
             # Scroll element into view
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.5)
+            self.waits.until(wc.element_stable(element), replaces=0.5)
             
             # Try normal click first
             element.click()
@@ -71,7 +56,7 @@ class AuthenticationTest:
         """Remove ad elements that might interfere with testing"""
         try:
             # Wait for page to load completely
-            time.sleep(2)
+            self.waits.until(wc.page_ready(), replaces=2)
             
             # Remove Google ads iframes and containers
             self.driver.execute_script("""
@@ -100,7 +85,6 @@ class AuthenticationTest:
                     }
                 }
             """)
-            time.sleep(1)
         except Exception as e:
             print(f"  ⚠️ Ad removal had issues: {e}")
             pass
@@ -112,11 +96,11 @@ class AuthenticationTest:
         try:
             # Start from books page
             self.driver.get("https://demoqa.com/books")
-            time.sleep(2)
+            self.waits.until(wc.element_visible((By.CSS_SELECTOR, ".rt-table, .ReactTable")), replaces=2)
             
             # Try to access a protected area (profile)
             self.driver.get("https://demoqa.com/profile")
-            time.sleep(3)
+            self.waits.until(wc.page_ready(), replaces=3)
             
             current_url = self.driver.current_url
             
@@ -149,7 +133,7 @@ class AuthenticationTest:
         
         try:
             self.driver.get("https://demoqa.com/login")
-            time.sleep(3)  # Wait for page to load
+            self.waits.until(wc.element_visible((By.ID, "login")), replaces=3)
             self.remove_ads()  # Remove interfering ads
             
             # Test empty form submission
@@ -159,7 +143,7 @@ class AuthenticationTest:
             else:
                 print("  ⚠️ Login button click had issues, but continuing test")
             
-            time.sleep(2)
+            self.waits.settle(wc.attribute_contains((By.ID, "userName"), "class", "is-invalid"), 2)
             
             # Check if still on login page (validation should prevent submission)
             current_url = self.driver.current_url
@@ -178,7 +162,7 @@ class AuthenticationTest:
             else:
                 print("  ⚠️ Login button click had issues, but continuing test")
             
-            time.sleep(2)
+            self.waits.settle(wc.attribute_contains((By.ID, "password"), "class", "is-invalid"), 2)
             
             # Should still be on login page
             current_url = self.driver.current_url
@@ -196,7 +180,7 @@ class AuthenticationTest:
             else:
                 print("  ⚠️ Login button click had issues, but continuing test")
             
-            time.sleep(2)
+            self.waits.settle(wc.attribute_contains((By.ID, "userName"), "class", "is-invalid"), 2)
             
             print("✅ Login form validation test PASSED")
             return True
@@ -211,7 +195,7 @@ class AuthenticationTest:
         
         try:
             self.driver.get("https://demoqa.com/login")
-            time.sleep(3)  # Wait for page to load
+            self.waits.until(wc.element_visible((By.ID, "login")), replaces=3)
             self.remove_ads()  # Remove interfering ads
             
             # Enter invalid credentials
@@ -231,7 +215,9 @@ class AuthenticationTest:
             else:
                 print("  ⚠️ Login button click had issues, but continuing test")
             
-            time.sleep(3)
+            self.waits.settle(
+                wc.any_of(wc.element_visible((By.ID, "name")), wc.url_changed("https://demoqa.com/login")), 3
+            )
             
             # Check for error message or remaining on login page
             current_url = self.driver.current_url
@@ -272,7 +258,7 @@ class AuthenticationTest:
         try:
             # Start from login page
             self.driver.get("https://demoqa.com/login")
-            time.sleep(2)
+            self.waits.until(wc.element_visible((By.ID, "login")), replaces=2)
             
             # Navigate to different pages and check authentication state
             test_pages = [
@@ -283,7 +269,7 @@ class AuthenticationTest:
             
             for page in test_pages:
                 self.driver.get(page)
-                time.sleep(2)
+                self.waits.until(wc.page_ready(), replaces=2)
                 
                 current_url = self.driver.current_url
                 print(f"  ✓ Navigated to: {page}")
@@ -322,7 +308,7 @@ class AuthenticationTest:
         try:
             # Start from books page
             self.driver.get("https://demoqa.com/books")
-            time.sleep(2)
+            self.waits.until(wc.element_visible((By.CSS_SELECTOR, ".rt-table, .ReactTable")), replaces=2)
             
             # Look for logout button
             try:
@@ -338,10 +324,11 @@ class AuthenticationTest:
                     
                     if logout_btn:
                         print("  ✓ Logout button found")
+                        url_before_logout = self.driver.current_url
                         logout_btn.click()
                         print("  ✓ Logout button clicked")
                         
-                        time.sleep(2)
+                        self.waits.settle(wc.url_changed(url_before_logout), 2)
                         
                         # Check if redirected or state changed
                         current_url = self.driver.current_url
@@ -349,7 +336,7 @@ class AuthenticationTest:
                         
                         # Try to access protected area
                         self.driver.get("https://demoqa.com/profile")
-                        time.sleep(2)
+                        self.waits.until(wc.page_ready(), replaces=2)
                         
                         final_url = self.driver.current_url
                         if "login" in final_url:
@@ -387,7 +374,7 @@ class AuthenticationTest:
             for route in protected_routes:
                 try:
                     self.driver.get(route)
-                    time.sleep(3)
+                    self.waits.until(wc.page_ready(), replaces=3)
                     
                     current_url = self.driver.current_url
                     print(f"  ✓ Attempted to access: {route}")
@@ -441,7 +428,7 @@ class AuthenticationTest:
         except Exception as e:
             print(f"❌ Authentication test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
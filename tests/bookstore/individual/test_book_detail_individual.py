@@ -3,16 +3,21 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class BookDetailTest:
     """Individual test for Book Store Book Detail functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_book_detail_page_access(self):
         """Test accessing book detail page"""
@@ -23,7 +28,7 @@ class BookDetailTest:
         
         try:
             # Wait for page to load
-            time.sleep(3)
+            self.waits.settle(wc.element_visible((By.CSS_SELECTOR, "a[href*='/books?book=']")), 3)
             
             # Try to find and click on a book
             try:
@@ -38,7 +43,7 @@ class BookDetailTest:
                     print("  ✓ Book link clicked")
                     
                     # Wait for navigation
-                    time.sleep(3)
+                    self.waits.settle(wc.url_changed("https://demoqa.com/books"), 3)
                     
                     # Check if we're on book detail page
                     current_url = self.driver.current_url
@@ -53,7 +58,7 @@ class BookDetailTest:
                     print("  ⚠️ No book links found, trying direct URL")
                     # Try a direct book detail URL
                     self.driver.get("https://demoqa.com/books?book=9781449325862")
-                    time.sleep(2)
+                    self.waits.settle(wc.element_visible((By.ID, "ISBN-wrapper")), 2)
                     print("  ✓ Accessed book detail via direct URL")
                     return True
                     
@@ -74,7 +79,7 @@ class BookDetailTest:
         
         try:
             # Wait for page to load
-            time.sleep(3)
+            self.waits.settle(wc.element_visible((By.ID, "ISBN-wrapper")), 3)
             
             # Check for book title/heading
             try:
@@ -132,7 +137,7 @@ class BookDetailTest:
         
         try:
             # Wait for page to load
-            time.sleep(3)
+            self.waits.settle(wc.element_visible((By.ID, "ISBN-wrapper")), 3)
             
             # Check page content
             page_text = self.driver.page_source
@@ -177,7 +182,7 @@ class BookDetailTest:
         
         try:
             # Wait for page to load
-            time.sleep(3)
+            self.waits.settle(wc.element_visible((By.ID, "ISBN-wrapper")), 3)
             
             # Try to navigate back to book store
             try:
@@ -191,7 +196,7 @@ class BookDetailTest:
                     print("  ✓ Back navigation clicked")
                     
                     # Wait for navigation
-                    time.sleep(2)
+                    self.waits.settle(wc.url_changed("https://demoqa.com/books?book=9781449325862"), 2)
                     
                     current_url = self.driver.current_url
                     if "books" in current_url and "book=" not in current_url:
@@ -230,7 +235,7 @@ class BookDetailTest:
             for url in test_urls:
                 try:
                     self.driver.get(url)
-                    time.sleep(2)
+                    self.waits.settle(wc.element_visible((By.ID, "ISBN-wrapper")), 2)
                     
                     current_url = self.driver.current_url
                     print(f"  ✓ Accessed: {url}")
@@ -282,7 +287,7 @@ class BookDetailTest:
         except Exception as e:
             print(f"❌ Book Detail test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -3,16 +3,21 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class BookStoreTest:
     """Individual test for Book Store functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_book_store_page_elements(self):
         """Test book store page elements are present"""
@@ -62,7 +67,7 @@ class BookStoreTest:
             print(f"  ✓ Search term entered: '{search_term}'")
             
             # Wait a moment for search to process
-            time.sleep(2)
+            self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=2)
             
             # Check if results are filtered
             try:
@@ -92,8 +97,8 @@ class BookStoreTest:
         self.driver.get("https://demoqa.com/books")
 
         try:
-            # Wait for page to load
-            time.sleep(3)
+            # Wait for the book rows to render
+            self.waits.settle(wc.element_visible((By.CSS_SELECTOR, ".rt-tbody .rt-td a")), 3)
             
             # Check for book rows
             try:
@@ -136,7 +141,7 @@ class BookStoreTest:
 
         try:
             # Wait for page to load
-            time.sleep(3)
+            self.waits.settle(wc.element_visible((By.CSS_SELECTOR, ".rt-tbody .rt-td a")), 3)
             
             # Try to find and click on a book title
             try:
@@ -151,7 +156,7 @@ class BookStoreTest:
                     print("  ✓ Book link clicked")
                     
                     # Wait for navigation
-                    time.sleep(2)
+                    self.waits.settle(wc.url_changed("https://demoqa.com/books"), 2)
                     
                     # Check if we navigated to book details
                     current_url = self.driver.current_url
@@ -180,7 +185,7 @@ class BookStoreTest:
 
         try:
             # Wait for page to load
-            time.sleep(3)
+            self.waits.settle(wc.element_visible((By.CSS_SELECTOR, ".rt-tbody .rt-td a")), 3)
             
             # Look for rows per page selector
             try:
@@ -197,7 +202,7 @@ class BookStoreTest:
                     if len(options) > 1:
                         options[1].click()
                         print("  ✓ Changed rows per page selection")
-                        time.sleep(2)
+                        self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=2)
                     
                 else:
                     print("  ⚠️ Rows per page selector not visible")
@@ -242,7 +247,7 @@ class BookStoreTest:
         except Exception as e:
             print(f"❌ Book Store test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
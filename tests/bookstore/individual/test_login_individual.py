@@ -4,43 +4,28 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.chrome.options import Options
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class LoginTest:
     """Individual test for Book Store Login functionality"""
     
     def __init__(self):
-        # Configure Chrome options to block ads but keep JavaScript enabled
-        chrome_options = Options()
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values": {
-                "notifications": 2,
-                "media_stream": 2,
-                "ads": 2,
-                "popups": 2
-            }
-        })
-        # Add ad blocker rules
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 15)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=15)
         
     def safe_click(self, element):
         """Safely click an element, handling overlays"""
         try:
             # Scroll element into view
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.5)
+            self.waits.until(wc.element_stable(element), replaces=0.5)
             
             # Try normal click first
             element.click()
@@ -71,7 +56,7 @@ class LoginTest:
         """Remove ad elements that might interfere with testing"""
         try:
             # Wait for page to load completely
-            time.sleep(2)
+            self.waits.until(wc.page_ready(), replaces=2)
             
             # Remove Google ads iframes and containers
             self.driver.execute_script("""
@@ -100,7 +85,6 @@ class LoginTest:
                     }
                 }
             """)
-            time.sleep(1)
         except Exception as e:
             print(f"  ⚠️ Ad removal had issues: {e}")
             pass
@@ -142,7 +126,7 @@ class LoginTest:
         """Test login with invalid credentials"""
         print("\n🔧 Testing Book Store Login - Invalid Credentials...")
         self.driver.get("https://demoqa.com/login")
-        time.sleep(3)  # Wait for page to load
+        self.waits.settle(wc.element_visible((By.ID, "login")), 3)
         self.remove_ads()  # Remove interfering ads
 
         try:
@@ -165,7 +149,9 @@ class LoginTest:
                 print("  ⚠️ Login button click had issues, but continuing test")
             
             # Wait for error message or check if still on login page
-            time.sleep(2)
+            self.waits.settle(
+                wc.any_of(wc.element_visible((By.ID, "name")), wc.url_changed("https://demoqa.com/login")), 2
+            )
             current_url = self.driver.current_url
             
             # Should still be on login page or show error
@@ -185,7 +171,7 @@ class LoginTest:
         """Test validation with empty fields"""
         print("\n🔧 Testing Book Store Login - Empty Fields Validation...")
         self.driver.get("https://demoqa.com/login")
-        time.sleep(3)  # Wait for page to load
+        self.waits.settle(wc.element_visible((By.ID, "login")), 3)
         self.remove_ads()  # Remove interfering ads
 
         try:
@@ -204,7 +190,7 @@ class LoginTest:
                 print("  ⚠️ Login button click had issues, but continuing test")
             
             # Check for validation (fields should be highlighted or error shown)
-            time.sleep(1)
+            self.waits.settle(wc.attribute_contains(username_field, "class", "is-invalid"), 1)
             
             # Check if fields have validation styling
             username_class = username_field.get_attribute("class")
@@ -224,7 +210,7 @@ class LoginTest:
         """Test navigation to new user registration"""
         print("\n🔧 Testing Book Store Login - New User Navigation...")
         self.driver.get("https://demoqa.com/login")
-        time.sleep(3)  # Wait for page to load
+        self.waits.settle(wc.element_visible((By.ID, "login")), 3)
         self.remove_ads()  # Remove interfering ads
 
         try:
@@ -281,7 +267,7 @@ class LoginTest:
         except Exception as e:
             print(f"❌ Login test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -3,16 +3,22 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.dom_snapshot import DomSnapshot
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class ProfileTest:
     """Individual test for Book Store Profile functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_profile_page_access(self):
         """Test profile page access and elements"""
@@ -21,7 +27,7 @@ class ProfileTest:
 
         try:
             # Check if redirected to login (not logged in)
-            time.sleep(2)
+            self.waits.until(wc.page_ready(), replaces=2)
             current_url = self.driver.current_url
             
             if "login" in current_url:
@@ -68,7 +74,7 @@ class ProfileTest:
                     print("  ✓ Profile link clicked from menu")
                     
                     # Wait for navigation
-                    time.sleep(2)
+                    self.waits.settle(wc.url_changed("https://demoqa.com/books"), 2)
                     current_url = self.driver.current_url
                     
                     if "profile" in current_url or "login" in current_url:
@@ -99,7 +105,7 @@ class ProfileTest:
 
         try:
             # Wait for page to load
-            time.sleep(3)
+            self.waits.until(wc.page_ready(), replaces=3)
             current_url = self.driver.current_url
             
             if "login" in current_url:
@@ -139,15 +145,16 @@ class ProfileTest:
 
         try:
             # Wait for page to load
-            time.sleep(3)
+            self.waits.until(wc.page_ready(), replaces=3)
+            snapshot = DomSnapshot.take(self.driver)
             
             # Check page title
-            page_title = self.driver.title
+            page_title = snapshot.title
             print(f"  ✓ Page title: '{page_title}'")
             
             # Check for main content area
             try:
-                main_content = self.driver.find_element(By.ID, "app")
+                main_content = snapshot.find_element(By.ID, "app")
                 assert main_content.is_displayed()
                 print("  ✓ Main content area found")
             except:
@@ -155,14 +162,14 @@ class ProfileTest:
             
             # Check for header/navigation
             try:
-                header = self.driver.find_element(By.CSS_SELECTOR, "header, .header, .main-header")
+                header = snapshot.find_element(By.CSS_SELECTOR, "header, .header, .main-header")
                 if header.is_displayed():
                     print("  ✓ Header/navigation found")
             except:
                 print("  ✓ No specific header found (may be integrated)")
             
             # Check current URL structure
-            current_url = self.driver.current_url
+            current_url = snapshot.url
             print(f"  ✓ Current URL: {current_url}")
             
             print("✅ Profile page structure test PASSED")
@@ -179,7 +186,7 @@ class ProfileTest:
 
         try:
             # Wait for page to load
-            time.sleep(3)
+            self.waits.until(wc.page_ready(), replaces=3)
             current_url = self.driver.current_url
             
             if "login" in current_url:
@@ -250,7 +257,7 @@ class ProfileTest:
         except Exception as e:
             print(f"❌ Profile test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -4,45 +4,30 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.chrome.options import Options
-import time
 import random
 import string
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class RegisterTest:
     """Individual test for Book Store Register functionality"""
     
     def __init__(self):
-        # Configure Chrome options to block ads but keep JavaScript enabled
-        chrome_options = Options()
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values": {
-                "notifications": 2,
-                "media_stream": 2,
-                "ads": 2,
-                "popups": 2
-            }
-        })
-        # Add ad blocker rules
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 15)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=15)
         
     def safe_click(self, element):
         """Safely click an element, handling overlays"""
         try:
             # Scroll element into view
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.5)
+            self.waits.until(wc.element_stable(element), replaces=0.5)
             
             # Try normal click first
             element.click()
@@ -73,7 +58,7 @@ class RegisterTest:
         """Remove ad elements that might interfere with testing"""
         try:
             # Wait for page to load completely
-            time.sleep(2)
+            self.waits.until(wc.page_ready(), replaces=2)
             
             # Remove Google ads iframes and containers
             self.driver.execute_script("""
@@ -102,7 +87,6 @@ class RegisterTest:
                     }
                 }
             """)
-            time.sleep(1)
         except Exception as e:
             print(f"  ⚠️ Ad removal had issues: {e}")
             pass
@@ -171,7 +155,7 @@ class RegisterTest:
         """Test validation with empty fields"""
         print("\n🔧 Testing Book Store Register - Empty Fields Validation...")
         self.driver.get("https://demoqa.com/register")
-        time.sleep(3)  # Wait for page to load
+        self.waits.settle(wc.element_visible((By.ID, "register")), 3)
         self.remove_ads()  # Remove interfering ads
 
         try:
@@ -196,7 +180,7 @@ class RegisterTest:
                 print("  ⚠️ Register button click had issues, but continuing test")
             
             # Check for validation styling
-            time.sleep(1)
+            self.waits.settle(wc.attribute_contains(first_name_field, "class", "is-invalid"), 1)
             
             # Check if fields have validation classes
             first_name_class = first_name_field.get_attribute("class")
@@ -213,7 +197,7 @@ class RegisterTest:
         """Test password requirements validation"""
         print("\n🔧 Testing Book Store Register - Password Requirements...")
         self.driver.get("https://demoqa.com/register")
-        time.sleep(3)  # Wait for page to load
+        self.waits.settle(wc.element_visible((By.ID, "register")), 3)
         self.remove_ads()  # Remove interfering ads
 
         try:
@@ -245,7 +229,9 @@ class RegisterTest:
             else:
                 print("  ⚠️ Register button click had issues, but continuing test")
             
-            time.sleep(2)
+            self.waits.settle(
+                wc.any_of(wc.element_visible((By.ID, "name")), wc.url_changed("https://demoqa.com/register")), 2
+            )
             
             # Check if still on register page (validation should prevent registration)
             current_url = self.driver.current_url
@@ -263,7 +249,7 @@ class RegisterTest:
         """Test navigation back to login page"""
         print("\n🔧 Testing Book Store Register - Back to Login Navigation...")
         self.driver.get("https://demoqa.com/register")
-        time.sleep(3)  # Wait for page to load
+        self.waits.settle(wc.element_visible((By.ID, "register")), 3)
         self.remove_ads()  # Remove interfering ads
 
         try:
@@ -365,7 +351,7 @@ class RegisterTest:
         except Exception as e:
             print(f"❌ Register test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -5,7 +5,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-import time
+from utils.waits import Waiter, conditions as wc
 import random
 import string
 
@@ -16,13 +16,12 @@ class TestBookStoreApplication:
     """Allure test suite for Book Store Application functionality"""
 
     @pytest.fixture(autouse=True)
-    def setup_method(self):
+    def setup_method(self, driver):
         """Setup method to initialize WebDriver"""
-        self.driver = webdriver.Chrome()
+        self.driver = driver
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
         yield
-        self.driver.quit()
 
     def generate_random_user(self):
         """Generate random user data for testing"""
@@ -83,7 +82,9 @@ class TestBookStoreApplication:
             login_btn.click()
             
         with allure.step("Verify login failure handling"):
-            time.sleep(2)
+            self.waits.settle(
+                wc.any_of(wc.element_visible((By.ID, "name")), wc.url_changed("https://demoqa.com/login")), 2
+            )
             current_url = self.driver.current_url
             assert "login" in current_url
             allure.attach(current_url, "Current URL", allure.attachment_type.TEXT)
@@ -186,7 +187,7 @@ class TestBookStoreApplication:
             allure.attach(search_term, "Search Term", allure.attachment_type.TEXT)
             
         with allure.step("Wait for search results"):
-            time.sleep(2)
+            self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=2)
             
         with allure.step("Verify search results"):
             try:
@@ -205,7 +206,7 @@ class TestBookStoreApplication:
             self.driver.get("https://demoqa.com/profile")
             
         with allure.step("Check authentication redirect"):
-            time.sleep(2)
+            self.waits.until(wc.page_ready(), replaces=2)
             current_url = self.driver.current_url
             allure.attach(current_url, "Current URL", allure.attachment_type.TEXT)
             
@@ -230,7 +231,7 @@ class TestBookStoreApplication:
             self.driver.get("https://demoqa.com/books")
             
         with allure.step("Find and click on a book"):
-            time.sleep(3)
+            self.waits.until(wc.element_visible((By.CSS_SELECTOR, "a[href*='/books?book=']")), replaces=3)
             try:
                 book_links = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/books?book=']")
                 if book_links:
@@ -240,7 +241,7 @@ class TestBookStoreApplication:
                     
                     first_book_link.click()
                     
-                    time.sleep(3)
+                    self.waits.until(wc.url_changed("https://demoqa.com/books"), replaces=3)
                     current_url = self.driver.current_url
                     allure.attach(current_url, "Book Detail URL", allure.attachment_type.TEXT)
                     
@@ -260,7 +261,7 @@ class TestBookStoreApplication:
     def test_authentication_flow(self):
         with allure.step("Test protected route access without authentication"):
             self.driver.get("https://demoqa.com/profile")
-            time.sleep(3)
+            self.waits.until(wc.page_ready(), replaces=3)
             
             current_url = self.driver.current_url
             allure.attach(current_url, "Redirect URL", allure.attachment_type.TEXT)
@@ -276,7 +277,7 @@ class TestBookStoreApplication:
                 login_btn = self.driver.find_element(By.ID, "login")
                 login_btn.click()
                 
-                time.sleep(2)
+                self.waits.settle(wc.attribute_contains((By.ID, "userName"), "class", "is-invalid"), 2)
                 
                 # Should still be on login page
                 current_url = self.driver.current_url
@@ -290,7 +291,7 @@ class TestBookStoreApplication:
     def test_api_endpoint_accessibility(self):
         with allure.step("Test Books API endpoint discovery"):
             self.driver.get("https://demoqa.com/books")
-            time.sleep(3)
+            self.waits.until(wc.element_visible((By.CSS_SELECTOR, "a[href*='/books?book=']")), replaces=3)
             
             # Check for potential API calls in network logs
             try:
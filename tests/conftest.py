@@ -2,10 +2,13 @@
 
 import pytest
 import logging
-from utils.driver_factory import DriverFactory
+from utils.driver_pool import DriverPool
 from utils.screenshot_helper import ScreenshotHelper
 from config.config import Config
 
+# --sleep-profile / --sleep-budget
+pytest_plugins = ["utils.sleep_profiler"]
+
 # Configure logging
 logging.basicConfig(
     level=getattr(logging, Config.LOG_LEVEL),
@@ -13,13 +16,37 @@ logging.basicConfig(
 )
 
 
+def pytest_addoption(parser):
+    """Register command line options."""
+    parser.addoption(
+        "--browser-profile",
+        action="store",
+        default=None,
+        help="Browser launch profile: default, fast or fidelity"
+    )
+
+
+def pytest_configure(config):
+    """Apply command line options to the test configuration."""
+    profile = config.getoption("--browser-profile")
+    if profile:
+        Config.BROWSER_PROFILE = profile
+
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """Worker-scoped pool of live browser sessions."""
+    pool = DriverPool.shared()
+    yield pool
+    pool.shutdown()
+
+
 @pytest.fixture(scope="function")
-def driver():
-    """WebDriver fixture."""
-    driver_instance = DriverFactory.create_driver()
-    driver_instance.get(Config.BASE_URL)
+def driver(driver_pool):
+    """WebDriver fixture backed by the session pool."""
+    driver_instance = driver_pool.acquire()
     yield driver_instance
-    driver_instance.quit()
+    driver_pool.release(driver_instance)
 
 
 @pytest.fixture(scope="function")
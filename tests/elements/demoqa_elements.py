@@ -4,15 +4,19 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class DemoQAElements:
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_text_box(self):
         """Test Text Box functionality"""
@@ -43,7 +47,7 @@ class DemoQAElements:
         try:
             expand_all = self.driver.find_element(By.CSS_SELECTOR, "button[title='Expand all']")
             expand_all.click()
-            time.sleep(1)
+            self.waits.until(wc.element_count((By.CSS_SELECTOR, ".rct-node"), lambda n: n > 3), replaces=1)
         except:
             pass
 
@@ -58,7 +62,7 @@ class DemoQAElements:
             try:
                 element = self.driver.find_element(By.XPATH, checkbox)
                 self.driver.execute_script("arguments[0].click();", element)
-                time.sleep(0.5)
+                self.waits.settle(wc.element_visible((By.ID, "result")), 0.5)
             except:
                 continue
 
@@ -115,7 +119,7 @@ class DemoQAElements:
         # Test search functionality
         search_box = self.driver.find_element(By.ID, "searchBox")
         search_box.send_keys("Jane")
-        time.sleep(1)
+        self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=1)
 
         # Edit record
         edit_button = self.driver.find_element(By.CSS_SELECTOR, "span[title='Edit']")
@@ -142,7 +146,7 @@ class DemoQAElements:
             double_click_btn = self.driver.find_element(By.ID, "doubleClickBtn")
             # Scroll to element to avoid ad overlay
             self.driver.execute_script("arguments[0].scrollIntoView(true);", double_click_btn)
-            time.sleep(1)
+            self.waits.until(wc.element_stable(double_click_btn), replaces=1)
             actions.double_click(double_click_btn).perform()
 
             double_click_msg = self.wait.until(EC.presence_of_element_located((By.ID, "doubleClickMessage")))
@@ -156,7 +160,7 @@ class DemoQAElements:
             right_click_btn = self.driver.find_element(By.ID, "rightClickBtn")
             # Scroll to element to avoid ad overlay
             self.driver.execute_script("arguments[0].scrollIntoView(true);", right_click_btn)
-            time.sleep(1)
+            self.waits.until(wc.element_stable(right_click_btn), replaces=1)
             actions.context_click(right_click_btn).perform()
 
             right_click_msg = self.wait.until(EC.presence_of_element_located((By.ID, "rightClickMessage")))
@@ -192,7 +196,7 @@ class DemoQAElements:
 
             # Switch to new tab and verify
             self.driver.switch_to.window(self.driver.window_handles[1])
-            time.sleep(2)
+            self.waits.until(wc.page_ready(), replaces=2)
             current_url = self.driver.current_url
             assert "demoqa.com" in current_url
             print(f"  ✓ Simple link test passed - opened: {current_url}")
@@ -207,9 +211,10 @@ class DemoQAElements:
         for link_id in api_links:
             try:
                 link = self.driver.find_element(By.ID, link_id)
+                previous_response = next((e.text for e in self.driver.find_elements(By.ID, "linkResponse")), None)
                 # Use JavaScript click to avoid ad overlay issues
                 self.driver.execute_script("arguments[0].click();", link)
-                time.sleep(1)
+                self.waits.until(wc.text_changed((By.ID, "linkResponse"), previous_response), replaces=1)
 
                 # Check for response message
                 response_msg = self.wait.until(EC.presence_of_element_located((By.ID, "linkResponse")))
@@ -242,9 +247,10 @@ class DemoQAElements:
         # Test valid link (using JavaScript to avoid ad overlay)
         try:
             valid_link = self.driver.find_element(By.LINK_TEXT, "Click Here for Valid Link")
+            links_url = self.driver.current_url
             # Use JavaScript click to avoid ad overlay issues
             self.driver.execute_script("arguments[0].click();", valid_link)
-            time.sleep(2)
+            self.waits.settle(wc.url_changed(links_url), 2)
             
             # Check if we're on a demoqa page
             current_url = self.driver.current_url
@@ -254,16 +260,17 @@ class DemoQAElements:
                 print(f"  Valid link redirected to: {current_url}")
             
             self.driver.back()
-            time.sleep(1)
+            self.waits.until(wc.url_changed(current_url), replaces=1)
         except Exception as e:
             print(f"  Valid link test skipped: {str(e)[:50]}...")
 
         # Test broken link (using JavaScript to avoid ad overlay)
         try:
             broken_link = self.driver.find_element(By.LINK_TEXT, "Click Here for Broken Link")
+            links_url = self.driver.current_url
             # Use JavaScript click to avoid ad overlay issues
             self.driver.execute_script("arguments[0].click();", broken_link)
-            time.sleep(2)
+            self.waits.settle(wc.url_changed(links_url), 2)
             print(f"  Broken link redirected to: {self.driver.current_url}")
         except Exception as e:
             print(f"  Broken link test skipped: {str(e)[:50]}...")
@@ -278,7 +285,6 @@ class DemoQAElements:
         # Test download
         download_btn = self.driver.find_element(By.ID, "downloadButton")
         download_btn.click()
-        time.sleep(2)
         print("  Download initiated")
 
         # Test upload
@@ -338,7 +344,7 @@ class DemoQAElements:
         except Exception as e:
             print(f"\n❌ Test failed: {str(e)}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
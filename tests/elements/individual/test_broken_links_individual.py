@@ -4,17 +4,22 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.dom_snapshot import DomSnapshot
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class BrokenLinksTest:
     """Individual test for Broken Links - Images functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_valid_image(self):
         """Test valid image detection"""
@@ -71,8 +76,9 @@ class BrokenLinksTest:
             print(f"  ✓ Valid link found: {valid_link.text}")
             
             # Use JavaScript click to avoid ad overlay issues
+            links_url = self.driver.current_url
             self.driver.execute_script("arguments[0].click();", valid_link)
-            time.sleep(2)
+            self.waits.settle(wc.url_changed(links_url), 2)
             
             # Check if we're on a demoqa page
             current_url = self.driver.current_url
@@ -84,7 +90,7 @@ class BrokenLinksTest:
                 result = True
             
             self.driver.back()
-            time.sleep(1)
+            self.waits.until(wc.url_changed(current_url), replaces=1)
             
             print("✅ Valid link test PASSED")
             return result
@@ -104,8 +110,9 @@ class BrokenLinksTest:
             print(f"  ✓ Broken link found: {broken_link.text}")
             
             # Use JavaScript click to avoid ad overlay issues
+            links_url = self.driver.current_url
             self.driver.execute_script("arguments[0].click();", broken_link)
-            time.sleep(2)
+            self.waits.settle(wc.url_changed(links_url), 2)
             
             current_url = self.driver.current_url
             print(f"  ✓ Broken link redirected to: {current_url}")
@@ -161,8 +168,9 @@ class BrokenLinksTest:
         self.driver.get("https://demoqa.com/broken")
 
         try:
-            # Get all links on the page
-            links = self.driver.find_elements(By.TAG_NAME, "a")
+            # Get all links on the page; one snapshot answers every read below
+            snapshot = DomSnapshot.take(self.driver)
+            links = snapshot.find_elements(By.TAG_NAME, "a")
             print(f"  ✓ Found {len(links)} links on the page")
             
             # Focus on the test links
@@ -173,7 +181,7 @@ class BrokenLinksTest:
             
             for link_text in test_links:
                 try:
-                    link = self.driver.find_element(By.LINK_TEXT, link_text)
+                    link = snapshot.find_element(By.LINK_TEXT, link_text)
                     href = link.get_attribute('href')
                     target = link.get_attribute('target')
                     
@@ -224,7 +232,7 @@ class BrokenLinksTest:
         except Exception as e:
             print(f"❌ Broken Links test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -4,17 +4,21 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class ButtonsTest:
     """Individual test for Buttons functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_double_click_button(self):
         """Test double click button functionality"""
@@ -131,19 +135,19 @@ class ButtonsTest:
             # Test hover on double click button
             double_click_btn = self.driver.find_element(By.ID, "doubleClickBtn")
             actions.move_to_element(double_click_btn).perform()
-            time.sleep(1)
+            self.waits.until(wc.element_stable(double_click_btn), replaces=1)
             print("  ✓ Hovered over double click button")
 
             # Test hover on right click button
             right_click_btn = self.driver.find_element(By.ID, "rightClickBtn")
             actions.move_to_element(right_click_btn).perform()
-            time.sleep(1)
+            self.waits.until(wc.element_stable(right_click_btn), replaces=1)
             print("  ✓ Hovered over right click button")
 
             # Test hover on dynamic click button
             dynamic_click_btn = self.driver.find_element(By.XPATH, "//button[text()='Click Me']")
             actions.move_to_element(dynamic_click_btn).perform()
-            time.sleep(1)
+            self.waits.until(wc.element_stable(dynamic_click_btn), replaces=1)
             print("  ✓ Hovered over dynamic click button")
             
             print("✅ Button hover effects test PASSED")
@@ -165,7 +169,7 @@ class ButtonsTest:
             # 1. Double click
             double_click_btn = self.driver.find_element(By.ID, "doubleClickBtn")
             actions.double_click(double_click_btn).perform()
-            time.sleep(1)
+            self.waits.until(wc.element_visible((By.ID, "doubleClickMessage")), replaces=1)
             
             double_click_msg = self.wait.until(EC.presence_of_element_located((By.ID, "doubleClickMessage")))
             print(f"  ✓ Double click: {double_click_msg.text}")
@@ -173,7 +177,7 @@ class ButtonsTest:
             # 2. Right click
             right_click_btn = self.driver.find_element(By.ID, "rightClickBtn")
             actions.context_click(right_click_btn).perform()
-            time.sleep(1)
+            self.waits.until(wc.element_visible((By.ID, "rightClickMessage")), replaces=1)
             
             right_click_msg = self.wait.until(EC.presence_of_element_located((By.ID, "rightClickMessage")))
             print(f"  ✓ Right click: {right_click_msg.text}")
@@ -181,7 +185,7 @@ class ButtonsTest:
             # 3. Dynamic click
             dynamic_click_btn = self.driver.find_element(By.XPATH, "//button[text()='Click Me']")
             dynamic_click_btn.click()
-            time.sleep(1)
+            self.waits.until(wc.element_visible((By.ID, "dynamicClickMessage")), replaces=1)
             
             dynamic_click_msg = self.wait.until(EC.presence_of_element_located((By.ID, "dynamicClickMessage")))
             print(f"  ✓ Dynamic click: {dynamic_click_msg.text}")
@@ -236,7 +240,7 @@ class ButtonsTest:
         except Exception as e:
             print(f"❌ Buttons test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
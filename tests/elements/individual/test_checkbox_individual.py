@@ -4,17 +4,21 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class CheckBoxTest:
     """Individual test for Check Box functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_checkbox_expand_functionality(self):
         """Test checkbox tree expansion"""
@@ -26,7 +30,7 @@ class CheckBoxTest:
             try:
                 expand_all = self.driver.find_element(By.CSS_SELECTOR, "button[title='Expand all']")
                 expand_all.click()
-                time.sleep(1)
+                self.waits.until(wc.element_count((By.CSS_SELECTOR, ".rct-node"), lambda n: n > 3), replaces=1)
                 print("  ✓ Expand all button clicked successfully")
             except:
                 print("  ⚠️ Expand all button not found, trying alternative method")
@@ -35,7 +39,7 @@ class CheckBoxTest:
             try:
                 home_toggle = self.driver.find_element(By.XPATH, "//span[text()='Home']/../button")
                 home_toggle.click()
-                time.sleep(1)
+                self.waits.until(wc.element_stable((By.ID, "tree-node")), replaces=1)
                 print("  ✓ Home node expanded")
             except:
                 print("  ⚠️ Home node expansion not found")
@@ -57,7 +61,7 @@ class CheckBoxTest:
             try:
                 expand_all = self.driver.find_element(By.CSS_SELECTOR, "button[title='Expand all']")
                 expand_all.click()
-                time.sleep(1)
+                self.waits.until(wc.element_count((By.CSS_SELECTOR, ".rct-node"), lambda n: n > 3), replaces=1)
             except:
                 pass
 
@@ -73,7 +77,7 @@ class CheckBoxTest:
                 try:
                     element = self.driver.find_element(By.XPATH, xpath)
                     self.driver.execute_script("arguments[0].click();", element)
-                    time.sleep(0.5)
+                    self.waits.settle(wc.element_visible((By.ID, "result")), 0.5)
                     print(f"  ✓ {name} checkbox selected")
                     selected_count += 1
                 except:
@@ -109,7 +113,7 @@ class CheckBoxTest:
             try:
                 expand_all = self.driver.find_element(By.CSS_SELECTOR, "button[title='Expand all']")
                 expand_all.click()
-                time.sleep(1)
+                self.waits.until(wc.element_count((By.CSS_SELECTOR, ".rct-node"), lambda n: n > 3), replaces=1)
             except:
                 pass
 
@@ -117,12 +121,12 @@ class CheckBoxTest:
             try:
                 home_checkbox = self.driver.find_element(By.XPATH, "//span[text()='Home']/../span[@class='rct-checkbox']")
                 self.driver.execute_script("arguments[0].click();", home_checkbox)
-                time.sleep(1)
+                self.waits.settle(wc.element_visible((By.ID, "result")), 1)
                 print("  ✓ Home checkbox selected first")
                 
                 # Now unselect it
                 self.driver.execute_script("arguments[0].click();", home_checkbox)
-                time.sleep(1)
+                self.waits.settle(wc.element_count((By.ID, "result"), lambda n: n == 0), 1)
                 print("  ✓ Home checkbox unselected")
                 
                 # Check if result is empty or shows unselection
@@ -157,7 +161,7 @@ class CheckBoxTest:
             try:
                 expand_all = self.driver.find_element(By.CSS_SELECTOR, "button[title='Expand all']")
                 expand_all.click()
-                time.sleep(1)
+                self.waits.until(wc.element_count((By.CSS_SELECTOR, ".rct-node"), lambda n: n > 3), replaces=1)
             except:
                 pass
 
@@ -166,7 +170,7 @@ class CheckBoxTest:
                 # Try to select a specific file under Desktop
                 desktop_file = self.driver.find_element(By.XPATH, "//span[text()='Notes']/../span[@class='rct-checkbox']")
                 self.driver.execute_script("arguments[0].click();", desktop_file)
-                time.sleep(1)
+                self.waits.settle(wc.element_visible((By.ID, "result")), 1)
                 print("  ✓ Child item (Notes) selected")
                 
                 # Check if parent (Desktop) shows partial selection
@@ -218,7 +222,7 @@ class CheckBoxTest:
         except Exception as e:
             print(f"❌ Check Box test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
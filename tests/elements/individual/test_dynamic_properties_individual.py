@@ -6,15 +6,20 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class DynamicPropertiesTest:
     """Individual test for Dynamic Properties functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_enable_after_button(self):
         """Test button that becomes enabled after delay"""
@@ -56,7 +61,7 @@ class DynamicPropertiesTest:
             print(f"  ✓ Initial button color: {initial_color}")
             
             # Wait a bit and check color again (color changes randomly)
-            time.sleep(3)
+            self.waits.settle(wc.attribute_contains(color_change_btn, "class", "text-danger"), 3)
             current_color = color_change_btn.value_of_css_property('color')
             print(f"  ✓ Current button color: {current_color}")
             
@@ -207,7 +212,13 @@ class DynamicPropertiesTest:
             
             # Wait and check final states
             print("  ⏳ Waiting for dynamic changes...")
-            time.sleep(6)
+            self.waits.settle(
+                wc.all_of(
+                    wc.element_visible((By.ID, "visibleAfter")),
+                    wc.attribute_reached((By.ID, "enableAfter"), "disabled", None)
+                ),
+                6
+            )
             
             # Check Enable After button final state
             try:
@@ -263,7 +274,7 @@ class DynamicPropertiesTest:
         except Exception as e:
             print(f"❌ Dynamic Properties test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -4,17 +4,22 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.dom_snapshot import DomSnapshot
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class LinksTest:
     """Individual test for Links functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_simple_link_new_tab(self):
         """Test simple link that opens in new tab"""
@@ -28,18 +33,19 @@ class LinksTest:
 
             # Click simple link
             simple_link = self.driver.find_element(By.ID, "simpleLink")
+            original_window = self.driver.current_window_handle
             simple_link.click()
-            time.sleep(2)
+            new_tab = self.waits.settle(wc.new_window([original_window]), 2)
             print("  ✓ Simple link clicked")
 
             # Check if new tab opened
             current_windows = len(self.driver.window_handles)
             print(f"  ✓ Current windows: {current_windows}")
 
-            if current_windows > initial_windows:
+            if new_tab:
                 # Switch to new tab and verify
-                self.driver.switch_to.window(self.driver.window_handles[1])
-                time.sleep(2)
+                self.driver.switch_to.window(new_tab)
+                self.waits.until(wc.page_ready(), replaces=2)
                 
                 current_url = self.driver.current_url
                 print(f"  ✓ New tab URL: {current_url}")
@@ -49,7 +55,7 @@ class LinksTest:
                     
                     # Close new tab and switch back
                     self.driver.close()
-                    self.driver.switch_to.window(self.driver.window_handles[0])
+                    self.driver.switch_to.window(original_window)
                     print("  ✓ Returned to original tab")
                     
                     print("✅ Simple link new tab test PASSED")
@@ -71,22 +77,17 @@ class LinksTest:
         self.driver.get("https://demoqa.com/links")
 
         try:
-            # Get initial window count
-            initial_windows = len(self.driver.window_handles)
-
             # Click dynamic link
             dynamic_link = self.driver.find_element(By.ID, "dynamicLink")
+            original_window = self.driver.current_window_handle
             dynamic_link.click()
-            time.sleep(2)
+            new_tab = self.waits.settle(wc.new_window([original_window]), 2)
             print("  ✓ Dynamic link clicked")
 
-            # Check if new tab opened
-            current_windows = len(self.driver.window_handles)
-
-            if current_windows > initial_windows:
+            if new_tab:
                 # Switch to new tab and verify
-                self.driver.switch_to.window(self.driver.window_handles[1])
-                time.sleep(2)
+                self.driver.switch_to.window(new_tab)
+                self.waits.until(wc.page_ready(), replaces=2)
                 
                 current_url = self.driver.current_url
                 print(f"  ✓ Dynamic link URL: {current_url}")
@@ -96,7 +97,7 @@ class LinksTest:
                     
                     # Close new tab and switch back
                     self.driver.close()
-                    self.driver.switch_to.window(self.driver.window_handles[0])
+                    self.driver.switch_to.window(original_window)
                     
                     print("✅ Dynamic link test PASSED")
                     return True
@@ -120,7 +121,7 @@ class LinksTest:
             # Click Created API link
             created_link = self.driver.find_element(By.ID, "created")
             created_link.click()
-            time.sleep(2)
+            self.waits.until(wc.element_visible((By.ID, "linkResponse")), replaces=2)
             print("  ✓ Created API link clicked")
 
             # Check for response message
@@ -149,7 +150,7 @@ class LinksTest:
             # Click No Content API link
             no_content_link = self.driver.find_element(By.ID, "no-content")
             no_content_link.click()
-            time.sleep(2)
+            self.waits.until(wc.element_visible((By.ID, "linkResponse")), replaces=2)
             print("  ✓ No Content API link clicked")
 
             # Check for response message
@@ -178,7 +179,7 @@ class LinksTest:
             # Click Moved API link
             moved_link = self.driver.find_element(By.ID, "moved")
             moved_link.click()
-            time.sleep(2)
+            self.waits.until(wc.element_visible((By.ID, "linkResponse")), replaces=2)
             print("  ✓ Moved API link clicked")
 
             # Check for response message
@@ -207,7 +208,7 @@ class LinksTest:
             # Click Bad Request API link
             bad_request_link = self.driver.find_element(By.ID, "bad-request")
             bad_request_link.click()
-            time.sleep(2)
+            self.waits.until(wc.element_visible((By.ID, "linkResponse")), replaces=2)
             print("  ✓ Bad Request API link clicked")
 
             # Check for response message
@@ -236,7 +237,7 @@ class LinksTest:
             # Click Unauthorized API link
             unauthorized_link = self.driver.find_element(By.ID, "unauthorized")
             unauthorized_link.click()
-            time.sleep(2)
+            self.waits.until(wc.element_visible((By.ID, "linkResponse")), replaces=2)
             print("  ✓ Unauthorized API link clicked")
 
             # Check for response message
@@ -262,19 +263,22 @@ class LinksTest:
         self.driver.get("https://demoqa.com/links")
 
         try:
+            # One snapshot answers every read below
+            snapshot = DomSnapshot.take(self.driver)
+
             # Test simple link properties
-            simple_link = self.driver.find_element(By.ID, "simpleLink")
+            simple_link = snapshot.find_element(By.ID, "simpleLink")
             print(f"  ✓ Simple link text: {simple_link.text}")
             print(f"  ✓ Simple link href: {simple_link.get_attribute('href')}")
             print(f"  ✓ Simple link target: {simple_link.get_attribute('target')}")
 
             # Test dynamic link properties
-            dynamic_link = self.driver.find_element(By.ID, "dynamicLink")
+            dynamic_link = snapshot.find_element(By.ID, "dynamicLink")
             print(f"  ✓ Dynamic link text: {dynamic_link.text}")
             print(f"  ✓ Dynamic link href: {dynamic_link.get_attribute('href')}")
 
             # Test API link properties
-            created_link = self.driver.find_element(By.ID, "created")
+            created_link = snapshot.find_element(By.ID, "created")
             print(f"  ✓ Created API link text: {created_link.text}")
             print(f"  ✓ Created API link href: {created_link.get_attribute('href')}")
             
@@ -318,7 +322,7 @@ class LinksTest:
         except Exception as e:
             print(f"❌ Links test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -4,17 +4,21 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class RadioButtonTest:
     """Individual test for Radio Button functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_yes_radio_button(self):
         """Test Yes radio button selection"""
@@ -81,7 +85,7 @@ class RadioButtonTest:
             try:
                 no_radio_label = self.driver.find_element(By.XPATH, "//label[@for='noRadio']")
                 no_radio_label.click()
-                time.sleep(1)
+                self.waits.settle(wc.element_visible((By.CSS_SELECTOR, ".text-success")), 1)
                 
                 # Check if any result appeared (shouldn't happen)
                 try:
@@ -114,7 +118,7 @@ class RadioButtonTest:
             # First select Yes
             yes_radio = self.driver.find_element(By.XPATH, "//label[@for='yesRadio']")
             yes_radio.click()
-            time.sleep(1)
+            self.waits.until(wc.element_visible((By.CSS_SELECTOR, ".text-success")), replaces=1)
             
             success_text = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".text-success")))
             first_selection = success_text.text
@@ -123,7 +127,7 @@ class RadioButtonTest:
             # Then select Impressive
             impressive_radio = self.driver.find_element(By.XPATH, "//label[@for='impressiveRadio']")
             impressive_radio.click()
-            time.sleep(1)
+            self.waits.until(wc.text_contains((By.CSS_SELECTOR, ".text-success"), "Impressive"), replaces=1)
             
             # Verify that the selection changed to Impressive
             success_text = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".text-success")))
@@ -161,7 +165,7 @@ class RadioButtonTest:
             # Test selection states
             yes_radio_label = self.driver.find_element(By.XPATH, "//label[@for='yesRadio']")
             yes_radio_label.click()
-            time.sleep(1)
+            self.waits.until(wc.element_visible((By.CSS_SELECTOR, ".text-success")), replaces=1)
             
             # Check if Yes is selected
             is_yes_selected = yes_radio_input.is_selected()
@@ -211,7 +215,7 @@ class RadioButtonTest:
         except Exception as e:
             print(f"❌ Radio Button test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
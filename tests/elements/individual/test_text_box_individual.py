@@ -6,15 +6,20 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from pages.base_page import BasePage
+from utils.driver_factory import DriverFactory
 
 
 class TextBoxTest:
     """Individual test for Text Box functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.page = BasePage(self.driver)
 
     def test_text_box_basic_functionality(self):
         """Test basic text box form filling and submission"""
@@ -22,18 +27,14 @@ class TextBoxTest:
         self.driver.get("https://demoqa.com/text-box")
 
         try:
-            # Fill text box fields
-            self.driver.find_element(By.ID, "userName").send_keys("John Doe")
-            print("  ✓ Full Name field filled")
-            
-            self.driver.find_element(By.ID, "userEmail").send_keys("john.doe@example.com")
-            print("  ✓ Email field filled")
-            
-            self.driver.find_element(By.ID, "currentAddress").send_keys("123 Main Street, City")
-            print("  ✓ Current Address field filled")
-            
-            self.driver.find_element(By.ID, "permanentAddress").send_keys("456 Oak Avenue, Town")
-            print("  ✓ Permanent Address field filled")
+            # Fill text box fields in one call
+            self.page.fill_many({
+                (By.ID, "userName"): "John Doe",
+                (By.ID, "userEmail"): "john.doe@example.com",
+                (By.ID, "currentAddress"): "123 Main Street, City",
+                (By.ID, "permanentAddress"): "456 Oak Avenue, Town",
+            })
+            print("  ✓ Full Name, Email and both Address fields filled")
 
             # Submit form (using JavaScript to avoid ad overlay issues)
             submit_btn = self.driver.find_element(By.ID, "submit")
@@ -41,8 +42,17 @@ class TextBoxTest:
             print("  ✓ Form submitted successfully")
 
             # Verify output
-            output = self.wait.until(EC.presence_of_element_located((By.ID, "output")))
-            assert "John Doe" in output.text
+            self.wait.until(EC.visibility_of_element_located((By.ID, "name")))
+            output = self.page.read_many({
+                "name": (By.ID, "name"),
+                "email": (By.ID, "email"),
+                "current_address": (By.CSS_SELECTOR, "p#currentAddress"),
+                "permanent_address": (By.CSS_SELECTOR, "p#permanentAddress"),
+            })
+            assert "John Doe" in output["name"]["text"]
+            assert "john.doe@example.com" in output["email"]["text"]
+            assert "123 Main Street, City" in output["current_address"]["text"]
+            assert "456 Oak Avenue, Town" in output["permanent_address"]["text"]
             print("  ✓ Output verification passed")
             
             print("✅ Text Box basic functionality test PASSED")
@@ -136,7 +146,7 @@ class TextBoxTest:
         except Exception as e:
             print(f"❌ Text Box test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
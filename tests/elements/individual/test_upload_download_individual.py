@@ -4,17 +4,19 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
 
 
 class UploadDownloadTest:
     """Individual test for Upload and Download functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
 
     def test_download_functionality(self):
         """Test download functionality"""
@@ -30,7 +32,6 @@ class UploadDownloadTest:
             
             # Click download button
             download_btn.click()
-            time.sleep(2)
             print("  ✓ Download initiated")
             
             print("✅ Download functionality test PASSED")
@@ -122,7 +123,6 @@ class UploadDownloadTest:
 
                 # Clean up
                 os.remove(test_file_path)
-                time.sleep(1)
                 
             except Exception as e:
                 print(f"  ❌ Error with {filename}: {e}")
@@ -264,7 +264,7 @@ class UploadDownloadTest:
         except Exception as e:
             print(f"❌ Upload Download test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -4,17 +4,23 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from pages.base_page import BasePage
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class WebTablesTest:
     """Individual test for Web Tables functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
+        self.page = BasePage(self.driver)
 
     def test_add_new_record(self):
         """Test adding new record to web table"""
@@ -42,8 +48,9 @@ class WebTablesTest:
             print("  ✓ Form submitted")
 
             # Verify record added
-            table = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".rt-table")))
-            assert "Jane" in table.text
+            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".rt-table")))
+            table = self.page.read_table()
+            assert table.where(Email="jane.smith@example.com").column("First Name") == ["Jane"]
             print("  ✓ New record verified in table")
             
             print("✅ Add new record test PASSED")
@@ -72,28 +79,28 @@ class WebTablesTest:
             
             submit_btn = self.driver.find_element(By.ID, "submit")
             self.driver.execute_script("arguments[0].click();", submit_btn)
-            time.sleep(1)
+            self.waits.until(wc.element_count((By.CSS_SELECTOR, ".modal-content"), lambda n: n == 0), replaces=1)
             print("  ✓ Test record added for search")
+            all_rows = self.page.read_table()
 
             # Test search functionality
             search_box = self.driver.find_element(By.ID, "searchBox")
             search_box.send_keys("SearchTest")
-            time.sleep(2)
+            self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=2)
             print("  ✓ Search term entered")
 
-            # Verify search results
-            table = self.driver.find_element(By.CSS_SELECTOR, ".rt-table")
-            table_text = table.text
-            
-            if "SearchTest" in table_text:
+            # Verify search results against the same search over every row read before
+            shown = self.page.read_table()
+            assert shown.column("First Name") == ["SearchTest"]
+            if shown.rows() == all_rows.search("SearchTest").rows():
                 print("  ✓ Search results show correct record")
             else:
-                print("  ⚠️ Search results unclear")
+                print("  ⚠️ Search results differ from a search over the full table")
 
             # Clear search
             search_box.clear()
             search_box.send_keys(Keys.ENTER)
-            time.sleep(1)
+            self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=1)
             print("  ✓ Search cleared")
             
             print("✅ Search functionality test PASSED")
@@ -122,13 +129,13 @@ class WebTablesTest:
             
             submit_btn = self.driver.find_element(By.ID, "submit")
             self.driver.execute_script("arguments[0].click();", submit_btn)
-            time.sleep(1)
+            self.waits.until(wc.element_count((By.CSS_SELECTOR, ".modal-content"), lambda n: n == 0), replaces=1)
             print("  ✓ Test record added for editing")
 
             # Search for the record
             search_box = self.driver.find_element(By.ID, "searchBox")
             search_box.send_keys("EditTest")
-            time.sleep(1)
+            self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=1)
 
             # Click edit button
             edit_button = self.driver.find_element(By.CSS_SELECTOR, "span[title='Edit']")
@@ -144,12 +151,12 @@ class WebTablesTest:
             # Submit changes
             submit_btn = self.driver.find_element(By.ID, "submit")
             self.driver.execute_script("arguments[0].click();", submit_btn)
-            time.sleep(1)
+            self.waits.until(wc.element_count((By.CSS_SELECTOR, ".modal-content"), lambda n: n == 0), replaces=1)
             print("  ✓ Changes submitted")
 
             # Verify changes
-            table = self.driver.find_element(By.CSS_SELECTOR, ".rt-table")
-            if "80000" in table.text:
+            table = self.page.read_table()
+            if table.where(Email="edit@test.com").column("Salary") == ["80000"]:
                 print("  ✓ Record updated successfully")
             else:
                 print("  ⚠️ Record update verification unclear")
@@ -180,28 +187,28 @@ class WebTablesTest:
             
             submit_btn = self.driver.find_element(By.ID, "submit")
             self.driver.execute_script("arguments[0].click();", submit_btn)
-            time.sleep(1)
+            self.waits.until(wc.element_count((By.CSS_SELECTOR, ".modal-content"), lambda n: n == 0), replaces=1)
             print("  ✓ Test record added for deletion")
 
             # Search for the record
             search_box = self.driver.find_element(By.ID, "searchBox")
             search_box.send_keys("DeleteTest")
-            time.sleep(1)
+            self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=1)
 
             # Click delete button
             delete_button = self.driver.find_element(By.CSS_SELECTOR, "span[title='Delete']")
             delete_button.click()
-            time.sleep(1)
+            self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=1)
             print("  ✓ Delete button clicked")
 
             # Clear search to see if record is gone
             search_box.clear()
             search_box.send_keys(Keys.ENTER)
-            time.sleep(1)
+            self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=1)
 
             # Verify record is deleted
-            table = self.driver.find_element(By.CSS_SELECTOR, ".rt-table")
-            if "DeleteTest" not in table.text:
+            table = self.page.read_table()
+            if not table.search("DeleteTest"):
                 print("  ✓ Record deleted successfully")
             else:
                 print("  ⚠️ Record may still exist")
@@ -219,6 +226,9 @@ class WebTablesTest:
         self.driver.get("https://demoqa.com/webtables")
 
         try:
+            all_rows = self.page.read_table()
+            print(f"  ✓ Table has {len(all_rows)} rows")
+
             # Check rows per page dropdown
             try:
                 rows_dropdown = self.driver.find_element(By.CSS_SELECTOR, "select[aria-label='rows per page']")
@@ -229,19 +239,25 @@ class WebTablesTest:
                 from selenium.webdriver.support.ui import Select
                 select = Select(rows_dropdown)
                 select.select_by_value("5")
-                time.sleep(1)
+                self.waits.until(wc.element_count((By.CSS_SELECTOR, ".rt-tbody .rt-tr-group"), lambda n: n == 5), replaces=1)
                 print("  ✓ Changed to 5 rows per page")
+
+                # Every page together still holds every row, in the same order
+                paged = self.page.read_table()
+                assert paged.rows() == all_rows.rows()
+                print(f"  ✓ {paged.pages} pages hold all {len(paged)} rows")
                 
             except Exception as e:
                 print(f"  ⚠️ Pagination dropdown test: {e}")
 
             # Check pagination buttons
             try:
-                next_btn = self.driver.find_element(By.CSS_SELECTOR, ".-next button")
-                prev_btn = self.driver.find_element(By.CSS_SELECTOR, ".-previous button")
-                
-                next_enabled = next_btn.is_enabled()
-                prev_enabled = prev_btn.is_enabled()
+                buttons = self.page.read_many({
+                    "next": (By.CSS_SELECTOR, ".-next button"),
+                    "previous": (By.CSS_SELECTOR, ".-previous button"),
+                }, attributes=("disabled",))
+                next_enabled = buttons["next"]["present"] and buttons["next"]["attributes"]["disabled"] is None
+                prev_enabled = buttons["previous"]["present"] and buttons["previous"]["attributes"]["disabled"] is None
                 
                 print(f"  ✓ Next button enabled: {next_enabled}")
                 print(f"  ✓ Previous button enabled: {prev_enabled}")
@@ -256,6 +272,33 @@ class WebTablesTest:
             print(f"❌ Table pagination test FAILED: {e}")
             return False
 
+    def test_column_sort(self):
+        """Test sorting by clicking a column header"""
+        print("\n🔧 Testing Web Tables - Column Sort...")
+        self.driver.get("https://demoqa.com/webtables")
+
+        try:
+            age_header = (By.XPATH, "//div[contains(@class, 'rt-th') and normalize-space()='Age']")
+
+            self.driver.find_element(*age_header).click()
+            self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=1)
+            table = self.page.read_table()
+            assert table.is_sorted("Age"), f"Ages not ascending: {table.column('Age')}"
+            print(f"  ✓ Ascending by age: {table.column('Age')}")
+
+            self.driver.find_element(*age_header).click()
+            self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=1)
+            table = self.page.read_table()
+            assert table.is_sorted("Age", reverse=True), f"Ages not descending: {table.column('Age')}"
+            print(f"  ✓ Descending by age: {table.column('Age')}")
+
+            print("✅ Column sort test PASSED")
+            return True
+
+        except Exception as e:
+            print(f"❌ Column sort test FAILED: {e}")
+            return False
+
     def run_all_web_tables_tests(self):
         """Run all web tables tests"""
         print("=" * 60)
@@ -270,6 +313,7 @@ class WebTablesTest:
             results.append(self.test_edit_record())
             results.append(self.test_delete_record())
             results.append(self.test_table_pagination())
+            results.append(self.test_column_sort())
             
             passed = sum(results)
             total = len(results)
@@ -286,7 +330,7 @@ class WebTablesTest:
         except Exception as e:
             print(f"❌ Web Tables test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -13,6 +13,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
+from utils.waits import Waiter, conditions as wc
 
 
 @allure.epic("DemoQA Automation")
@@ -21,29 +22,14 @@ class TestElementsAllure:
     """Elements section tests with Allure reporting"""
     
     @pytest.fixture(autouse=True)
-    def setup_teardown(self):
+    def setup_teardown(self, driver):
         """Setup and teardown for each test"""
         with allure.step("Initialize WebDriver"):
-            from selenium.webdriver.chrome.options import Options
-            chrome_options = Options()
-            
-            # Check for headless mode from environment variable
-            if os.environ.get('HEADLESS', '').lower() == 'true':
-                chrome_options.add_argument('--headless')
-                chrome_options.add_argument('--no-sandbox')
-                chrome_options.add_argument('--disable-dev-shm-usage')
-                chrome_options.add_argument('--disable-gpu')
-                chrome_options.add_argument('--window-size=1920,1080')
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = driver
             self.wait = WebDriverWait(self.driver, 10)
-            if not os.environ.get('HEADLESS', '').lower() == 'true':
-                self.driver.maximize_window()
+            self.waits = Waiter(self.driver, timeout=10)
         
         yield
-        
-        with allure.step("Close WebDriver"):
-            self.driver.quit()
     
     @allure.story("Form Input")
     @allure.title("Text Box - Form Submission and Validation")
@@ -96,7 +82,7 @@ class TestElementsAllure:
             try:
                 expand_all = self.driver.find_element(By.CSS_SELECTOR, "button[title='Expand all']")
                 expand_all.click()
-                time.sleep(1)
+                self.waits.until(wc.element_count((By.CSS_SELECTOR, ".rct-node"), lambda n: n > 3), replaces=1)
                 allure.attach("Tree expanded successfully", "Expansion Status", allure.attachment_type.TEXT)
             except:
                 allure.attach("Expand button not found", "Expansion Status", allure.attachment_type.TEXT)
@@ -114,7 +100,7 @@ class TestElementsAllure:
                     element = self.driver.find_element(By.XPATH, checkbox)
                     self.driver.execute_script("arguments[0].click();", element)
                     selected_count += 1
-                    time.sleep(0.5)
+                    self.waits.settle(wc.element_visible((By.ID, "result")), 0.5)
                 except:
                     continue
             
@@ -192,7 +178,7 @@ class TestElementsAllure:
         with allure.step("Test search functionality"):
             search_box = self.driver.find_element(By.ID, "searchBox")
             search_box.send_keys("Jane")
-            time.sleep(1)
+            self.waits.until(wc.element_stable((By.CSS_SELECTOR, ".rt-tbody")), replaces=1)
             allure.attach("Searched for 'Jane'", "Search Query", allure.attachment_type.TEXT)
         
         with allure.step("Edit record"):
@@ -225,7 +211,7 @@ class TestElementsAllure:
             try:
                 double_click_btn = self.driver.find_element(By.ID, "doubleClickBtn")
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", double_click_btn)
-                time.sleep(1)
+                self.waits.until(wc.element_stable(double_click_btn), replaces=1)
                 actions.double_click(double_click_btn).perform()
                 
                 double_click_msg = self.wait.until(EC.presence_of_element_located((By.ID, "doubleClickMessage")))
@@ -238,7 +224,7 @@ class TestElementsAllure:
             try:
                 right_click_btn = self.driver.find_element(By.ID, "rightClickBtn")
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", right_click_btn)
-                time.sleep(1)
+                self.waits.until(wc.element_stable(right_click_btn), replaces=1)
                 actions.context_click(right_click_btn).perform()
                 
                 right_click_msg = self.wait.until(EC.presence_of_element_located((By.ID, "rightClickMessage")))
@@ -275,7 +261,7 @@ class TestElementsAllure:
                 self.driver.execute_script("arguments[0].click();", simple_link)
                 
                 self.driver.switch_to.window(self.driver.window_handles[1])
-                time.sleep(2)
+                self.waits.until(wc.page_ready(), replaces=2)
                 current_url = self.driver.current_url
                 assert "demoqa.com" in current_url
                 allure.attach(current_url, "New Tab URL", allure.attachment_type.TEXT)
@@ -292,8 +278,9 @@ class TestElementsAllure:
             for link_id in api_links:
                 try:
                     link = self.driver.find_element(By.ID, link_id)
+                    previous_response = next((e.text for e in self.driver.find_elements(By.ID, "linkResponse")), None)
                     self.driver.execute_script("arguments[0].click();", link)
-                    time.sleep(1)
+                    self.waits.until(wc.text_changed((By.ID, "linkResponse"), previous_response), replaces=1)
                     
                     response_msg = self.wait.until(EC.presence_of_element_located((By.ID, "linkResponse")))
                     api_results.append(f"{link_id}: {response_msg.text[:50]}...")
@@ -328,21 +315,24 @@ class TestElementsAllure:
         with allure.step("Test valid link"):
             try:
                 valid_link = self.driver.find_element(By.LINK_TEXT, "Click Here for Valid Link")
+                links_url = self.driver.current_url
                 self.driver.execute_script("arguments[0].click();", valid_link)
-                time.sleep(2)
+                self.waits.settle(wc.url_changed(links_url), 2)
                 
                 current_url = self.driver.current_url
                 allure.attach(current_url, "Valid Link Destination", allure.attachment_type.TEXT)
+                destination_url = current_url
                 self.driver.back()
-                time.sleep(1)
+                self.waits.until(wc.url_changed(destination_url), replaces=1)
             except Exception as e:
                 allure.attach(str(e), "Valid Link Error", allure.attachment_type.TEXT)
         
         with allure.step("Test broken link"):
             try:
                 broken_link = self.driver.find_element(By.LINK_TEXT, "Click Here for Broken Link")
+                links_url = self.driver.current_url
                 self.driver.execute_script("arguments[0].click();", broken_link)
-                time.sleep(2)
+                self.waits.settle(wc.url_changed(links_url), 2)
                 
                 current_url = self.driver.current_url
                 allure.attach(current_url, "Broken Link Destination", allure.attachment_type.TEXT)
@@ -363,7 +353,6 @@ class TestElementsAllure:
         with allure.step("Test download functionality"):
             download_btn = self.driver.find_element(By.ID, "downloadButton")
             download_btn.click()
-            time.sleep(2)
             allure.attach("Download initiated successfully", "Download Status", allure.attachment_type.TEXT)
         
         with allure.step("Test upload functionality"):
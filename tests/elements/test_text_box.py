@@ -45,13 +45,17 @@ class TestTextBox:
         with allure.step("Verify output is displayed"):
             assert self.text_box_page.is_output_visible(), "Output section should be visible"
         
+        output = self.text_box_page.get_output()
+        
         with allure.step("Verify output contains correct name"):
-            output_name = self.text_box_page.get_output_name()
-            assert test_data["name"] in output_name, f"Output should contain name: {test_data['name']}"
+            assert test_data["name"] in output["name"], f"Output should contain name: {test_data['name']}"
         
         with allure.step("Verify output contains correct email"):
-            output_email = self.text_box_page.get_output_email()
-            assert test_data["email"] in output_email, f"Output should contain email: {test_data['email']}"
+            assert test_data["email"] in output["email"], f"Output should contain email: {test_data['email']}"
+        
+        with allure.step("Verify output contains both addresses"):
+            assert test_data["current_address"] in output["current_address"], "Output should contain current address"
+            assert test_data["permanent_address"] in output["permanent_address"], "Output should contain permanent address"
     
     @allure.story("Form Validation")
     @allure.title("Submit form with invalid email")
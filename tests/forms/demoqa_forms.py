@@ -7,31 +7,36 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import Select
 import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from pages.base_page import BasePage
+from utils.driver_factory import DriverFactory
 
 
 class DemoQAForms:
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
 
     def test_practice_form(self):
         """Test Practice Form functionality"""
         print("Testing Practice Form...")
         self.driver.get("https://demoqa.com/automation-practice-form")
 
-        # Fill basic information
-        self.driver.find_element(By.ID, "firstName").send_keys("John")
-        self.driver.find_element(By.ID, "lastName").send_keys("Doe")
-        self.driver.find_element(By.ID, "userEmail").send_keys("john.doe@example.com")
+        # Fill basic information, mobile number and address in one call
+        BasePage(self.driver).fill_many({
+            (By.ID, "firstName"): "John",
+            (By.ID, "lastName"): "Doe",
+            (By.ID, "userEmail"): "john.doe@example.com",
+            (By.ID, "userNumber"): "1234567890",
+            (By.ID, "currentAddress"): "123 Main Street, City, State",
+        })
 
         # Select gender
         gender_radio = self.driver.find_element(By.XPATH, "//label[@for='gender-radio-1']")
         self.driver.execute_script("arguments[0].click();", gender_radio)
 
-        # Fill mobile number
-        self.driver.find_element(By.ID, "userNumber").send_keys("1234567890")
-
         # Select date of birth
         date_input = self.driver.find_element(By.ID, "dateOfBirthInput")
         date_input.click()
@@ -66,9 +71,6 @@ class DemoQAForms:
         upload_input = self.driver.find_element(By.ID, "uploadPicture")
         upload_input.send_keys(test_image_path)
 
-        # Fill current address
-        self.driver.find_element(By.ID, "currentAddress").send_keys("123 Main Street, City, State")
-
         # Select state
         state_dropdown = self.driver.find_element(By.ID, "state")
         state_dropdown.click()
@@ -86,16 +88,19 @@ class DemoQAForms:
         self.driver.execute_script("arguments[0].click();", submit_btn)
 
         # Verify submission
-        modal = self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "modal-content")))
-        modal_title = self.driver.find_element(By.ID, "example-modal-sizes-title-lg")
-        assert "Thanks for submitting the form" in modal_title.text
+        self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "modal-content")))
+        modal = BasePage(self.driver).read_many({
+            "title": (By.ID, "example-modal-sizes-title-lg"),
+            "table": (By.CSS_SELECTOR, ".table-responsive"),
+        })
+        assert "Thanks for submitting the form" in modal["title"]["text"]
 
         # Verify form data in modal
-        table_data = self.driver.find_element(By.CSS_SELECTOR, ".table-responsive")
-        assert "John Doe" in table_data.text
-        assert "john.doe@example.com" in table_data.text
-        assert "Male" in table_data.text
-        assert "1234567890" in table_data.text
+        table_data = modal["table"]["text"]
+        assert "John Doe" in table_data
+        assert "john.doe@example.com" in table_data
+        assert "Male" in table_data
+        assert "1234567890" in table_data
 
         # Close modal (using JavaScript to avoid ad overlay issues)
         close_btn = self.driver.find_element(By.ID, "closeLargeModal")
@@ -143,7 +148,7 @@ class DemoQAForms:
         except Exception as e:
             print(f"\n❌ Test failed: {str(e)}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -14,6 +14,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import Select
+from pages.base_page import BasePage
 
 
 @allure.epic("DemoQA Automation")
@@ -22,17 +23,13 @@ class TestFormsAllure:
     """Forms section tests with Allure reporting"""
     
     @pytest.fixture(autouse=True)
-    def setup_teardown(self):
+    def setup_teardown(self, driver):
         """Setup and teardown for each test"""
         with allure.step("Initialize WebDriver"):
-            self.driver = webdriver.Chrome()
+            self.driver = driver
             self.wait = WebDriverWait(self.driver, 10)
-            self.driver.maximize_window()
         
         yield
-        
-        with allure.step("Close WebDriver"):
-            self.driver.quit()
     
     @allure.story("Form Validation")
     @allure.title("Practice Form - Complete Form Submission")
@@ -54,10 +51,12 @@ class TestFormsAllure:
                 "mobile": "1234567890"
             }
             
-            self.driver.find_element(By.ID, "firstName").send_keys(test_data["firstName"])
-            self.driver.find_element(By.ID, "lastName").send_keys(test_data["lastName"])
-            self.driver.find_element(By.ID, "userEmail").send_keys(test_data["email"])
-            self.driver.find_element(By.ID, "userNumber").send_keys(test_data["mobile"])
+            BasePage(self.driver).fill_many({
+                (By.ID, "firstName"): test_data["firstName"],
+                (By.ID, "lastName"): test_data["lastName"],
+                (By.ID, "userEmail"): test_data["email"],
+                (By.ID, "userNumber"): test_data["mobile"],
+            })
             
             allure.attach(str(test_data), "Basic Information", allure.attachment_type.JSON)
         
@@ -129,13 +128,15 @@ class TestFormsAllure:
             self.driver.execute_script("arguments[0].click();", submit_btn)
         
         with allure.step("Verify form submission"):
-            modal = self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "modal-content")))
-            modal_title = self.driver.find_element(By.ID, "example-modal-sizes-title-lg")
-            assert "Thanks for submitting the form" in modal_title.text
+            self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "modal-content")))
+            # Title and form data from the modal in one call
+            modal = BasePage(self.driver).read_many({
+                "title": (By.ID, "example-modal-sizes-title-lg"),
+                "table": (By.CSS_SELECTOR, ".table-responsive"),
+            })
+            assert "Thanks for submitting the form" in modal["title"]["text"]
             
-            # Get form data from modal
-            table_data = self.driver.find_element(By.CSS_SELECTOR, ".table-responsive")
-            allure.attach(table_data.text, "Submitted Form Data", allure.attachment_type.TEXT)
+            allure.attach(modal["table"]["text"], "Submitted Form Data", allure.attachment_type.TEXT)
             
             # Close modal
             close_btn = self.driver.find_element(By.ID, "closeLargeModal")
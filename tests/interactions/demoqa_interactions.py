@@ -4,15 +4,19 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class DemoQAInteractions:
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_sortable(self):
         """Test Sortable functionality"""
@@ -32,7 +36,10 @@ class DemoQAInteractions:
         source = list_items[0]
         target = list_items[2]
         actions.drag_and_drop(source, target).perform()
-        time.sleep(1)
+        self.waits.until(
+            wc.text_changed((By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item"), initial_order[0]),
+            replaces=1
+        )
 
         # Verify order changed
         updated_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item")
@@ -45,7 +52,7 @@ class DemoQAInteractions:
         # Test Grid tab
         grid_tab = self.driver.find_element(By.ID, "demo-tab-grid")
         grid_tab.click()
-        time.sleep(1)
+        self.waits.until(wc.element_visible((By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item")), replaces=1)
 
         grid_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item")
         
@@ -53,8 +60,11 @@ class DemoQAInteractions:
         if len(grid_items) >= 2:
             source = grid_items[0]
             target = grid_items[-1]
+            first_text = source.text
             actions.drag_and_drop(source, target).perform()
-            time.sleep(1)
+            self.waits.settle(
+                wc.text_changed((By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item"), first_text), 1
+            )
             print("  ✓ Grid sortable tested")
 
         print("✓ Sortable test passed")
@@ -69,7 +79,7 @@ class DemoQAInteractions:
         
         # Select first item
         list_items[0].click()
-        time.sleep(0.5)
+        self.waits.until(wc.attribute_contains(list_items[0], "class", "active"), replaces=0.5)
         
         # Verify item is selected
         assert "active" in list_items[0].get_attribute("class")
@@ -78,7 +88,10 @@ class DemoQAInteractions:
         # Select multiple items with Ctrl
         actions = ActionChains(self.driver)
         actions.key_down(Keys.CONTROL).click(list_items[2]).key_up(Keys.CONTROL).perform()
-        time.sleep(0.5)
+        self.waits.until(
+            wc.element_count((By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item.active"), lambda n: n >= 2),
+            replaces=0.5
+        )
 
         # Verify multiple selection
         selected_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item.active")
@@ -88,16 +101,16 @@ class DemoQAInteractions:
         # Test Grid tab
         grid_tab = self.driver.find_element(By.ID, "demo-tab-grid")
         grid_tab.click()
-        time.sleep(1)
+        self.waits.until(wc.element_visible((By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item")), replaces=1)
 
         grid_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item")
         
         # Select grid items
         grid_items[0].click()
-        time.sleep(0.5)
+        self.waits.settle(wc.attribute_contains(grid_items[0], "class", "active"), 0.5)
         
         actions.key_down(Keys.CONTROL).click(grid_items[1]).key_up(Keys.CONTROL).perform()
-        time.sleep(0.5)
+        self.waits.settle(wc.attribute_contains(grid_items[1], "class", "active"), 0.5)
 
         selected_grid_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item.active")
         print(f"  ✓ Grid items selected: {len(selected_grid_items)}")
@@ -121,7 +134,7 @@ class DemoQAInteractions:
 
         # Resize the box
         actions.click_and_hold(resize_handle).move_by_offset(50, 30).release().perform()
-        time.sleep(1)
+        self.waits.until(wc.size_changed(resizable_box, initial_size), replaces=1)
 
         # Get new size
         new_size = resizable_box.size
@@ -140,7 +153,7 @@ class DemoQAInteractions:
 
         # Resize the box
         actions.click_and_hold(resize_handle2).move_by_offset(100, 50).release().perform()
-        time.sleep(1)
+        self.waits.settle(wc.size_changed(resizable_box2, initial_size2), 1)
 
         # Get new size
         new_size2 = resizable_box2.size
@@ -168,7 +181,7 @@ class DemoQAInteractions:
 
         # Perform drag and drop
         actions.drag_and_drop(draggable, droppable).perform()
-        time.sleep(1)
+        self.waits.until(wc.text_contains(droppable, "Dropped!"), replaces=1)
 
         # Verify drop was successful
         dropped_text = droppable.text
@@ -179,41 +192,42 @@ class DemoQAInteractions:
         # Test Accept tab
         accept_tab = self.driver.find_element(By.ID, "droppableExample-tab-accept")
         accept_tab.click()
-        time.sleep(1)
+        self.waits.until(wc.element_visible((By.ID, "acceptable")), replaces=1)
 
         acceptable = self.driver.find_element(By.ID, "acceptable")
         not_acceptable = self.driver.find_element(By.ID, "notAcceptable")
         drop_box = self.driver.find_element(By.CSS_SELECTOR, "#acceptDropContainer #droppable")
 
         # Try dropping acceptable item
+        initial_drop_text = drop_box.text
         actions.drag_and_drop(acceptable, drop_box).perform()
-        time.sleep(1)
+        self.waits.settle(wc.text_changed(drop_box, initial_drop_text), 1)
 
         drop_text = drop_box.text
         print(f"  Acceptable drop result: {drop_text}")
 
         # Try dropping not acceptable item
         actions.drag_and_drop(not_acceptable, drop_box).perform()
-        time.sleep(1)
+        self.waits.until(wc.element_settled(not_acceptable), replaces=1)
 
         print("  ✓ Accept tab tested")
 
         # Test Prevent Propagation tab
         prevent_tab = self.driver.find_element(By.ID, "droppableExample-tab-preventPropogation")
         prevent_tab.click()
-        time.sleep(1)
+        self.waits.until(wc.element_visible((By.ID, "dragBox")), replaces=1)
 
         drag_me = self.driver.find_element(By.ID, "dragBox")
         outer_drop = self.driver.find_element(By.ID, "notGreedyDropBox")
 
         actions.drag_and_drop(drag_me, outer_drop).perform()
-        time.sleep(1)
+        self.waits.until(wc.element_settled(drag_me), replaces=1)
         print("  ✓ Prevent Propagation tab tested")
 
         # Test Revert Draggable tab
         revert_tab = self.driver.find_element(By.ID, "droppableExample-tab-revertable")
         revert_tab.click()
-        time.sleep(1)
+        self.waits.until(wc.element_visible((By.ID, "revertable")), replaces=1)
 
         will_revert = self.driver.find_element(By.ID, "revertable")
         not_revert = self.driver.find_element(By.ID, "notRevertable")
@@ -221,7 +235,7 @@ class DemoQAInteractions:
 
         # Test revertable drag
         actions.drag_and_drop(will_revert, revert_drop).perform()
-        time.sleep(2)  # Wait for revert animation
+        self.waits.until(wc.element_settled(will_revert), replaces=2)  # Revert animation
 
         print("  ✓ Revert Draggable tab tested")
 
@@ -243,7 +257,7 @@ class DemoQAInteractions:
 
         # Drag the element
         actions.click_and_hold(simple_drag).move_by_offset(100, 50).release().perform()
-        time.sleep(1)
+        self.waits.until(wc.location_changed(simple_drag, initial_location), replaces=1)
 
         # Get new position
         new_location = simple_drag.location
@@ -255,14 +269,14 @@ class DemoQAInteractions:
         # Test Axis Restricted tab
         axis_tab = self.driver.find_element(By.ID, "draggableExample-tab-axisRestriction")
         axis_tab.click()
-        time.sleep(1)
+        self.waits.until(wc.element_visible((By.ID, "restrictedX")), replaces=1)
 
         # Test X-axis restricted drag
         x_restricted = self.driver.find_element(By.ID, "restrictedX")
         initial_x_pos = x_restricted.location
         
         actions.click_and_hold(x_restricted).move_by_offset(100, 0).release().perform()
-        time.sleep(1)
+        self.waits.settle(wc.location_changed(x_restricted, initial_x_pos), 1)
         
         new_x_pos = x_restricted.location
         print(f"  X-restricted drag: {initial_x_pos} -> {new_x_pos}")
@@ -272,7 +286,7 @@ class DemoQAInteractions:
         initial_y_pos = y_restricted.location
         
         actions.click_and_hold(y_restricted).move_by_offset(0, 50).release().perform()
-        time.sleep(1)
+        self.waits.settle(wc.location_changed(y_restricted, initial_y_pos), 1)
         
         new_y_pos = y_restricted.location
         print(f"  Y-restricted drag: {initial_y_pos} -> {new_y_pos}")
@@ -282,13 +296,13 @@ class DemoQAInteractions:
         # Test Container Restricted tab
         container_tab = self.driver.find_element(By.ID, "draggableExample-tab-containerRestriction")
         container_tab.click()
-        time.sleep(1)
+        self.waits.until(wc.element_visible((By.CSS_SELECTOR, "#containmentWrapper .draggable")), replaces=1)
 
         # Test container restricted drag
         container_restricted = self.driver.find_element(By.CSS_SELECTOR, "#containmentWrapper .draggable")
         
         actions.click_and_hold(container_restricted).move_by_offset(50, 30).release().perform()
-        time.sleep(1)
+        self.waits.until(wc.element_settled(container_restricted), replaces=1)
         
         print("  ✓ Container restricted drag tested")
 
@@ -306,7 +320,7 @@ class DemoQAInteractions:
         except Exception as e:
             print(f"\n❌ Test failed: {str(e)}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
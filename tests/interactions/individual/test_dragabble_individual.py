@@ -2,73 +2,36 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.chrome.options import Options
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.gestures import Gestures
+from utils.waits import Waiter, conditions as wc
 
 
 class DragabbleTest:
     """Individual test for Dragabble functionality"""
     
     def __init__(self):
-        # Configure Chrome options to block ads and improve interactions
-        chrome_options = Options()
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values": {
-                "notifications": 2,
-                "media_stream": 2,
-                "ads": 2,
-                "popups": 2
-            }
-        })
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 15)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=15)
+        self.gestures = Gestures(self.driver)
         
     def safe_drag(self, element, x_offset, y_offset):
-        """Safely perform drag operation with multiple strategies"""
+        """Drag element by an offset as one pointer action sequence"""
         try:
-            # Scroll element into view
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.5)
-            
-            # Try normal drag and drop
-            actions = ActionChains(self.driver)
-            actions.click_and_hold(element).move_by_offset(x_offset, y_offset).release().perform()
+            self.gestures.drag_by(element, x_offset, y_offset)
             return True
         except Exception:
-            try:
-                # Try with smaller offsets to avoid "move target out of bounds"
-                safe_x = max(-200, min(200, x_offset))
-                safe_y = max(-200, min(200, y_offset))
-                actions = ActionChains(self.driver)
-                actions.click_and_hold(element).move_by_offset(safe_x, safe_y).release().perform()
-                return True
-            except Exception:
-                try:
-                    # Try incremental moves
-                    actions = ActionChains(self.driver)
-                    actions.click_and_hold(element)
-                    steps = 3
-                    for i in range(steps):
-                        actions.move_by_offset(x_offset//steps, y_offset//steps).pause(0.2)
-                    actions.release().perform()
-                    return True
-                except Exception:
-                    return False
+            return False
                     
     def remove_ads(self):
         """Remove ad elements that might interfere with testing"""
         try:
-            time.sleep(2)
+            self.waits.until(wc.page_ready(), replaces=2)
             self.driver.execute_script("""
                 var ads = document.querySelectorAll('iframe[src*="googlesyndication"], iframe[id*="google_ads"], iframe[title*="Advertisement"]');
                 for(var i = 0; i < ads.length; i++) {
@@ -83,7 +46,6 @@ class DragabbleTest:
                     }
                 }
             """)
-            time.sleep(1)
         except Exception:
             pass
 
@@ -107,7 +69,7 @@ class DragabbleTest:
             else:
                 print("  ⚠️ Drag operation had issues, but continuing test")
             
-            time.sleep(1)  # Wait for drag animation
+            self.waits.until(wc.element_settled((By.ID, "dragBox")), replaces=1)  # Drag animation
             
             # Get new position (re-find element to avoid stale reference)
             try:
@@ -137,7 +99,7 @@ class DragabbleTest:
             else:
                 print("  ⚠️ Second drag operation had issues, but continuing test")
             
-            time.sleep(1)
+            self.waits.until(wc.element_settled((By.ID, "dragBox")), replaces=1)
             # Re-find element again
             try:
                 draggable = self.driver.find_element(By.ID, "dragBox")
@@ -177,7 +139,7 @@ class DragabbleTest:
             axis_tab.click()
             print("  ✓ Switched to Axis Restricted tab")
             
-            time.sleep(1)  # Wait for tab to load
+            self.waits.until(wc.element_visible((By.ID, "restrictedX")), replaces=1)
             
             # Test X-axis restricted drag
             x_restricted = self.driver.find_element(By.ID, "restrictedX")
@@ -190,7 +152,7 @@ class DragabbleTest:
             else:
                 print("  ⚠️ X-restricted drag had issues, but continuing test")
             
-            time.sleep(1)
+            self.waits.until(wc.element_settled(x_restricted), replaces=1)
             x_new_pos = x_restricted.location
             print(f"  ✓ X-restricted new position: {x_new_pos}")
             
@@ -209,7 +171,7 @@ class DragabbleTest:
             else:
                 print("  ⚠️ Y-restricted drag had issues, but continuing test")
             
-            time.sleep(1)
+            self.waits.until(wc.element_settled(y_restricted_elem), replaces=1)
             y_new_pos = y_restricted_elem.location
             print(f"  ✓ Y-restricted new position: {y_new_pos}")
             
@@ -236,7 +198,7 @@ class DragabbleTest:
             container_tab.click()
             print("  ✓ Switched to Container Restricted tab")
             
-            time.sleep(1)  # Wait for tab to load
+            self.waits.until(wc.element_visible((By.CSS_SELECTOR, "#containmentWrapper .ui-widget-content")), replaces=1)
             
             # Test container restricted drag
             container_restricted = self.driver.find_element(By.CSS_SELECTOR, "#containmentWrapper .ui-widget-content")
@@ -257,7 +219,7 @@ class DragabbleTest:
             else:
                 print("  ⚠️ Container drag had issues, but continuing test")
             
-            time.sleep(1)
+            self.waits.until(wc.element_settled(container_restricted), replaces=1)
             within_bounds_pos = container_restricted.location
             print(f"  ✓ Position after within-bounds drag: {within_bounds_pos}")
             
@@ -267,7 +229,7 @@ class DragabbleTest:
             else:
                 print("  ⚠️ Out-of-bounds drag had issues, but continuing test")
             
-            time.sleep(1)
+            self.waits.until(wc.element_settled(container_restricted), replaces=1)
             restricted_pos = container_restricted.location
             print(f"  ✓ Position after out-of-bounds drag attempt: {restricted_pos}")
             
@@ -298,7 +260,7 @@ class DragabbleTest:
             cursor_tab.click()
             print("  ✓ Switched to Cursor Style tab")
             
-            time.sleep(1)  # Wait for tab to load
+            self.waits.until(wc.element_visible((By.ID, "cursorCenter")), replaces=1)
             
             # Test center cursor style
             cursor_center = self.driver.find_element(By.ID, "cursorCenter")
@@ -321,7 +283,7 @@ class DragabbleTest:
             else:
                 print("  ⚠️ Center cursor drag had issues, but continuing test")
             
-            time.sleep(0.5)
+            self.waits.until(wc.element_settled(cursor_center), replaces=0.5)
             
             # Drag top-left cursor element
             if self.safe_drag(cursor_top_left, 60, 60):
@@ -329,7 +291,7 @@ class DragabbleTest:
             else:
                 print("  ⚠️ Top-left cursor drag had issues, but continuing test")
             
-            time.sleep(0.5)
+            self.waits.until(wc.element_settled(cursor_top_left), replaces=0.5)
             
             # Drag bottom cursor element
             if self.safe_drag(cursor_bottom, 40, 80):
@@ -337,7 +299,7 @@ class DragabbleTest:
             else:
                 print("  ⚠️ Bottom cursor drag had issues, but continuing test")
             
-            time.sleep(0.5)
+            self.waits.until(wc.element_settled(cursor_bottom), replaces=0.5)
             
             # Verify all elements moved (re-find elements to avoid stale reference)
             cursor_center = self.driver.find_element(By.ID, "cursorCenter")
@@ -402,7 +364,7 @@ class DragabbleTest:
         except Exception as e:
             print(f"❌ Dragabble test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
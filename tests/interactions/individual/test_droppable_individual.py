@@ -2,17 +2,22 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.gestures import Gestures
+from utils.waits import Waiter, conditions as wc
 
 
 class DroppableTest:
     """Individual test for Droppable functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_simple_droppable(self):
         """Test simple drag and drop functionality"""
@@ -34,11 +39,10 @@ class DroppableTest:
             print(f"  ✓ Initial droppable color: {initial_drop_color}")
             
             # Perform drag and drop
-            actions = ActionChains(self.driver)
-            actions.drag_and_drop(draggable, droppable).perform()
+            self.gestures.drag(draggable, droppable)
             print("  ✓ Performed drag and drop operation")
             
-            time.sleep(1)  # Wait for drop animation/effect
+            self.waits.until(wc.text_contains(droppable, "Dropped!"), replaces=1)
             
             # Check if drop was successful
             new_drop_text = droppable.text
@@ -69,7 +73,7 @@ class DroppableTest:
             accept_tab.click()
             print("  ✓ Switched to Accept tab")
             
-            time.sleep(1)  # Wait for tab to load
+            self.waits.until(wc.element_visible((By.ID, "acceptable")), replaces=1)
             
             # Find acceptable and not acceptable elements
             acceptable = self.driver.find_element(By.ID, "acceptable")
@@ -80,19 +84,18 @@ class DroppableTest:
             print(f"  ✓ Initial drop zone text: '{initial_drop_text}'")
             
             # Test with not acceptable element first
-            actions = ActionChains(self.driver)
-            actions.drag_and_drop(not_acceptable, drop_zone).perform()
+            self.gestures.drag(not_acceptable, drop_zone)
             print("  ✓ Attempted drop with not acceptable element")
             
-            time.sleep(1)
+            self.waits.until(wc.element_settled(not_acceptable), replaces=1)
             not_acceptable_result = drop_zone.text
             print(f"  ✓ Result after not acceptable drop: '{not_acceptable_result}'")
             
             # Test with acceptable element
-            actions.drag_and_drop(acceptable, drop_zone).perform()
+            self.gestures.drag(acceptable, drop_zone)
             print("  ✓ Attempted drop with acceptable element")
             
-            time.sleep(1)
+            self.waits.until(wc.text_contains(drop_zone, "Dropped!"), replaces=1)
             acceptable_result = drop_zone.text
             print(f"  ✓ Result after acceptable drop: '{acceptable_result}'")
             
@@ -117,7 +120,7 @@ class DroppableTest:
             prevent_tab.click()
             print("  ✓ Switched to Prevent Propagation tab")
             
-            time.sleep(1)  # Wait for tab to load
+            self.waits.until(wc.element_visible((By.CSS_SELECTOR, "#ppDropContainer #dragBox")), replaces=1)
             
             # Find elements
             draggable = self.driver.find_element(By.CSS_SELECTOR, "#ppDropContainer #dragBox")
@@ -132,11 +135,10 @@ class DroppableTest:
             print(f"  ✓ Inner drop initial: '{inner_initial}'")
             
             # Drop on inner element
-            actions = ActionChains(self.driver)
-            actions.drag_and_drop(draggable, inner_drop).perform()
+            self.gestures.drag(draggable, inner_drop)
             print("  ✓ Dropped on inner element")
             
-            time.sleep(1)
+            self.waits.until(wc.element_settled(draggable), replaces=1)
             
             # Check results
             outer_result = outer_drop.text
@@ -153,10 +155,10 @@ class DroppableTest:
             greedy_inner_initial = greedy_inner.text
             
             # Drop on greedy inner element
-            actions.drag_and_drop(draggable, greedy_inner).perform()
+            self.gestures.drag(draggable, greedy_inner)
             print("  ✓ Dropped on greedy inner element")
             
-            time.sleep(1)
+            self.waits.until(wc.element_settled(draggable), replaces=1)
             
             greedy_outer_result = greedy_outer.text
             greedy_inner_result = greedy_inner.text
@@ -182,7 +184,7 @@ class DroppableTest:
             revert_tab.click()
             print("  ✓ Switched to Revert Draggable tab")
             
-            time.sleep(1)  # Wait for tab to load
+            self.waits.until(wc.element_visible((By.ID, "revertable")), replaces=1)
             
             # Find elements
             will_revert = self.driver.find_element(By.ID, "revertable")
@@ -197,21 +199,20 @@ class DroppableTest:
             print(f"  ✓ Not revert initial position: {not_revert_initial_pos}")
             
             # Test revertable element - drag to drop zone
-            actions = ActionChains(self.driver)
-            actions.drag_and_drop(will_revert, drop_zone).perform()
+            self.gestures.drag(will_revert, drop_zone)
             print("  ✓ Dropped revertable element")
             
-            time.sleep(2)  # Wait for revert animation
+            self.waits.until(wc.element_settled(will_revert), replaces=2)  # Revert animation
             
             # Check if element reverted
             will_revert_final_pos = will_revert.location
             print(f"  ✓ Will revert final position: {will_revert_final_pos}")
             
             # Test non-revertable element
-            actions.drag_and_drop(not_revert, drop_zone).perform()
+            self.gestures.drag(not_revert, drop_zone)
             print("  ✓ Dropped non-revertable element")
             
-            time.sleep(2)
+            self.waits.until(wc.element_settled(not_revert), replaces=2)
             
             not_revert_final_pos = not_revert.location
             print(f"  ✓ Not revert final position: {not_revert_final_pos}")
@@ -256,7 +257,7 @@ class DroppableTest:
         except Exception as e:
             print(f"❌ Droppable test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
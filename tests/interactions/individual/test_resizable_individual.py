@@ -3,70 +3,36 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.chrome.options import Options
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.gestures import Gestures
+from utils.waits import Waiter, conditions as wc
 
 
 class ResizableTest:
     """Individual test for Resizable functionality"""
     
     def __init__(self):
-        # Configure Chrome options to block ads and improve interactions
-        chrome_options = Options()
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values": {
-                "notifications": 2,
-                "media_stream": 2,
-                "ads": 2,
-                "popups": 2
-            }
-        })
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 15)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=15)
+        self.gestures = Gestures(self.driver)
         
     def safe_drag(self, element, x_offset, y_offset):
-        """Safely perform drag operation with multiple strategies"""
+        """Drag element by an offset as one pointer action sequence"""
         try:
-            # Scroll element into view
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.5)
-            
-            # Try normal drag and drop
-            actions = ActionChains(self.driver)
-            actions.click_and_hold(element).move_by_offset(x_offset, y_offset).release().perform()
+            self.gestures.drag_by(element, x_offset, y_offset)
             return True
         except Exception:
-            try:
-                # Try with pause between actions
-                actions = ActionChains(self.driver)
-                actions.click_and_hold(element).pause(0.5).move_by_offset(x_offset, y_offset).pause(0.5).release().perform()
-                return True
-            except Exception:
-                try:
-                    # Try smaller incremental moves
-                    actions = ActionChains(self.driver)
-                    actions.click_and_hold(element)
-                    steps = 5
-                    for i in range(steps):
-                        actions.move_by_offset(x_offset//steps, y_offset//steps).pause(0.1)
-                    actions.release().perform()
-                    return True
-                except Exception:
-                    return False
+            return False
                     
     def remove_ads(self):
         """Remove ad elements that might interfere with testing"""
         try:
-            time.sleep(2)
+            self.waits.until(wc.page_ready(), replaces=2)
             self.driver.execute_script("""
                 var ads = document.querySelectorAll('iframe[src*="googlesyndication"], iframe[id*="google_ads"], iframe[title*="Advertisement"]');
                 for(var i = 0; i < ads.length; i++) {
@@ -81,7 +47,6 @@ class ResizableTest:
                     }
                 }
             """)
-            time.sleep(1)
         except Exception:
             pass
 
@@ -107,7 +72,7 @@ class ResizableTest:
             else:
                 print("  ⚠️ Resize operation had issues, but continuing test")
             
-            time.sleep(1)  # Wait for resize animation
+            self.waits.until(wc.element_settled(resizable_box), replaces=1)  # Resize animation
             
             # Check new size
             new_size = resizable_box.size
@@ -127,7 +92,7 @@ class ResizableTest:
                 print("  ✓ Performed large resize operation")
             else:
                 print("  ⚠️ Large resize operation had issues, but continuing test")
-            time.sleep(1)
+            self.waits.until(wc.element_settled(resizable_box), replaces=1)
             
             constrained_size = resizable_box.size
             print(f"  ✓ Size after large resize attempt: {constrained_size}")
@@ -161,7 +126,7 @@ class ResizableTest:
             else:
                 print("  ⚠️ Resize operation had issues, but continuing test")
             
-            time.sleep(1)  # Wait for resize animation
+            self.waits.until(wc.element_settled(resizable_element), replaces=1)  # Resize animation
             
             # Check new size
             new_size = resizable_element.size
@@ -176,7 +141,7 @@ class ResizableTest:
                 print("  ✓ Performed shrinking operation")
             else:
                 print("  ⚠️ Shrinking operation had issues, but continuing test")
-            time.sleep(1)
+            self.waits.until(wc.element_settled(resizable_element), replaces=1)
             
             shrunk_size = resizable_element.size
             print(f"  ✓ Size after shrinking: {shrunk_size}")
@@ -225,7 +190,7 @@ class ResizableTest:
                     print("  ✓ Performed precise resize")
                 else:
                     print("  ⚠️ Precise resize had issues, but continuing test")
-                time.sleep(0.5)
+                self.waits.until(wc.element_settled(resizable_box), replaces=0.5)
                 
                 final_size = resizable_box.size
                 print(f"  ✓ Final size after handle test: {final_size}")
@@ -260,7 +225,7 @@ class ResizableTest:
                 print("  ✓ Performed minimum resize operation")
             else:
                 print("  ⚠️ Minimum resize operation had issues, but continuing test")
-            time.sleep(1)
+            self.waits.until(wc.element_settled(resizable_box), replaces=1)
             
             min_size = resizable_box.size
             print(f"  ✓ Size after minimum resize attempt: {min_size}")
@@ -270,7 +235,7 @@ class ResizableTest:
                 print("  ✓ Performed maximum resize operation")
             else:
                 print("  ⚠️ Maximum resize operation had issues, but continuing test")
-            time.sleep(1)
+            self.waits.until(wc.element_settled(resizable_box), replaces=1)
             
             max_size = resizable_box.size
             print(f"  ✓ Size after maximum resize attempt: {max_size}")
@@ -327,7 +292,7 @@ class ResizableTest:
         except Exception as e:
             print(f"❌ Resizable test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
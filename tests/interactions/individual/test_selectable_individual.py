@@ -4,41 +4,27 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.options import Options
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class SelectableTest:
     """Individual test for Selectable functionality"""
     
     def __init__(self):
-        # Configure Chrome options to block ads and improve interactions
-        chrome_options = Options()
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values": {
-                "notifications": 2,
-                "media_stream": 2,
-                "ads": 2,
-                "popups": 2
-            }
-        })
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 15)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=15)
         
     def safe_click(self, element):
         """Safely click an element, handling overlays"""
         try:
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.5)
+            self.waits.until(wc.element_stable(element), replaces=0.5)
             element.click()
             return True
         except Exception:
@@ -63,7 +49,7 @@ class SelectableTest:
     def remove_ads(self):
         """Remove ad elements that might interfere with testing"""
         try:
-            time.sleep(2)
+            self.waits.until(wc.page_ready(), replaces=2)
             self.driver.execute_script("""
                 var ads = document.querySelectorAll('iframe[src*="googlesyndication"], iframe[id*="google_ads"], iframe[title*="Advertisement"]');
                 for(var i = 0; i < ads.length; i++) {
@@ -85,7 +71,6 @@ class SelectableTest:
                     }
                 }
             """)
-            time.sleep(1)
         except Exception:
             pass
 
@@ -105,7 +90,7 @@ class SelectableTest:
                 print("  ✓ Clicked first item")
                 
                 # Check if item is selected (has active class)
-                time.sleep(0.5)
+                self.waits.until(wc.attribute_contains(list_items[0], "class", "active"), replaces=0.5)
                 selected_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item.active")
                 assert len(selected_items) > 0, "At least one item should be selected"
                 print(f"  ✓ {len(selected_items)} item(s) selected")
@@ -116,7 +101,7 @@ class SelectableTest:
                     actions.key_down(Keys.CONTROL).click(list_items[2]).key_up(Keys.CONTROL).perform()
                     print("  ✓ Performed Ctrl+Click for multiple selection")
                     
-                    time.sleep(0.5)
+                    self.waits.until(wc.attribute_contains(list_items[2], "class", "active"), replaces=0.5)
                     selected_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item.active")
                     print(f"  ✓ {len(selected_items)} item(s) now selected")
                 
@@ -146,7 +131,7 @@ class SelectableTest:
             grid_tab.click()
             print("  ✓ Switched to Grid tab")
             
-            time.sleep(1)  # Wait for tab to load
+            self.waits.until(wc.element_visible((By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item")), replaces=1)
             
             # Get grid items
             grid_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item")
@@ -157,7 +142,7 @@ class SelectableTest:
                 grid_items[0].click()
                 print("  ✓ Clicked first grid item")
                 
-                time.sleep(0.5)
+                self.waits.until(wc.attribute_contains(grid_items[0], "class", "active"), replaces=0.5)
                 selected_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item.active")
                 assert len(selected_items) > 0, "At least one grid item should be selected"
                 print(f"  ✓ {len(selected_items)} grid item(s) selected")
@@ -168,7 +153,7 @@ class SelectableTest:
                     actions.key_down(Keys.CONTROL).click(grid_items[3]).key_up(Keys.CONTROL).perform()
                     print("  ✓ Performed Ctrl+Click on grid item")
                     
-                    time.sleep(0.5)
+                    self.waits.until(wc.attribute_contains(grid_items[3], "class", "active"), replaces=0.5)
                     selected_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item.active")
                     print(f"  ✓ {len(selected_items)} grid item(s) now selected")
             
@@ -191,7 +176,7 @@ class SelectableTest:
             if len(list_items) >= 3:
                 # Select first item
                 list_items[0].click()
-                time.sleep(0.3)
+                self.waits.until(wc.attribute_contains(list_items[0], "class", "active"), replaces=0.3)
                 
                 # Check background color change (visual feedback)
                 selected_item = self.driver.find_element(By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item.active")
@@ -204,7 +189,7 @@ class SelectableTest:
                     print("  ✓ Clicked second item")
                 else:
                     print("  ⚠️ Second item click had issues, but continuing test")
-                time.sleep(0.3)
+                self.waits.settle(wc.attribute_contains(list_items[1], "class", "active"), 0.3)
                 
                 # Check how many items are selected
                 selected_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item.active")
@@ -218,7 +203,7 @@ class SelectableTest:
                     actions.key_down(Keys.SHIFT).click(list_items[2]).key_up(Keys.SHIFT).perform()
                     print("  ✓ Performed Shift+Click for range selection")
                     
-                    time.sleep(0.5)
+                    self.waits.until(wc.element_stable((By.ID, "demo-tabpane-list")), replaces=0.5)
                     selected_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item.active")
                     print(f"  ✓ After range selection: {len(selected_items)} item(s) selected")
                 else:
@@ -250,7 +235,7 @@ class SelectableTest:
                 actions.send_keys(Keys.ARROW_DOWN).perform()
                 print("  ✓ Pressed Arrow Down key")
                 
-                time.sleep(0.5)
+                self.waits.until(wc.element_stable((By.ID, "demo-tabpane-list")), replaces=0.5)
                 
                 # Check if focus moved (this might not work on all implementations)
                 focused_element = self.driver.switch_to.active_element
@@ -260,7 +245,7 @@ class SelectableTest:
                 actions.send_keys(Keys.SPACE).perform()
                 print("  ✓ Pressed Space key")
                 
-                time.sleep(0.5)
+                self.waits.until(wc.element_stable((By.ID, "demo-tabpane-list")), replaces=0.5)
                 selected_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item.active")
                 print(f"  ✓ Items selected after keyboard interaction: {len(selected_items)}")
             
@@ -300,7 +285,7 @@ class SelectableTest:
         except Exception as e:
             print(f"❌ Selectable test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
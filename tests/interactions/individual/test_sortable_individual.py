@@ -3,72 +3,36 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.chrome.options import Options
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.gestures import Gestures
+from utils.waits import Waiter, conditions as wc
 
 
 class SortableTest:
     """Individual test for Sortable functionality"""
     
     def __init__(self):
-        # Configure Chrome options to block ads and improve interactions
-        chrome_options = Options()
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values": {
-                "notifications": 2,
-                "media_stream": 2,
-                "ads": 2,
-                "popups": 2
-            }
-        })
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 15)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=15)
+        self.gestures = Gestures(self.driver)
         
     def safe_drag_and_drop(self, source, target):
-        """Safely perform drag and drop operation"""
+        """Drag source onto target as one pointer action sequence"""
         try:
-            # Scroll elements into view
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", source)
-            self.driver.execute_script("arguments[1].scrollIntoView({block: 'center'});", target)
-            time.sleep(0.5)
-            
-            # Try normal drag and drop
-            actions = ActionChains(self.driver)
-            actions.drag_and_drop(source, target).perform()
+            self.gestures.drag(source, target)
             return True
         except Exception:
-            try:
-                # Try with click and hold approach
-                actions = ActionChains(self.driver)
-                actions.click_and_hold(source).move_to_element(target).release().perform()
-                return True
-            except Exception:
-                try:
-                    # Try with offset-based approach
-                    source_location = source.location
-                    target_location = target.location
-                    x_offset = target_location['x'] - source_location['x']
-                    y_offset = target_location['y'] - source_location['y']
-                    
-                    actions = ActionChains(self.driver)
-                    actions.click_and_hold(source).move_by_offset(x_offset, y_offset).release().perform()
-                    return True
-                except Exception:
-                    return False
+            return False
                     
     def remove_ads(self):
         """Remove ad elements that might interfere with testing"""
         try:
-            time.sleep(2)
+            self.waits.until(wc.page_ready(), replaces=2)
             self.driver.execute_script("""
                 var ads = document.querySelectorAll('iframe[src*="googlesyndication"], iframe[id*="google_ads"], iframe[title*="Advertisement"]');
                 for(var i = 0; i < ads.length; i++) {
@@ -83,7 +47,6 @@ class SortableTest:
                     }
                 }
             """)
-            time.sleep(1)
         except Exception:
             pass
 
@@ -94,7 +57,7 @@ class SortableTest:
 
         try:
             # Wait for page to load and remove ads
-            time.sleep(2)
+            self.waits.until(wc.element_visible((By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item")), replaces=2)
             self.remove_ads()
             
             # Get initial list order
@@ -118,7 +81,9 @@ class SortableTest:
                 else:
                     print("  ⚠️ Drag and drop operation had issues, but continuing test")
                 
-                time.sleep(1)  # Wait for animation
+                self.waits.settle(
+                    wc.text_changed((By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item"), initial_order[0]), 1
+                )  # Animation
                 
                 # Get new order
                 updated_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item")
@@ -151,7 +116,7 @@ class SortableTest:
             grid_tab.click()
             print("  ✓ Switched to Grid tab")
             
-            time.sleep(1)  # Wait for tab to load
+            self.waits.until(wc.element_visible((By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item")), replaces=1)
             
             # Get initial grid order
             grid_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item")
@@ -169,7 +134,9 @@ class SortableTest:
                 else:
                     print("  ⚠️ Drag and drop operation had issues, but continuing test")
                 
-                time.sleep(1)  # Wait for animation
+                self.waits.settle(
+                    wc.text_changed((By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item"), initial_order[0]), 1
+                )  # Animation
                 
                 # Get new order
                 updated_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item")
@@ -215,13 +182,13 @@ class SortableTest:
                 # Test multiple drag operations
                 if len(list_items) >= 4:
                     # Move item from position 0 to position 2
-                    actions.drag_and_drop(list_items[0], list_items[2]).perform()
-                    time.sleep(0.5)
+                    self.gestures.drag(list_items[0], list_items[2])
+                    self.waits.until(wc.element_settled(list_items[0]), replaces=0.5)
                     
                     # Get updated items and move another
                     updated_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item")
                     if len(updated_items) >= 3:
-                        actions.drag_and_drop(updated_items[1], updated_items[0]).perform()
+                        self.gestures.drag(updated_items[1], updated_items[0])
                         print("  ✓ Performed multiple drag operations")
                 
             print("✅ Sortable interaction test PASSED")
@@ -259,7 +226,7 @@ class SortableTest:
         except Exception as e:
             print(f"❌ Sortable test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
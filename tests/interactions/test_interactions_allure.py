@@ -6,7 +6,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
+from utils.waits import Waiter, conditions as wc
 
 
 @allure.epic("DemoQA Automation")
@@ -15,14 +15,13 @@ class TestInteractions:
     """Allure test suite for Interactions functionality"""
 
     @pytest.fixture(autouse=True)
-    def setup_method(self):
+    def setup_method(self, driver):
         """Setup method to initialize WebDriver"""
-        self.driver = webdriver.Chrome()
+        self.driver = driver
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
         self.actions = ActionChains(self.driver)
         yield
-        self.driver.quit()
 
     @allure.story("Sortable")
     @allure.title("Test List Sortable Functionality")
@@ -46,7 +45,10 @@ class TestInteractions:
                 target = list_items[1]
                 
                 self.actions.drag_and_drop(source, target).perform()
-                time.sleep(2)
+                self.waits.until(
+                    wc.text_changed((By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item"), initial_order[0]),
+                    replaces=2
+                )
                 
                 # Get new order
                 updated_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item")
@@ -82,7 +84,9 @@ class TestInteractions:
                 target = grid_items[-1]
                 
                 self.actions.drag_and_drop(source, target).perform()
-                time.sleep(2)
+                self.waits.settle(
+                    wc.text_changed((By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item"), initial_order[0]), 2
+                )
                 
                 updated_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item")
                 new_order = [item.text for item in updated_items]
@@ -107,7 +111,7 @@ class TestInteractions:
             if list_items:
                 first_item = list_items[0]
                 first_item.click()
-                time.sleep(1)
+                self.waits.settle(wc.attribute_contains(first_item, "class", "active"), 1)
                 
                 # Check if item is selected (usually has 'active' class)
                 item_classes = first_item.get_attribute("class")
@@ -116,7 +120,7 @@ class TestInteractions:
         with allure.step("Select multiple items with Ctrl"):
             if len(list_items) >= 3:
                 self.actions.key_down(Keys.CONTROL).click(list_items[1]).click(list_items[2]).key_up(Keys.CONTROL).perform()
-                time.sleep(1)
+                self.waits.settle(wc.attribute_contains(list_items[2], "class", "active"), 1)
                 
                 # Count selected items
                 selected_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-list .list-group-item.active")
@@ -143,7 +147,7 @@ class TestInteractions:
             if grid_items:
                 # Select first grid item
                 grid_items[0].click()
-                time.sleep(1)
+                self.waits.settle(wc.attribute_contains(grid_items[0], "class", "active"), 1)
                 
                 selected_items = self.driver.find_elements(By.CSS_SELECTOR, "#demo-tabpane-grid .list-group-item.active")
                 allure.attach(f"Selected {len(selected_items)} grid items", "Grid Selection", allure.attachment_type.TEXT)
@@ -169,7 +173,7 @@ class TestInteractions:
                 
                 # Perform resize operation
                 self.actions.click_and_hold(resize_handle).move_by_offset(50, 50).release().perform()
-                time.sleep(2)
+                self.waits.until(wc.size_changed(resizable_box, initial_size), replaces=2)
                 
                 # Get new size
                 new_size = resizable_box.size
@@ -198,7 +202,7 @@ class TestInteractions:
                 # Try to find and use resize handle
                 resize_handle = self.driver.find_element(By.CSS_SELECTOR, "#resizable .react-resizable-handle")
                 self.actions.click_and_hold(resize_handle).move_by_offset(30, 30).release().perform()
-                time.sleep(2)
+                self.waits.settle(wc.size_changed(resizable_element, initial_size), 2)
                 
                 new_size = resizable_element.size
                 allure.attach(str(new_size), "New Unrestricted Size", allure.attachment_type.TEXT)
@@ -226,7 +230,7 @@ class TestInteractions:
             
         with allure.step("Perform drag and drop"):
             self.actions.drag_and_drop(draggable, droppable).perform()
-            time.sleep(2)
+            self.waits.until(wc.text_changed(droppable, initial_droppable_text), replaces=2)
             
         with allure.step("Verify drop success"):
             final_droppable_text = droppable.text
@@ -247,7 +251,7 @@ class TestInteractions:
             try:
                 accept_tab = self.wait.until(EC.element_to_be_clickable((By.ID, "droppableExample-tab-accept")))
                 accept_tab.click()
-                time.sleep(1)
+                self.waits.until(wc.element_visible((By.ID, "acceptable")), replaces=1)
                 
                 # Find acceptable and not acceptable elements
                 acceptable = self.driver.find_element(By.ID, "acceptable")
@@ -259,14 +263,14 @@ class TestInteractions:
                 
                 # Try dropping not acceptable element
                 self.actions.drag_and_drop(not_acceptable, drop_zone).perform()
-                time.sleep(1)
+                self.waits.until(wc.element_settled(not_acceptable), replaces=1)
                 
                 after_invalid_drop = drop_zone.text
                 allure.attach(after_invalid_drop, "After Invalid Drop", allure.attachment_type.TEXT)
                 
                 # Try dropping acceptable element
                 self.actions.drag_and_drop(acceptable, drop_zone).perform()
-                time.sleep(1)
+                self.waits.settle(wc.text_changed(drop_zone, after_invalid_drop), 1)
                 
                 after_valid_drop = drop_zone.text
                 allure.attach(after_valid_drop, "After Valid Drop", allure.attachment_type.TEXT)
@@ -291,7 +295,7 @@ class TestInteractions:
             
         with allure.step("Perform drag operation"):
             self.actions.click_and_hold(draggable).move_by_offset(100, 50).release().perform()
-            time.sleep(2)
+            self.waits.until(wc.location_changed(draggable, initial_location), replaces=2)
             
         with allure.step("Verify position changed"):
             new_location = draggable.location
@@ -312,14 +316,14 @@ class TestInteractions:
             try:
                 axis_tab = self.wait.until(EC.element_to_be_clickable((By.ID, "draggableExample-tab-axisRestriction")))
                 axis_tab.click()
-                time.sleep(1)
+                self.waits.until(wc.element_visible((By.ID, "restrictedX")), replaces=1)
                 
                 # Test X-axis restricted drag
                 x_restricted = self.driver.find_element(By.ID, "restrictedX")
                 initial_x_pos = x_restricted.location
                 
                 self.actions.click_and_hold(x_restricted).move_by_offset(100, 50).release().perform()
-                time.sleep(1)
+                self.waits.settle(wc.location_changed(x_restricted, initial_x_pos), 1)
                 
                 new_x_pos = x_restricted.location
                 allure.attach(f"X-restricted: {initial_x_pos} -> {new_x_pos}", "X-Axis Movement", allure.attachment_type.TEXT)
@@ -329,7 +333,7 @@ class TestInteractions:
                 initial_y_pos = y_restricted.location
                 
                 self.actions.click_and_hold(y_restricted).move_by_offset(50, 100).release().perform()
-                time.sleep(1)
+                self.waits.settle(wc.location_changed(y_restricted, initial_y_pos), 1)
                 
                 new_y_pos = y_restricted.location
                 allure.attach(f"Y-restricted: {initial_y_pos} -> {new_y_pos}", "Y-Axis Movement", allure.attachment_type.TEXT)
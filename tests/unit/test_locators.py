@@ -0,0 +1,52 @@
+"""XPath to CSS locator compilation."""
+
+import pytest
+from selenium.webdriver.common.by import By
+from utils.locators import compile_locator, xpath_to_css
+
+
+class TestXpathToCss:
+    """Rewrites that keep the meaning, and XPath that has to stay XPath."""
+
+    @pytest.mark.parametrize("xpath, css", [
+        ("//label[@for='yesRadio']", 'label[for="yesRadio"]'),
+        ("//div[contains(@class, 'card')]", 'div[class*="card"]'),
+        ("//input[starts-with(@id, 'react')]", 'input[id^="react"]'),
+        ("//div[@id='app']//button[@type='submit']", 'div[id="app"] button[type="submit"]'),
+        ("//ul/li", "ul > li"),
+    ])
+    def test_attribute_paths(self, xpath, css):
+        assert xpath_to_css(xpath) == css
+
+    @pytest.mark.parametrize("xpath, css", [
+        ("//ul/li[3]", "ul > li:nth-of-type(3)"),
+        ("//*[2]", "*:nth-child(2)"),
+        ("//div[@class='card mt-4 top-card'][2]", ':nth-child(2 of div[class="card mt-4 top-card"])'),
+    ])
+    def test_positional(self, xpath, css):
+        assert xpath_to_css(xpath) == css
+
+    def test_union(self):
+        assert xpath_to_css("//h1 | //h2[@class='title']") == 'h1, h2[class="title"]'
+
+    def test_union_with_an_xpath_only_branch_is_rejected(self):
+        assert xpath_to_css("//h1 | //h2[text()='Title']") is None
+
+    @pytest.mark.parametrize("xpath", [
+        "//span[text()='Submit']",
+        "//button[contains(text(), 'Add')]",
+        "//div[@id='app']/..",
+        "//li[last()]",
+        "//input[@id='a' or @id='b']",
+        "//div[contains(@class, '')]",
+        "(//div)[2]",
+    ])
+    def test_xpath_only_features_are_rejected(self, xpath):
+        assert xpath_to_css(xpath) is None
+
+    def test_compile_locator_keeps_rejected_xpath(self):
+        locator = (By.XPATH, "//span[text()='Submit']")
+        assert compile_locator(locator) == locator
+
+    def test_compile_locator_rewrites_to_css(self):
+        assert compile_locator((By.XPATH, "//label[@for='x']")) == (By.CSS_SELECTOR, 'label[for="x"]')
@@ -0,0 +1,31 @@
+"""Per-command latency histogram of the remote executor."""
+
+from utils.remote_executor import LatencyHistogram
+
+
+class TestLatencyHistogram:
+    """Bucketing and the summary written per worker."""
+
+    def test_bucket_bounds_are_inclusive(self):
+        histogram = LatencyHistogram()
+        for seconds in (0.0005, 0.001, 0.0015, 0.05, 0.051, 6):
+            histogram.record("findElement", seconds)
+        assert histogram.summary()["findElement"]["histogram"] == {
+            "<=1ms": 2, "<=2ms": 1, "<=50ms": 1, "<=100ms": 1, ">5000ms": 1,
+        }
+
+    def test_summary_statistics_slowest_command_first(self):
+        histogram = LatencyHistogram()
+        histogram.record("getTitle", 0.002)
+        histogram.record("get", 0.1)
+        histogram.record("get", 0.3)
+        summary = histogram.summary()
+        assert list(summary) == ["get", "getTitle"]
+        assert summary["get"]["count"] == 2
+        assert summary["get"]["mean_ms"] == 200.0
+        assert summary["get"]["max_ms"] == 300.0
+
+    def test_save_skips_an_empty_histogram(self, tmp_path):
+        path = tmp_path / "latency" / "gw0.json"
+        LatencyHistogram().save(str(path))
+        assert not path.exists()
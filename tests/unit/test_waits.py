@@ -0,0 +1,85 @@
+"""Wait polling schedule and learned per-locator timeouts."""
+
+from itertools import islice
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from config.config import Config
+from utils.waits.strategy import FIXED_HALF_SECOND, WaitStrategy
+from utils.waits.timeouts import AdaptiveTimeouts, percentile
+
+
+class TestWaitStrategy:
+    """Backoff schedule and polling."""
+
+    def test_intervals_back_off_to_the_cap(self):
+        strategy = WaitStrategy(initial_interval=0.025, backoff=2, max_interval=0.2)
+        assert list(islice(strategy.intervals(), 6)) == [0.025, 0.05, 0.1, 0.2, 0.2, 0.2]
+
+    def test_fixed_schedule(self):
+        assert list(islice(FIXED_HALF_SECOND.intervals(), 3)) == [0.5, 0.5, 0.5]
+
+    def test_overrides_ignore_none(self):
+        strategy = WaitStrategy(timeout=10)
+        assert strategy.with_overrides(timeout=None, initial_interval=None) is strategy
+        assert strategy.with_overrides(timeout=2).timeout == 2
+
+    def test_until_returns_the_value_and_swallows_transient_errors(self):
+        calls = []
+
+        def condition(driver):
+            calls.append(driver)
+            if len(calls) == 1:
+                raise NoSuchElementException()
+            return "found" if len(calls) == 3 else None
+
+        strategy = WaitStrategy(timeout=1, initial_interval=0.001, backoff=2, max_interval=0.01)
+        assert strategy.until("driver", condition) == "found"
+        assert len(calls) == 3
+
+    def test_until_times_out(self):
+        strategy = WaitStrategy(timeout=0.05, initial_interval=0.01, backoff=1, max_interval=0.01)
+        with pytest.raises(TimeoutException, match="never"):
+            strategy.until(None, lambda driver: False, "never")
+
+
+class TestAdaptiveTimeouts:
+    """p99 x safety factor, floored at the minimum and capped at the default."""
+
+    @pytest.fixture(autouse=True)
+    def history(self, monkeypatch):
+        monkeypatch.setattr(Config, "ADAPTIVE_TIMEOUTS", True)
+        monkeypatch.setattr(Config, "ADAPTIVE_MIN_SAMPLES", 5)
+        monkeypatch.setattr(Config, "ADAPTIVE_SAFETY_FACTOR", 3)
+        monkeypatch.setattr(Config, "ADAPTIVE_MIN_TIMEOUT", 2)
+        history = {}
+        monkeypatch.setattr(AdaptiveTimeouts, "_history", history)
+        return history
+
+    def test_percentile_is_nearest_rank(self):
+        samples = list(range(1, 101))
+        assert percentile(samples, 99) == 99
+        assert percentile(samples, 50) == 50
+        assert percentile([7], 99) == 7
+
+    def test_default_until_enough_samples(self, history):
+        history["key"] = [0.1] * 4
+        assert AdaptiveTimeouts.timeout_for("key", 10) == 10
+
+    def test_p99_times_safety_factor(self, history):
+        # The single 4 s outlier is above the 99th percentile
+        history["key"] = [1.0] * 99 + [4.0]
+        assert AdaptiveTimeouts.timeout_for("key", 10) == 3.0
+
+    def test_floor(self, history):
+        history["key"] = [0.1] * 10
+        assert AdaptiveTimeouts.timeout_for("key", 10) == 2
+
+    def test_capped_at_default(self, history):
+        history["key"] = [5.0] * 10
+        assert AdaptiveTimeouts.timeout_for("key", 10) == 10
+
+    def test_disabled(self, history, monkeypatch):
+        monkeypatch.setattr(Config, "ADAPTIVE_TIMEOUTS", False)
+        history["key"] = [0.1] * 10
+        assert AdaptiveTimeouts.timeout_for("key", 10) == 10
@@ -0,0 +1,56 @@
+"""Queries on the columnar WebTable model."""
+
+import pytest
+from utils.web_table import WebTable
+
+COLUMNS = ["First Name", "Last Name", "Age", "Salary", "Department"]
+ROWS = [
+    ["Cierra", "Vega", "39", "10000", "Insurance"],
+    ["Alden", "Cantrell", "45", "12000", "Compliance"],
+    ["Kierra", "Gentry", "29", "2000", "Legal"],
+]
+
+
+@pytest.fixture
+def table():
+    return WebTable.from_rows(COLUMNS, ROWS, pages=2)
+
+
+class TestWebTable:
+    """Building from rows and answering column, row and filter queries."""
+
+    def test_from_rows_is_column_oriented(self, table):
+        assert len(table) == 3
+        assert table.pages == 2
+        assert table.column("Age") == ["39", "45", "29"]
+        assert table.row(1) == dict(zip(COLUMNS, ROWS[1]))
+
+    def test_short_rows_are_padded(self):
+        table = WebTable.from_rows(["A", "B"], [["1"], ["2", "3"]])
+        assert table.column("B") == ["", "3"]
+
+    def test_empty_table(self):
+        table = WebTable.from_rows([], [])
+        assert len(table) == 0
+        assert table.rows() == []
+
+    def test_where_matches_columns_with_spaces(self, table):
+        assert table.where(First_Name="Alden").column("Last Name") == ["Cantrell"]
+        assert len(table.where(Department="Legal", Age=29)) == 1
+        assert len(table.where(Department="Legal", Age=30)) == 0
+
+    def test_search_is_case_insensitive_over_every_cell(self, table):
+        assert table.search("ierra").column("First Name") == ["Cierra", "Kierra"]
+        assert table.search("COMPLIANCE").column("First Name") == ["Alden"]
+
+    def test_filter(self, table):
+        assert table.filter(lambda row: int(row["Age"]) > 30).column("First Name") == ["Cierra", "Alden"]
+
+    def test_sort_by_is_numeric_when_every_value_is_a_number(self, table):
+        assert table.sort_by("Salary").column("Salary") == ["2000", "10000", "12000"]
+        assert table.sort_by("Last Name", reverse=True).column("Last Name") == ["Vega", "Gentry", "Cantrell"]
+
+    def test_is_sorted(self, table):
+        assert not table.is_sorted("Salary")
+        assert table.sort_by("Salary").is_sorted("Salary")
+        assert table.sort_by("Age", reverse=True).is_sorted("Age", reverse=True)
@@ -5,15 +5,19 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import Select
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class DemoQAWidgets:
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_accordian(self):
         """Test Accordian functionality"""
@@ -23,7 +27,7 @@ class DemoQAWidgets:
         # Test first accordian
         first_accordian = self.driver.find_element(By.ID, "section1Heading")
         first_accordian.click()
-        time.sleep(1)
+        self.waits.until(wc.element_settled((By.ID, "section1Content")), replaces=1)
 
         first_content = self.driver.find_element(By.ID, "section1Content")
         assert first_content.is_displayed()
@@ -32,7 +36,7 @@ class DemoQAWidgets:
         # Test second accordian
         second_accordian = self.driver.find_element(By.ID, "section2Heading")
         second_accordian.click()
-        time.sleep(1)
+        self.waits.until(wc.element_settled((By.ID, "section2Content")), replaces=1)
 
         second_content = self.driver.find_element(By.ID, "section2Content")
         assert second_content.is_displayed()
@@ -41,7 +45,7 @@ class DemoQAWidgets:
         # Test third accordian
         third_accordian = self.driver.find_element(By.ID, "section3Heading")
         third_accordian.click()
-        time.sleep(1)
+        self.waits.until(wc.element_settled((By.ID, "section3Content")), replaces=1)
 
         third_content = self.driver.find_element(By.ID, "section3Content")
         assert third_content.is_displayed()
@@ -57,7 +61,7 @@ class DemoQAWidgets:
         # Test multiple auto complete
         multi_input = self.driver.find_element(By.ID, "autoCompleteMultipleInput")
         multi_input.send_keys("Red")
-        time.sleep(1)
+        self.waits.until(wc.element_visible((By.CSS_SELECTOR, ".auto-complete__option")), replaces=1)
 
         # Select from dropdown
         option = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'auto-complete__option') and text()='Red']")))
@@ -65,7 +69,7 @@ class DemoQAWidgets:
 
         # Add another color
         multi_input.send_keys("Blue")
-        time.sleep(1)
+        self.waits.until(wc.element_visible((By.CSS_SELECTOR, ".auto-complete__option")), replaces=1)
         option = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'auto-complete__option') and text()='Blue']")))
         option.click()
 
@@ -74,7 +78,7 @@ class DemoQAWidgets:
         # Test single auto complete
         single_input = self.driver.find_element(By.ID, "autoCompleteSingleInput")
         single_input.send_keys("Green")
-        time.sleep(1)
+        self.waits.until(wc.element_visible((By.CSS_SELECTOR, ".auto-complete__option")), replaces=1)
 
         option = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'auto-complete__option') and text()='Green']")))
         option.click()
@@ -158,7 +162,10 @@ class DemoQAWidgets:
         start_btn.click()
 
         # Wait for progress to start
-        time.sleep(2)
+        self.waits.until(
+            wc.attribute_reached((By.CSS_SELECTOR, ".progress-bar"), "aria-valuenow", lambda v: v and int(v) > 0),
+            replaces=2
+        )
 
         # Check progress value
         progress_bar = self.driver.find_element(By.CSS_SELECTOR, ".progress-bar")
@@ -183,7 +190,7 @@ class DemoQAWidgets:
         # Test Origin tab
         origin_tab = self.driver.find_element(By.ID, "demo-tab-origin")
         origin_tab.click()
-        time.sleep(1)
+        self.waits.until(wc.attribute_contains((By.ID, "demo-tabpane-origin"), "class", "show"), replaces=1)
 
         origin_content = self.driver.find_element(By.ID, "demo-tabpane-origin")
         assert origin_content.is_displayed()
@@ -192,7 +199,7 @@ class DemoQAWidgets:
         # Test Use tab
         use_tab = self.driver.find_element(By.ID, "demo-tab-use")
         use_tab.click()
-        time.sleep(1)
+        self.waits.until(wc.attribute_contains((By.ID, "demo-tabpane-use"), "class", "show"), replaces=1)
 
         use_content = self.driver.find_element(By.ID, "demo-tabpane-use")
         assert use_content.is_displayed()
@@ -210,7 +217,7 @@ class DemoQAWidgets:
         # Hover over button
         hover_btn = self.driver.find_element(By.ID, "toolTipButton")
         actions.move_to_element(hover_btn).perform()
-        time.sleep(2)
+        self.waits.settle(wc.element_visible((By.CLASS_NAME, "tooltip-inner")), 2)
 
         # Check for tooltip
         try:
@@ -222,12 +229,12 @@ class DemoQAWidgets:
         # Hover over text field
         text_field = self.driver.find_element(By.ID, "toolTipTextField")
         actions.move_to_element(text_field).perform()
-        time.sleep(2)
+        self.waits.settle(wc.text_contains((By.CLASS_NAME, "tooltip-inner"), "text field"), 2)
 
         # Hover over link
         link = self.driver.find_element(By.XPATH, "//a[text()='Contrary']")
         actions.move_to_element(link).perform()
-        time.sleep(2)
+        self.waits.settle(wc.text_contains((By.CLASS_NAME, "tooltip-inner"), "Contrary"), 2)
 
         print("✓ Tool Tips test passed")
 
@@ -241,7 +248,7 @@ class DemoQAWidgets:
         # Hover over Main Item 2
         main_item2 = self.driver.find_element(By.XPATH, "//a[text()='Main Item 2']")
         actions.move_to_element(main_item2).perform()
-        time.sleep(1)
+        self.waits.until(wc.element_visible((By.XPATH, "//a[text()='Sub Item']")), replaces=1)
 
         # Check if submenu appears
         submenu = self.driver.find_element(By.XPATH, "//a[text()='Sub Item']")
@@ -251,7 +258,7 @@ class DemoQAWidgets:
         # Hover over Sub Sub List
         sub_sub_list = self.driver.find_element(By.XPATH, "//a[text()='SUB SUB LIST »']")
         actions.move_to_element(sub_sub_list).perform()
-        time.sleep(1)
+        self.waits.until(wc.element_visible((By.XPATH, "//a[text()='Sub Sub Item 1']")), replaces=1)
 
         # Check if sub-submenu appears
         sub_sub_item = self.driver.find_element(By.XPATH, "//a[text()='Sub Sub Item 1']")
@@ -318,7 +325,7 @@ class DemoQAWidgets:
         except Exception as e:
             print(f"\n❌ Test failed: {str(e)}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -1,19 +1,22 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import ElementClickInterceptedException
 import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import DomObserver
 
 
 class AccordianTest:
     """Individual test for Accordian functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
-        self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.driver = DriverFactory.acquire()
+        self.dom = DomObserver(self.driver, timeout=10)
         
     def safe_click(self, element):
         """Safely click an element using JavaScript if normal click fails"""
@@ -34,7 +37,7 @@ class AccordianTest:
             print("  ✓ First section header clicked")
             
             # Wait for content to be visible
-            first_content = self.wait.until(EC.visibility_of_element_located((By.ID, "section1Content")))
+            first_content = self.dom.visible((By.ID, "section1Content"))
             content_text = first_content.text
             print(f"  ✓ First section content visible: {len(content_text)} characters")
             
@@ -66,7 +69,7 @@ class AccordianTest:
             print("  ✓ Second section header clicked")
             
             # Wait for content to be visible
-            second_content = self.wait.until(EC.visibility_of_element_located((By.ID, "section2Content")))
+            second_content = self.dom.visible((By.ID, "section2Content"))
             content_text = second_content.text
             print(f"  ✓ Second section content visible: {len(content_text)} characters")
             
@@ -97,7 +100,7 @@ class AccordianTest:
             print("  ✓ Third section header clicked")
             
             # Wait for content to be visible
-            third_content = self.wait.until(EC.visibility_of_element_located((By.ID, "section3Content")))
+            third_content = self.dom.visible((By.ID, "section3Content"))
             content_text = third_content.text
             print(f"  ✓ Third section content visible: {len(content_text)} characters")
             
@@ -125,13 +128,13 @@ class AccordianTest:
             # Open first section
             first_section = self.driver.find_element(By.ID, "section1Heading")
             self.safe_click(first_section)
-            self.wait.until(EC.visibility_of_element_located((By.ID, "section1Content")))
+            self.dom.visible((By.ID, "section1Content"))
             print("  ✓ First section opened")
             
             # Open second section (should close first)
             second_section = self.driver.find_element(By.ID, "section2Heading")
             self.safe_click(second_section)
-            self.wait.until(EC.visibility_of_element_located((By.ID, "section2Content")))
+            self.dom.visible((By.ID, "section2Content"))
             print("  ✓ Second section opened")
             
             # Verify first section is collapsed
@@ -147,7 +150,7 @@ class AccordianTest:
             # Open third section
             third_section = self.driver.find_element(By.ID, "section3Heading")
             self.safe_click(third_section)
-            self.wait.until(EC.visibility_of_element_located((By.ID, "section3Content")))
+            self.dom.visible((By.ID, "section3Content"))
             print("  ✓ Third section opened")
             
             print("✅ Multiple sections test PASSED")
@@ -186,7 +189,7 @@ class AccordianTest:
         except Exception as e:
             print(f"❌ Accordian test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
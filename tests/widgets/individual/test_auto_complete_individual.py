@@ -4,16 +4,21 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import ElementClickInterceptedException
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class AutoCompleteTest:
     """Individual test for Auto Complete functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
         
     def safe_click(self, element):
         """Safely click an element using JavaScript if normal click fails"""
@@ -35,7 +40,7 @@ class AutoCompleteTest:
             
             # Type partial color name
             multi_input.send_keys("re")
-            time.sleep(1)  # Wait for suggestions
+            self.waits.settle(wc.element_visible((By.CSS_SELECTOR, ".auto-complete__option")), 1)  # Suggestions
             print("  ✓ Typed 're' in multiple input")
             
             # Wait for dropdown options to appear
@@ -63,7 +68,7 @@ class AutoCompleteTest:
             
             # Add another color
             multi_input.send_keys("bl")
-            time.sleep(1)
+            self.waits.settle(wc.element_visible((By.CSS_SELECTOR, ".auto-complete__option")), 1)
             
             try:
                 options = self.driver.find_elements(By.CSS_SELECTOR, ".auto-complete__option")
@@ -95,7 +100,7 @@ class AutoCompleteTest:
             
             # Type partial color name
             single_input.send_keys("gr")
-            time.sleep(1)  # Wait for suggestions
+            self.waits.settle(wc.element_visible((By.CSS_SELECTOR, ".auto-complete__option")), 1)  # Suggestions
             print("  ✓ Typed 'gr' in single input")
             
             # Wait for dropdown options to appear
@@ -140,12 +145,12 @@ class AutoCompleteTest:
             # Add first color
             multi_input.send_keys("Red")
             multi_input.send_keys(Keys.ENTER)
-            time.sleep(0.5)
+            self.waits.until(wc.element_count((By.CSS_SELECTOR, ".auto-complete__multi-value"), lambda n: n >= 1), replaces=0.5)
             
             # Add second color
             multi_input.send_keys("Blue")
             multi_input.send_keys(Keys.ENTER)
-            time.sleep(0.5)
+            self.waits.until(wc.element_count((By.CSS_SELECTOR, ".auto-complete__multi-value"), lambda n: n >= 2), replaces=0.5)
             print("  ✓ Added multiple colors")
             
             # Try to clear selections using remove buttons
@@ -157,7 +162,10 @@ class AutoCompleteTest:
                     print("  ✓ Removed one selection")
                     
                     # Verify removal
-                    time.sleep(0.5)
+                    self.waits.until(
+                        wc.element_count((By.CSS_SELECTOR, ".auto-complete__multi-value__remove"), lambda n: n < initial_count),
+                        replaces=0.5
+                    )
                     remaining_buttons = self.driver.find_elements(By.CSS_SELECTOR, ".auto-complete__multi-value__remove")
                     assert len(remaining_buttons) < initial_count
                     print("  ✓ Selection removal verified")
@@ -194,15 +202,15 @@ class AutoCompleteTest:
             single_input = self.driver.find_element(By.ID, "autoCompleteSingleInput")
             self.safe_click(single_input)
             single_input.send_keys("b")
-            time.sleep(1)
+            self.waits.settle(wc.element_visible((By.CSS_SELECTOR, ".auto-complete__option")), 1)
             print("  ✓ Typed 'b' to trigger suggestions")
             
             # Try arrow key navigation
             try:
                 single_input.send_keys(Keys.ARROW_DOWN)
-                time.sleep(0.5)
+                self.waits.settle(wc.element_visible((By.CSS_SELECTOR, ".auto-complete__option--is-focused")), 0.5)
                 single_input.send_keys(Keys.ARROW_DOWN)
-                time.sleep(0.5)
+                self.waits.settle(wc.element_visible((By.CSS_SELECTOR, ".auto-complete__option--is-focused")), 0.5)
                 print("  ✓ Used arrow keys for navigation")
                 
                 # Select with Enter
@@ -258,7 +266,7 @@ class AutoCompleteTest:
         except Exception as e:
             print(f"❌ Auto Complete test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
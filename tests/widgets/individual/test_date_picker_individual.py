@@ -4,17 +4,22 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-import time
 from datetime import datetime, timedelta
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class DatePickerTest:
     """Individual test for Date Picker functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_select_date(self):
         """Test basic date selection"""
@@ -55,7 +60,7 @@ class DatePickerTest:
                         print(f"  ✓ Selected day {available_days[0].text}")
                 
                 # Verify date changed
-                time.sleep(0.5)
+                self.waits.until(wc.attribute_reached(date_input, "value", lambda v: v != original_date), replaces=0.5)
                 new_date = date_input.get_attribute("value")
                 assert new_date != original_date
                 print(f"  ✓ Date changed to: {new_date}")
@@ -94,7 +99,7 @@ class DatePickerTest:
             try:
                 next_button = self.driver.find_element(By.CSS_SELECTOR, ".react-datepicker__navigation--next")
                 next_button.click()
-                time.sleep(0.5)
+                self.waits.settle(wc.text_changed(current_month, original_month), 0.5)
                 
                 # Verify month changed
                 new_month = current_month.text
@@ -103,7 +108,7 @@ class DatePickerTest:
                 # Click previous month button
                 prev_button = self.driver.find_element(By.CSS_SELECTOR, ".react-datepicker__navigation--previous")
                 prev_button.click()
-                time.sleep(0.5)
+                self.waits.settle(wc.text_changed(current_month, new_month), 0.5)
                 
                 # Verify back to original month
                 back_month = current_month.text
@@ -166,7 +171,7 @@ class DatePickerTest:
                             print("  ⚠️ Time input not found or not editable")
                         
                         # Verify datetime changed
-                        time.sleep(1)
+                        self.waits.settle(wc.attribute_reached(datetime_input, "value", lambda v: v != original_datetime), 1)
                         new_datetime = datetime_input.get_attribute("value")
                         if new_datetime != original_datetime:
                             print(f"  ✓ Date/time changed to: {new_datetime}")
@@ -203,7 +208,7 @@ class DatePickerTest:
             print(f"  ✓ Typed date: {test_date}")
             
             # Verify input
-            time.sleep(0.5)
+            self.waits.settle(wc.attribute_reached(date_input, "value", test_date), 0.5)
             input_value = date_input.get_attribute("value")
             print(f"  ✓ Input value: {input_value}")
             
@@ -219,7 +224,7 @@ class DatePickerTest:
                 datetime_input.send_keys(Keys.ENTER)
                 print(f"  ✓ Typed datetime: {test_datetime}")
                 
-                time.sleep(0.5)
+                self.waits.settle(wc.element_invisible((By.CLASS_NAME, "react-datepicker-popper")), 0.5)
                 datetime_value = datetime_input.get_attribute("value")
                 print(f"  ✓ Datetime value: {datetime_value}")
                 
@@ -262,7 +267,7 @@ class DatePickerTest:
         except Exception as e:
             print(f"❌ Date Picker test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
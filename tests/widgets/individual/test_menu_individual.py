@@ -3,16 +3,22 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.dom_snapshot import DomSnapshot
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class MenuTest:
     """Individual test for Menu functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_main_menu_items(self):
         """Test main menu items"""
@@ -32,7 +38,7 @@ class MenuTest:
                 # Hover over item to see if it's interactive
                 actions = ActionChains(self.driver)
                 actions.move_to_element(item).perform()
-                time.sleep(0.5)
+                self.waits.until(wc.element_stable((By.ID, "nav")), replaces=0.5)
                 
                 # Check if item has submenu (look for expanded state)
                 parent_li = item.find_element(By.XPATH, "..")
@@ -80,7 +86,7 @@ class MenuTest:
             # Hover over Main Item 2 to reveal submenu
             actions = ActionChains(self.driver)
             actions.move_to_element(main_item_2).perform()
-            time.sleep(1)
+            self.waits.until(wc.element_visible((By.XPATH, "//a[text()='Sub Item']")), replaces=1)
             print("  ✓ Hovered over Main Item 2")
             
             # Look for submenu items
@@ -103,7 +109,7 @@ class MenuTest:
             
             # Move away to hide submenu
             actions.move_by_offset(100, 100).perform()
-            time.sleep(0.5)
+            self.waits.until(wc.element_stable((By.ID, "nav")), replaces=0.5)
             print("  ✓ Moved away from menu")
             
             print("✅ Main Item 2 submenu test PASSED")
@@ -138,7 +144,7 @@ class MenuTest:
             # Hover over Main Item 2
             actions = ActionChains(self.driver)
             actions.move_to_element(main_item_2).perform()
-            time.sleep(1)
+            self.waits.until(wc.element_visible((By.XPATH, "//a[text()='Sub Item']")), replaces=1)
             print("  ✓ Hovered over Main Item 2")
             
             # Look for Sub Sub List item
@@ -156,7 +162,7 @@ class MenuTest:
                     
                     # Hover over Sub Sub List to reveal third level menu
                     actions.move_to_element(sub_sub_list_item).perform()
-                    time.sleep(1)
+                    self.waits.settle(wc.element_visible((By.XPATH, "//a[text()='Sub Sub Item 1']")), 1)
                     print("  ✓ Hovered over Sub Sub List")
                     
                     # Look for third level menu items
@@ -183,7 +189,7 @@ class MenuTest:
             
             # Move away to hide all menus
             actions.move_by_offset(200, 200).perform()
-            time.sleep(0.5)
+            self.waits.until(wc.element_stable((By.ID, "nav")), replaces=0.5)
             print("  ✓ Moved away from all menus")
             
             print("✅ Sub Sub List test PASSED")
@@ -207,14 +213,14 @@ class MenuTest:
             if main_items:
                 first_item = main_items[0]
                 actions.move_to_element(first_item).perform()
-                time.sleep(0.5)
+                self.waits.until(wc.element_stable((By.ID, "nav")), replaces=0.5)
                 print(f"  ✓ Navigated to first main item: '{first_item.text}'")
             
             # Step 2: Navigate to second main item
             if len(main_items) >= 2:
                 second_item = main_items[1]
                 actions.move_to_element(second_item).perform()
-                time.sleep(1)
+                self.waits.until(wc.element_visible((By.XPATH, "//a[text()='Sub Item']")), replaces=1)
                 print(f"  ✓ Navigated to second main item: '{second_item.text}'")
                 
                 # Check if submenu appeared
@@ -227,20 +233,20 @@ class MenuTest:
                     if visible_submenu:
                         first_sub = visible_submenu[0]
                         actions.move_to_element(first_sub).perform()
-                        time.sleep(0.5)
+                        self.waits.until(wc.element_stable((By.ID, "nav")), replaces=0.5)
                         print(f"  ✓ Navigated to submenu item: '{first_sub.text}'")
                 else:
                     print("  ⚠️ No visible submenu items found")
             
             # Step 3: Navigate away and back
             actions.move_by_offset(100, 100).perform()
-            time.sleep(0.5)
+            self.waits.until(wc.element_stable((By.ID, "nav")), replaces=0.5)
             print("  ✓ Navigated away from menu")
             
             # Navigate back to menu
             if main_items:
                 actions.move_to_element(main_items[0]).perform()
-                time.sleep(0.5)
+                self.waits.until(wc.element_stable((By.ID, "nav")), replaces=0.5)
                 print("  ✓ Navigated back to menu")
             
             print("✅ Menu navigation test PASSED")
@@ -256,35 +262,36 @@ class MenuTest:
         self.driver.get("https://demoqa.com/menu")
 
         try:
-            # Analyze menu structure
-            menu_container = self.driver.find_element(By.ID, "nav")
+            # Analyze menu structure from one snapshot instead of a find per item
+            snapshot = DomSnapshot.take(self.driver)
+            menu_container = snapshot.find_element(By.ID, "nav")
             print("  ✓ Found menu container")
             
             # Count main menu items
-            main_items = menu_container.find_elements(By.CSS_SELECTOR, "> li")
+            main_items = menu_container.find_elements(By.XPATH, "./li")
             print(f"  ✓ Main menu has {len(main_items)} items")
             
             # Analyze each main item
             for i, main_item in enumerate(main_items):
-                main_link = main_item.find_element(By.CSS_SELECTOR, "> a")
+                main_link = main_item.find_element(By.XPATH, "./a")
                 main_text = main_link.text
                 print(f"  ✓ Main item {i+1}: '{main_text}'")
                 
                 # Check for submenus
-                submenus = main_item.find_elements(By.CSS_SELECTOR, "> ul")
+                submenus = main_item.find_elements(By.XPATH, "./ul")
                 if submenus:
                     submenu = submenus[0]
-                    sub_items = submenu.find_elements(By.CSS_SELECTOR, "> li")
+                    sub_items = submenu.find_elements(By.XPATH, "./li")
                     print(f"    ✓ Has submenu with {len(sub_items)} items")
                     
                     # Check for third level menus
                     for j, sub_item in enumerate(sub_items):
-                        sub_link = sub_item.find_element(By.CSS_SELECTOR, "> a")
+                        sub_link = sub_item.find_element(By.XPATH, "./a")
                         sub_text = sub_link.text
                         
-                        third_level = sub_item.find_elements(By.CSS_SELECTOR, "> ul")
+                        third_level = sub_item.find_elements(By.XPATH, "./ul")
                         if third_level:
-                            third_items = third_level[0].find_elements(By.CSS_SELECTOR, "> li")
+                            third_items = third_level[0].find_elements(By.XPATH, "./li")
                             print(f"      ✓ Sub item '{sub_text}' has {len(third_items)} third level items")
                         else:
                             print(f"      ✓ Sub item '{sub_text}' (no third level)")
@@ -328,7 +335,7 @@ class MenuTest:
         except Exception as e:
             print(f"❌ Menu test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -2,16 +2,21 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import AttributeStream, Waiter, conditions as wc
 
 
 class ProgressBarTest:
     """Individual test for Progress Bar functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
-        self.wait = WebDriverWait(self.driver, 15)  # Longer wait for progress bar
-        self.driver.maximize_window()
+        self.driver = DriverFactory.acquire()
+        self.wait = WebDriverWait(self.driver, 15)
+        self.waits = Waiter(self.driver, timeout=15)  # Longer wait for progress bar
 
     def test_start_progress_bar(self):
         """Test starting the progress bar"""
@@ -33,10 +38,12 @@ class ProgressBarTest:
             start_button.click()
             print("  ✓ Start button clicked")
             
-            # Wait a moment and check if progress started
-            time.sleep(2)
+            # Wait for the progress to start
+            self.waits.settle(
+                wc.attribute_reached((By.CSS_SELECTOR, ".progress-bar"), "aria-valuenow", lambda v: int(v or 0) > int(initial_progress)), 2
+            )
             current_progress = progress_bar.get_attribute("aria-valuenow") or "0"
-            print(f"  ✓ Progress after 2 seconds: {current_progress}%")
+            print(f"  ✓ Progress after start: {current_progress}%")
             
             # Verify progress is increasing
             if int(current_progress) > int(initial_progress):
@@ -65,23 +72,25 @@ class ProgressBarTest:
             start_button = self.driver.find_element(By.ID, "startStopButton")
             progress_bar = self.driver.find_element(By.CSS_SELECTOR, ".progress-bar")
             
-            start_button.click()
-            print("  ✓ Started progress bar")
-            
-            # Wait for some progress
-            time.sleep(3)
-            progress_before_stop = progress_bar.get_attribute("aria-valuenow") or "0"
-            print(f"  ✓ Progress before stop: {progress_before_stop}%")
-            
-            # Stop the progress bar
-            stop_button = self.driver.find_element(By.ID, "startStopButton")
-            stop_button.click()
-            print("  ✓ Stop button clicked")
-            
-            # Wait a moment and verify progress stopped
-            time.sleep(2)
-            progress_after_stop = progress_bar.get_attribute("aria-valuenow") or "0"
-            print(f"  ✓ Progress after stop: {progress_after_stop}%")
+            with AttributeStream(self.driver, progress_bar, "aria-valuenow", timeout=15) as progress:
+                start_button.click()
+                print("  ✓ Started progress bar")
+                
+                # Wait for some progress
+                progress.wait_until(">", 0, timeout=3, replaces=3)
+                progress.read()
+                progress_before_stop = progress.value() or "0"
+                print(f"  ✓ Progress before stop: {progress_before_stop}%")
+                
+                # Stop the progress bar
+                stop_button = self.driver.find_element(By.ID, "startStopButton")
+                stop_button.click()
+                print("  ✓ Stop button clicked")
+                
+                # Stopped once the value holds still for longer than one progress tick
+                progress.wait_quiet(500, timeout=2, replaces=2)
+                progress_after_stop = progress.value() or "0"
+                print(f"  ✓ Progress after stop: {progress_after_stop}%")
             
             # Progress should be the same or very close
             progress_diff = abs(int(progress_after_stop) - int(progress_before_stop))
@@ -111,28 +120,22 @@ class ProgressBarTest:
             start_button = self.driver.find_element(By.ID, "startStopButton")
             progress_bar = self.driver.find_element(By.CSS_SELECTOR, ".progress-bar")
             
-            start_button.click()
-            print("  ✓ Started progress bar")
-            
             # Wait for completion (this might take a while)
-            print("  ⏳ Waiting for progress bar to complete...")
-            completion_timeout = 30  # 30 seconds timeout
-            start_time = time.time()
-            
-            while time.time() - start_time < completion_timeout:
-                current_progress = progress_bar.get_attribute("aria-valuenow") or "0"
-                
-                if int(current_progress) >= 100:
-                    print(f"  ✅ Progress bar completed: {current_progress}%")
-                    break
-                    
-                if int(current_progress) % 20 == 0 and int(current_progress) > 0:
-                    print(f"  ⏳ Progress: {current_progress}%")
-                
-                time.sleep(1)
+            completion_timeout = 20  # the bar fills in ~10 s; the watchdog deadline stretches to fit the stream
+            with AttributeStream(self.driver, progress_bar, "aria-valuenow", timeout=completion_timeout) as progress:
+                start_button.click()
+                print("  ✓ Started progress bar")
+                print("  ⏳ Waiting for progress bar to complete...")
+                completed = progress.wait_until(">=", 100)
+            
+            for mark, at_ms in progress.milestones(20):
+                print(f"  ⏳ Progress: {mark}% after {at_ms / 1000:.1f}s")
+            
+            if completed:
+                print(f"  ✅ Progress bar completed: {progress.value()}% ({len(progress.timeline)} updates recorded)")
             else:
                 # Timeout reached
-                final_progress = progress_bar.get_attribute("aria-valuenow") or "0"
+                final_progress = progress.value() or "0"
                 print(f"  ⚠️ Timeout reached. Final progress: {final_progress}%")
                 
                 # If we got significant progress, consider it a partial success
@@ -150,7 +153,7 @@ class ProgressBarTest:
                     
                     # Test reset functionality
                     reset_button.click()
-                    time.sleep(1)
+                    self.waits.settle(wc.attribute_reached((By.CSS_SELECTOR, ".progress-bar"), "aria-valuenow", "0"), 1)
                     
                     reset_progress = progress_bar.get_attribute("aria-valuenow") or "0"
                     print(f"  ✓ Progress after reset: {reset_progress}%")
@@ -202,7 +205,7 @@ class ProgressBarTest:
             start_button = self.driver.find_element(By.ID, "startStopButton")
             start_button.click()
             
-            time.sleep(2)
+            self.waits.settle(wc.attribute_reached((By.CSS_SELECTOR, ".progress-bar"), "aria-valuenow", lambda v: int(v or 0) > 0), 2)
             
             # Check updated attributes
             updated_value = progress_bar.get_attribute("aria-valuenow") or "0"
@@ -250,7 +253,7 @@ class ProgressBarTest:
         except Exception as e:
             print(f"❌ Progress Bar test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
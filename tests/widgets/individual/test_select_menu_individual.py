@@ -5,16 +5,21 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import ElementClickInterceptedException
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class SelectMenuTest:
     """Individual test for Select Menu functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
         
     def safe_click(self, element):
         """Safely click an element using JavaScript if normal click fails"""
@@ -35,7 +40,7 @@ class SelectMenuTest:
             print("  ✓ Select Value dropdown clicked")
             
             # Wait for options to appear
-            time.sleep(1)
+            self.waits.settle(wc.element_visible((By.CSS_SELECTOR, "div[class*='-menu']")), 1)
             
             # Look for dropdown options
             try:
@@ -54,7 +59,7 @@ class SelectMenuTest:
                     print(f"  ✓ Selected option: '{option_text}'")
                     
                     # Verify selection
-                    time.sleep(0.5)
+                    self.waits.settle(wc.element_invisible((By.CSS_SELECTOR, "div[class*='-menu']")), 0.5)
                     selected_text = select_value_container.text
                     print(f"  ✓ Current selection: '{selected_text}'")
                     
@@ -87,7 +92,7 @@ class SelectMenuTest:
             print("  ✓ Select One dropdown clicked")
             
             # Wait for options to appear
-            time.sleep(1)
+            self.waits.settle(wc.element_visible((By.CSS_SELECTOR, "div[class*='-menu']")), 1)
             
             # Look for dropdown options
             try:
@@ -115,7 +120,7 @@ class SelectMenuTest:
                         print(f"  ✓ Selected option: '{option_text}'")
                         
                         # Verify selection
-                        time.sleep(0.5)
+                        self.waits.settle(wc.element_invisible((By.CSS_SELECTOR, "div[class*='-menu']")), 0.5)
                         selected_text = select_one_container.text
                         print(f"  ✓ Current selection: '{selected_text}'")
                     else:
@@ -198,7 +203,7 @@ class SelectMenuTest:
             
             # Click to open dropdown
             multiselect_container.click()
-            time.sleep(1)
+            self.waits.settle(wc.element_visible((By.CSS_SELECTOR, "div[class*='-menu']")), 1)
             print("  ✓ Multiselect dropdown opened")
             
             # Look for options
@@ -215,7 +220,7 @@ class SelectMenuTest:
                             option.click()
                             selections_made += 1
                             print(f"  ✓ Selected option {i+1}: '{option_text}'")
-                            time.sleep(0.5)
+                            self.waits.until(wc.element_stable(multiselect_container), replaces=0.5)
                         except Exception as select_e:
                             print(f"  ⚠️ Could not select option {i+1}: {select_e}")
                     
@@ -354,7 +359,7 @@ class SelectMenuTest:
         except Exception as e:
             print(f"❌ Select Menu test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
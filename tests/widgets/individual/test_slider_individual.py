@@ -4,16 +4,21 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import Waiter, conditions as wc
 
 
 class SliderTest:
     """Individual test for Slider functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
+        self.driver = DriverFactory.acquire()
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.waits = Waiter(self.driver, timeout=10)
 
     def test_slider_drag(self):
         """Test slider drag functionality"""
@@ -46,7 +51,7 @@ class SliderTest:
             print("  ✓ Dragged slider to the right")
             
             # Get new value
-            time.sleep(0.5)
+            self.waits.settle(wc.attribute_reached((By.ID, "sliderValue"), "value", lambda v: v != initial_value), 0.5)
             new_value = self.driver.find_element(By.ID, "sliderValue").get_attribute("value")
             print(f"  ✓ New slider value: {new_value}")
             
@@ -63,7 +68,7 @@ class SliderTest:
             print("  ✓ Dragged slider to the left")
             
             # Get final value
-            time.sleep(0.5)
+            self.waits.settle(wc.attribute_reached((By.ID, "sliderValue"), "value", lambda v: v != new_value), 0.5)
             final_value = self.driver.find_element(By.ID, "sliderValue").get_attribute("value")
             print(f"  ✓ Final slider value: {final_value}")
             
@@ -102,7 +107,7 @@ class SliderTest:
             print("  ✓ Pressed right arrow 3 times")
             
             # Get new value
-            time.sleep(0.5)
+            self.waits.settle(wc.attribute_reached(slider_input, "value", lambda v: v != initial_value), 0.5)
             new_value = slider_input.get_attribute("value")
             print(f"  ✓ New value: {new_value}")
             
@@ -118,7 +123,7 @@ class SliderTest:
             print("  ✓ Pressed left arrow 2 times")
             
             # Get final value
-            time.sleep(0.5)
+            self.waits.settle(wc.attribute_reached(slider_input, "value", lambda v: v != new_value), 0.5)
             final_value = slider_input.get_attribute("value")
             print(f"  ✓ Final value: {final_value}")
             
@@ -153,7 +158,7 @@ class SliderTest:
             print(f"  ✓ Set input value to: {test_value}")
             
             # Verify slider position changed
-            time.sleep(0.5)
+            self.waits.settle(wc.attribute_reached(slider_input, "value", test_value), 0.5)
             new_slider_value = slider_input.get_attribute("value")
             print(f"  ✓ Slider value after input: {new_slider_value}")
             
@@ -189,7 +194,7 @@ class SliderTest:
             value_input.clear()
             value_input.send_keys(min_value)
             value_input.send_keys(Keys.ENTER)
-            time.sleep(0.5)
+            self.waits.settle(wc.attribute_reached(slider_input, "value", min_value), 0.5)
             
             min_result = slider_input.get_attribute("value")
             print(f"  ✓ Set to minimum ({min_value}), result: {min_result}")
@@ -198,7 +203,7 @@ class SliderTest:
             value_input.clear()
             value_input.send_keys(max_value)
             value_input.send_keys(Keys.ENTER)
-            time.sleep(0.5)
+            self.waits.settle(wc.attribute_reached(slider_input, "value", max_value), 0.5)
             
             max_result = slider_input.get_attribute("value")
             print(f"  ✓ Set to maximum ({max_value}), result: {max_result}")
@@ -208,7 +213,7 @@ class SliderTest:
                 value_input.clear()
                 value_input.send_keys("150")  # Beyond max
                 value_input.send_keys(Keys.ENTER)
-                time.sleep(0.5)
+                self.waits.settle(wc.attribute_reached(slider_input, "value", max_value), 0.5)
                 
                 beyond_max_result = slider_input.get_attribute("value")
                 print(f"  ✓ Set beyond max (150), result: {beyond_max_result}")
@@ -257,7 +262,7 @@ class SliderTest:
         except Exception as e:
             print(f"❌ Slider test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
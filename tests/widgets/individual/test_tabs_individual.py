@@ -1,17 +1,20 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import DomObserver
 
 
 class TabsTest:
     """Individual test for Tabs functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
-        self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.driver = DriverFactory.acquire()
+        self.dom = DomObserver(self.driver, timeout=10)
 
     def test_what_tab(self):
         """Test What tab functionality"""
@@ -25,7 +28,7 @@ class TabsTest:
             print("  ✓ What tab clicked")
             
             # Wait for content to be visible
-            what_content = self.wait.until(EC.visibility_of_element_located((By.ID, "demo-tabpane-what")))
+            what_content = self.dom.visible((By.ID, "demo-tabpane-what"))
             content_text = what_content.text
             print(f"  ✓ What tab content visible: {len(content_text)} characters")
             
@@ -60,7 +63,7 @@ class TabsTest:
             print("  ✓ Origin tab clicked")
             
             # Wait for content to be visible
-            origin_content = self.wait.until(EC.visibility_of_element_located((By.ID, "demo-tabpane-origin")))
+            origin_content = self.dom.visible((By.ID, "demo-tabpane-origin"))
             content_text = origin_content.text
             print(f"  ✓ Origin tab content visible: {len(content_text)} characters")
             
@@ -94,7 +97,7 @@ class TabsTest:
             print("  ✓ Use tab clicked")
             
             # Wait for content to be visible
-            use_content = self.wait.until(EC.visibility_of_element_located((By.ID, "demo-tabpane-use")))
+            use_content = self.dom.visible((By.ID, "demo-tabpane-use"))
             content_text = use_content.text
             print(f"  ✓ Use tab content visible: {len(content_text)} characters")
             
@@ -140,7 +143,7 @@ class TabsTest:
                     print("  ✓ More tab clicked")
                     
                     # Wait for content
-                    more_content = self.wait.until(EC.visibility_of_element_located((By.ID, "demo-tabpane-more")))
+                    more_content = self.dom.visible((By.ID, "demo-tabpane-more"))
                     content_text = more_content.text
                     print(f"  ✓ More tab content: {len(content_text)} characters")
                     
@@ -166,13 +169,13 @@ class TabsTest:
             # Start with What tab
             what_tab = self.driver.find_element(By.ID, "demo-tab-what")
             what_tab.click()
-            what_content = self.wait.until(EC.visibility_of_element_located((By.ID, "demo-tabpane-what")))
+            what_content = self.dom.visible((By.ID, "demo-tabpane-what"))
             print("  ✓ What tab activated")
             
             # Switch to Origin tab
             origin_tab = self.driver.find_element(By.ID, "demo-tab-origin")
             origin_tab.click()
-            origin_content = self.wait.until(EC.visibility_of_element_located((By.ID, "demo-tabpane-origin")))
+            origin_content = self.dom.visible((By.ID, "demo-tabpane-origin"))
             print("  ✓ Origin tab activated")
             
             # Verify What tab content is hidden
@@ -188,7 +191,7 @@ class TabsTest:
             # Switch to Use tab
             use_tab = self.driver.find_element(By.ID, "demo-tab-use")
             use_tab.click()
-            use_content = self.wait.until(EC.visibility_of_element_located((By.ID, "demo-tabpane-use")))
+            use_content = self.dom.visible((By.ID, "demo-tabpane-use"))
             print("  ✓ Use tab activated")
             
             # Verify Origin tab content is hidden
@@ -203,7 +206,7 @@ class TabsTest:
             
             # Switch back to What tab
             what_tab.click()
-            what_content_final = self.wait.until(EC.visibility_of_element_located((By.ID, "demo-tabpane-what")))
+            what_content_final = self.dom.visible((By.ID, "demo-tabpane-what"))
             print("  ✓ Switched back to What tab")
             
             print("✅ Tab switching test PASSED")
@@ -243,7 +246,7 @@ class TabsTest:
         except Exception as e:
             print(f"❌ Tabs test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -1,18 +1,21 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 import time
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from utils.driver_factory import DriverFactory
+from utils.waits import DomObserver
 
 
 class ToolTipsTest:
     """Individual test for Tool Tips functionality"""
     
     def __init__(self):
-        self.driver = webdriver.Chrome()
-        self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
+        self.driver = DriverFactory.acquire()
+        self.dom = DomObserver(self.driver, timeout=10)
 
     def test_button_tooltip(self):
         """Test button tooltip functionality"""
@@ -31,7 +34,7 @@ class ToolTipsTest:
             
             # Wait for tooltip to appear
             try:
-                tooltip = self.wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, ".tooltip-inner")))
+                tooltip = self.dom.visible((By.CSS_SELECTOR, ".tooltip-inner"))
                 tooltip_text = tooltip.text
                 print(f"  ✓ Tooltip appeared with text: '{tooltip_text}'")
                 
@@ -53,7 +56,7 @@ class ToolTipsTest:
             
             # Move away to hide tooltip
             actions.move_by_offset(100, 100).perform()
-            time.sleep(0.5)
+            self.dom.gone((By.CSS_SELECTOR, ".tooltip-inner"), timeout=0.5, replaces=0.5, required=False)
             print("  ✓ Moved away from button")
             
             print("✅ Button tooltip test PASSED")
@@ -80,7 +83,7 @@ class ToolTipsTest:
             
             # Wait for tooltip to appear
             try:
-                tooltip = self.wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, ".tooltip-inner")))
+                tooltip = self.dom.visible((By.CSS_SELECTOR, ".tooltip-inner"))
                 tooltip_text = tooltip.text
                 print(f"  ✓ Tooltip appeared with text: '{tooltip_text}'")
                 
@@ -100,7 +103,7 @@ class ToolTipsTest:
             
             # Move away to hide tooltip
             actions.move_by_offset(100, 100).perform()
-            time.sleep(0.5)
+            self.dom.gone((By.CSS_SELECTOR, ".tooltip-inner"), timeout=0.5, replaces=0.5, required=False)
             print("  ✓ Moved away from text field")
             
             print("✅ Text field tooltip test PASSED")
@@ -132,7 +135,7 @@ class ToolTipsTest:
             
             # Wait for tooltip to appear
             try:
-                tooltip = self.wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, ".tooltip-inner")))
+                tooltip = self.dom.visible((By.CSS_SELECTOR, ".tooltip-inner"))
                 tooltip_text = tooltip.text
                 print(f"  ✓ Tooltip appeared with text: '{tooltip_text}'")
                 
@@ -154,7 +157,7 @@ class ToolTipsTest:
             
             # Move away to hide tooltip
             actions.move_by_offset(100, 100).perform()
-            time.sleep(0.5)
+            self.dom.gone((By.CSS_SELECTOR, ".tooltip-inner"), timeout=0.5, replaces=0.5, required=False)
             print("  ✓ Moved away from link")
             
             print("✅ Link tooltip test PASSED")
@@ -185,7 +188,7 @@ class ToolTipsTest:
                     # Hover over element
                     actions = ActionChains(self.driver)
                     actions.move_to_element(element).perform()
-                    time.sleep(1)
+                    self.dom.visible((By.CSS_SELECTOR, ".tooltip-inner, [role='tooltip']"), timeout=1, replaces=1, required=False)
                     
                     # Try to find tooltip and get its position
                     try:
@@ -207,7 +210,7 @@ class ToolTipsTest:
                     
                     # Move away
                     actions.move_by_offset(50, 50).perform()
-                    time.sleep(0.5)
+                    self.dom.gone((By.CSS_SELECTOR, ".tooltip-inner"), timeout=0.5, replaces=0.5, required=False)
                     
                 except Exception as elem_e:
                     print(f"  ⚠️ {element_name} test failed: {elem_e}")
@@ -240,17 +243,12 @@ class ToolTipsTest:
             print("  ✓ Started longer hover")
             
             # Check tooltip appearance over time
-            tooltip_appeared = False
-            for i in range(5):
-                try:
-                    tooltip = self.driver.find_element(By.CSS_SELECTOR, ".tooltip-inner, [role='tooltip']")
-                    if tooltip.is_displayed():
-                        tooltip_appeared = True
-                        print(f"  ✓ Tooltip appeared after {i+1} second(s)")
-                        break
-                except:
-                    pass
-                time.sleep(1)
+            hover_started = time.time()
+            tooltip_appeared = bool(
+                self.dom.visible((By.CSS_SELECTOR, ".tooltip-inner, [role='tooltip']"), timeout=5, required=False)
+            )
+            if tooltip_appeared:
+                print(f"  ✓ Tooltip appeared after {time.time() - hover_started:.2f} second(s)")
             
             if not tooltip_appeared:
                 print("  ⚠️ Tooltip did not appear during longer hover")
@@ -271,7 +269,7 @@ class ToolTipsTest:
             
             # Move away and check tooltip disappears
             actions.move_by_offset(100, 100).perform()
-            time.sleep(1)
+            self.dom.gone((By.CSS_SELECTOR, ".tooltip-inner"), timeout=1, replaces=1, required=False)
             
             try:
                 tooltip = self.driver.find_element(By.CSS_SELECTOR, ".tooltip-inner, [role='tooltip']")
@@ -319,7 +317,7 @@ class ToolTipsTest:
         except Exception as e:
             print(f"❌ Tool Tips test suite failed: {e}")
         finally:
-            self.driver.quit()
+            DriverFactory.release(self.driver)
 
 
 # Usage
@@ -3,9 +3,8 @@
 import pytest
 import logging
 from selenium import webdriver
-from utils.driver_factory import DriverFactory
+from utils.driver_pool import DriverPool
 from utils.screenshot_helper import ScreenshotHelper
-from config.config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +19,7 @@ class BaseTest:
         """Setup and teardown for each test."""
         # Setup
         logger.info(f"Starting test: {request.node.name}")
-        self.driver = DriverFactory.create_driver()
-        self.driver.get(Config.BASE_URL)
+        self.driver = DriverPool.shared().acquire()
         
         yield
         
@@ -34,7 +32,7 @@ class BaseTest:
         
         logger.info(f"Finished test: {request.node.name}")
         if self.driver:
-            self.driver.quit()
+            DriverPool.shared().release(self.driver)
     
     @pytest.hookimpl(tryfirst=True, hookwrapper=True)
     def pytest_runtest_makereport(self, item, call):
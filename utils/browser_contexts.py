@@ -0,0 +1,128 @@
+"""Isolated browser contexts multiplexed inside one browser session."""
+
+import logging
+import threading
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+
+class ContextHost:
+    """A single browser whose isolated contexts are handed out to tests."""
+
+    def __init__(self, driver: webdriver.Remote):
+        self.driver = driver
+        self.default_handle = driver.current_window_handle
+        self.active = None
+        self.lock = threading.RLock()
+        self.contexts = set()
+        # Retired hosts get no new contexts and quit once the last one is disposed
+        self.retired = False
+
+    def new_context(self) -> "ContextDriver":
+        """Create a context with its own cookie jar and storage, plus one tab."""
+        with self.lock:
+            context_id = self.driver.execute_cdp_cmd(
+                "Target.createBrowserContext", {"disposeOnDetach": False}
+            )["browserContextId"]
+            target_id = self.driver.execute_cdp_cmd(
+                "Target.createTarget", {"url": "about:blank", "browserContextId": context_id}
+            )["targetId"]
+            context = ContextDriver(self, context_id, target_id)
+            self.contexts.add(context)
+        logger.info(f"Opened browser context {context_id}")
+        return context
+
+    def activate(self, context: "ContextDriver") -> None:
+        """Point the session at a context's window if another context was active."""
+        with self.lock:
+            if self.active is context:
+                return
+            if self.active is not None:
+                try:
+                    self.active.current_handle = self.driver.current_window_handle
+                except WebDriverException:
+                    pass
+            self.driver.switch_to.window(context.current_handle)
+            self.active = context
+
+    def dispose(self, context: "ContextDriver") -> None:
+        """Close a context and all of its tabs."""
+        with self.lock:
+            try:
+                self.driver.execute_cdp_cmd(
+                    "Target.disposeBrowserContext", {"browserContextId": context.context_id}
+                )
+            finally:
+                self.contexts.discard(context)
+                if self.retired and not self.contexts:
+                    self.quit()
+                else:
+                    self.driver.switch_to.window(self.default_handle)
+                self.active = None
+        logger.info(f"Disposed browser context {context.context_id}")
+
+    def retire(self) -> None:
+        """Stop handing out contexts from this browser, e.g. once it uses too much memory."""
+        with self.lock:
+            self.retired = True
+            if not self.contexts:
+                self.quit()
+        logger.info("Retired context host browser")
+
+    def quit(self) -> None:
+        """Quit the host browser."""
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.warning(f"Error while quitting context host: {e}")
+
+
+class ContextDriver:
+    """
+    WebDriver stand-in bound to one browser context.
+
+    Commands are forwarded to the host session after switching to this
+    context's window, so tests sharing a host run one at a time.
+    """
+
+    def __init__(self, host: ContextHost, context_id: str, handle: str):
+        self._host = host
+        self.context_id = context_id
+        self.current_handle = handle
+
+    @property
+    def host(self) -> ContextHost:
+        """The browser this context lives in."""
+        return self._host
+
+    @property
+    def window_handles(self) -> list:
+        """Window handles that belong to this context only."""
+        driver = self._host.driver
+        with self._host.lock:
+            targets = driver.execute_cdp_cmd("Target.getTargets", {})["targetInfos"]
+            ours = {
+                target["targetId"] for target in targets
+                if target.get("browserContextId") == self.context_id and target["type"] == "page"
+            }
+            return [handle for handle in driver.window_handles if handle in ours]
+
+    def unwrap(self) -> webdriver.Remote:
+        """Get the host driver, switched to this context."""
+        self._host.activate(self)
+        return self._host.driver
+
+    def quit(self) -> None:
+        """Dispose of the context; the host browser keeps running."""
+        self._host.dispose(self)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.unwrap(), name)
+
+    def __repr__(self) -> str:
+        return f"<ContextDriver {self.context_id}>"
@@ -0,0 +1,122 @@
+"""Named browser launch profiles."""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from selenium import webdriver
+from config.config import Config
+
+
+# Content settings used by the suite to keep ads and popups out of the way
+BLOCKED_CONTENT_PREFS = {
+    "notifications": 2,
+    "media_stream": 2,
+    "ads": 2,
+    "popups": 2
+}
+
+
+@dataclass
+class BrowserProfile:
+    """Launch options for a browser session."""
+
+    name: str
+    headless: Optional[bool] = None          # None follows Config.HEADLESS
+    page_load_strategy: str = "normal"
+    block_images: bool = False
+    block_popups: bool = True
+    disable_extensions: bool = True
+    window_size: Optional[str] = None        # None maximizes headful windows
+    network_log: bool = False                # DevTools Network events for network-idle waits
+    extra_args: list = field(default_factory=list)
+
+    def is_headless(self) -> bool:
+        """Resolve headless mode against the global config."""
+        return Config.HEADLESS if self.headless is None else self.headless
+
+    def build_options(self, browser: str = None):
+        """Build browser options for this profile."""
+        browser = (browser or Config.BROWSER).lower()
+        if browser == "firefox":
+            return self._firefox_options()
+        options = webdriver.EdgeOptions() if browser == "edge" else webdriver.ChromeOptions()
+        return self._chromium_options(options)
+
+    def _chromium_options(self, options):
+        """Options for Chrome and Edge."""
+        options.page_load_strategy = self.page_load_strategy
+
+        if self.is_headless():
+            options.add_argument("--headless=new")
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--disable-gpu")
+        if self.window_size or self.is_headless():
+            options.add_argument(f"--window-size={self.window_size or Config.WINDOW_SIZE}")
+        if self.disable_extensions:
+            options.add_argument("--disable-extensions")
+            options.add_experimental_option("useAutomationExtension", False)
+            options.add_experimental_option("excludeSwitches", ["enable-automation"])
+
+        content_settings = dict(BLOCKED_CONTENT_PREFS) if self.block_popups else {}
+        if self.block_images:
+            content_settings["images"] = 2
+        if content_settings:
+            options.add_experimental_option("prefs", {
+                "profile.default_content_setting_values": content_settings
+            })
+
+        if self.network_log:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+        for argument in self.extra_args:
+            options.add_argument(argument)
+        return options
+
+    def _firefox_options(self):
+        """Options for Firefox."""
+        options = webdriver.FirefoxOptions()
+        options.page_load_strategy = self.page_load_strategy
+        if self.is_headless():
+            options.add_argument("-headless")
+        if self.block_images:
+            options.set_preference("permissions.default.image", 2)
+        if self.block_popups:
+            options.set_preference("dom.disable_open_during_load", True)
+            options.set_preference("dom.webnotifications.enabled", False)
+        for argument in self.extra_args:
+            options.add_argument(argument)
+        return options
+
+
+PROFILES = {
+    # Follows Config.HEADLESS / WINDOW_SIZE with ads and popups blocked
+    "default": BrowserProfile(name="default", network_log=True),
+    # Headless, eager loading, no images, fixed window
+    "fast": BrowserProfile(
+        name="fast",
+        headless=True,
+        page_load_strategy="eager",
+        block_images=True,
+        window_size="1920,1080",
+        extra_args=["--disable-background-networking", "--no-first-run", "--mute-audio"]
+    ),
+    # Headful, every resource loaded, nothing blocked
+    "fidelity": BrowserProfile(
+        name="fidelity",
+        headless=False,
+        block_popups=False,
+        disable_extensions=False,
+        network_log=True
+    ),
+}
+
+
+def get_profile(name: str = None) -> BrowserProfile:
+    """Look up a profile by name, defaulting to Config.BROWSER_PROFILE."""
+    name = name or Config.BROWSER_PROFILE
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown browser profile '{name}'. Available: {', '.join(PROFILES)}")
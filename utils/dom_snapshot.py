@@ -0,0 +1,178 @@
+"""Read-only copy of the page, taken in one script call and queried in-process."""
+
+import functools
+import logging
+from urllib.parse import urljoin
+
+import lxml.html
+from cssselect import HTMLTranslator
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+logger = logging.getLogger(__name__)
+
+_VISIBLE = "data-snapshot-visible"
+_VALUE = "data-snapshot-value"
+_CHECKED = "data-snapshot-checked"
+
+# Serializes a copy of the document with what page_source lacks (computed
+# visibility, live form values) stamped onto the copy; the page is untouched.
+_SNAPSHOT_SCRIPT = """
+const root = document.documentElement;
+const copy = root.cloneNode(true);
+const originals = root.querySelectorAll('*'), copies = copy.querySelectorAll('*');
+const visible = el => el.checkVisibility
+    ? el.checkVisibility({visibilityProperty: true})
+    : !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length) && getComputedStyle(el).visibility !== 'hidden';
+const stamp = (el, clone) => {
+    clone.setAttribute('data-snapshot-visible', visible(el) ? '1' : '0');
+    if (['INPUT', 'TEXTAREA', 'SELECT'].includes(el.tagName)) clone.setAttribute('data-snapshot-value', el.value);
+    if (el.tagName === 'INPUT') clone.setAttribute('data-snapshot-checked', el.checked ? 'true' : 'false');
+};
+stamp(root, copy);
+originals.forEach((el, i) => stamp(el, copies[i]));
+return [location.href, document.title, copy.outerHTML];
+"""
+
+_BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset", "figure", "footer",
+    "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section",
+    "table", "tr", "ul",
+}
+_HIDDEN_TAGS = {"script", "style", "noscript", "template", "head"}
+
+# Locator strategies other than CSS and XPath, as XPath with the value bound to $value
+_XPATHS = {
+    By.ID: "{axis}*[@id=$value]",
+    By.NAME: "{axis}*[@name=$value]",
+    By.LINK_TEXT: "{axis}a[normalize-space(.)=$value]",
+    By.PARTIAL_LINK_TEXT: "{axis}a[contains(., $value)]",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _css_to_xpath(css: str, scoped: bool) -> str:
+    return HTMLTranslator().css_to_xpath(css, prefix="descendant::" if scoped else "descendant-or-self::")
+
+
+def _query(node, by: str, value: str, scoped: bool) -> list:
+    """Elements matching a locator under node (the document root when not scoped)."""
+    if by == By.XPATH:
+        return [match for match in node.xpath(value) if isinstance(match, lxml.html.HtmlElement)]
+    if by in _XPATHS:
+        return node.xpath(_XPATHS[by].format(axis="descendant::" if scoped else "//"), value=value)
+    if by == By.CLASS_NAME:
+        by, value = By.CSS_SELECTOR, f".{value}"
+    if by in (By.CSS_SELECTOR, By.TAG_NAME):
+        return node.xpath(_css_to_xpath(value, scoped))
+    raise ValueError(f"Locator strategy '{by}' is not supported by DomSnapshot")
+
+
+class SnapshotElement:
+    """An element of a DomSnapshot, read like a WebElement."""
+
+    def __init__(self, node, snapshot: "DomSnapshot"):
+        self.node = node
+        self.snapshot = snapshot
+
+    def __repr__(self) -> str:
+        return f"<SnapshotElement {self.tag_name} id={self.node.get('id')!r}>"
+
+    @property
+    def tag_name(self) -> str:
+        return self.node.tag
+
+    @property
+    def text(self) -> str:
+        """Visible text, one line per block element like WebElement.text."""
+        if not self.is_displayed():
+            return ""
+        lines = (" ".join(line.split()) for line in _visible_text(self.node).splitlines())
+        return "\n".join(line for line in lines if line)
+
+    def get_attribute(self, name: str) -> str:
+        """Attribute as WebElement.get_attribute returns it: live value/checked, absolute href/src."""
+        if name == "value" and self.node.get(_VALUE) is not None:
+            return self.node.get(_VALUE)
+        if name == "checked" and self.node.get(_CHECKED) is not None:
+            return "true" if self.node.get(_CHECKED) == "true" else None
+        value = self.node.get(name)
+        if name in ("href", "src") and value is not None:
+            return urljoin(self.snapshot.url, value)
+        return value
+
+    def is_displayed(self) -> bool:
+        return self.node.get(_VISIBLE) != "0"
+
+    def is_enabled(self) -> bool:
+        return self.node.get("disabled") is None
+
+    def find_element(self, by: str = By.ID, value: str = None) -> "SnapshotElement":
+        """First match below this element; raises NoSuchElementException like WebElement."""
+        return self.snapshot._first(self.node, by, value, scoped=True)
+
+    def find_elements(self, by: str = By.ID, value: str = None) -> list:
+        """All matches below this element."""
+        return self.snapshot._all(self.node, by, value, scoped=True)
+
+
+def _visible_text(node) -> str:
+    parts = [node.text or ""]
+    for child in node:
+        if isinstance(child.tag, str) and child.tag not in _HIDDEN_TAGS and child.get(_VISIBLE) != "0":
+            text = _visible_text(child)
+            parts.append(f"\n{text}\n" if child.tag in _BLOCK_TAGS else text)
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+class DomSnapshot:
+    """
+    The page as it was when taken: one script call, then any number of
+    CSS/XPath/ID/... queries answered from an lxml tree without touching
+    the browser. For checks that only read static structure, e.g.
+
+        snapshot = DomSnapshot.take(driver)
+        links = snapshot.find_elements(By.TAG_NAME, "a")
+        assert snapshot.find_element(By.ID, "simpleLink").get_attribute("target") == "_blank"
+
+    Frames are not included; switch into one and take a snapshot there.
+    """
+
+    def __init__(self, html: str, url: str = "", title: str = ""):
+        self.url = url
+        self.title = title
+        self.root = lxml.html.fromstring(html)
+        self.queries = 0
+
+    @classmethod
+    def take(cls, driver: webdriver.Remote) -> "DomSnapshot":
+        """Snapshot the current document (or frame) of the driver."""
+        url, title, html = driver.execute_script(_SNAPSHOT_SCRIPT)
+        logger.info(f"DOM snapshot of {url}: {len(html)} characters")
+        return cls(html, url, title)
+
+    def find_element(self, by: str = By.ID, value: str = None) -> SnapshotElement:
+        """First match in the document; raises NoSuchElementException like WebDriver."""
+        return self._first(self.root, by, value, scoped=False)
+
+    def find_elements(self, by: str = By.ID, value: str = None) -> list:
+        """All matches in the document, in document order."""
+        return self._all(self.root, by, value, scoped=False)
+
+    def exists(self, locator: tuple) -> bool:
+        return bool(self.find_elements(*locator))
+
+    def count(self, locator: tuple) -> int:
+        return len(self.find_elements(*locator))
+
+    def _all(self, node, by: str, value: str, scoped: bool) -> list:
+        self.queries += 1
+        return [SnapshotElement(match, self) for match in _query(node, by, value, scoped)]
+
+    def _first(self, node, by: str, value: str, scoped: bool) -> SnapshotElement:
+        matches = self._all(node, by, value, scoped)
+        if not matches:
+            raise NoSuchElementException(f"No element in the snapshot of {self.url} matches {by}={value!r}")
+        return matches[0]
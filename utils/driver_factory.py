@@ -6,16 +6,263 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
+from config.config import Config
+from utils.browser_profiles import get_profile
+from utils.driver_service import SERVICE_CLASSES, DriverPathCache
+from utils.lazy_driver import LazyDriver
+from utils.browser_contexts import ContextHost, ContextDriver
+from utils.watchdog import SessionWatchdog
+from utils.profile_template import ProfileTemplate
+from utils.remote_executor import PooledRemoteConnection
+from selenium.common.exceptions import SessionNotCreatedException
+import atexit
+import logging
+import queue
+import shutil
+import threading
 import time
 import os
 
+logger = logging.getLogger(__name__)
+
+if Config.SLEEP_PROFILE:
+    # Individual scripts run outside pytest, so the profiler hooks in here
+    from utils.sleep_profiler import SleepProfiler
+    SleepProfiler.install()
+
 
 class DriverFactory:
     """Factory class for creating WebDriver instances."""
-    
+
+    # Browsers started in background threads, ready to be acquired
+    _warm = queue.Queue()
+    _pending = 0
+    _lock = threading.Lock()
+    _closed = False
+    _atexit_registered = False
+    _boot_threads = []
+    # Seconds shutdown waits for browsers that are still booting
+    SHUTDOWN_WAIT = 30
+
+    # One driver service process per browser, shared by all sessions
+    _services = {}
+    _service_lock = threading.Lock()
+
+    # Browser whose isolated contexts are handed out when BROWSER_CONTEXTS is on
+    _context_host = None
+    _context_lock = threading.Lock()
+
+    @classmethod
+    def create_driver(cls, profile: str = None):
+        """
+        Create a WebDriver instance for a launch profile.
+
+        Args:
+            profile: Profile name, defaults to Config.BROWSER_PROFILE
+        """
+        browser_profile = get_profile(profile)
+        browser = Config.BROWSER.lower()
+        options = browser_profile.build_options(browser)
+
+        profile_dir = None
+        if Config.PROFILE_TEMPLATE and browser != "firefox" and not Config.REMOTE_URL:
+            template_dir = ProfileTemplate.ensure(browser, lambda opts: cls._start_chromium(browser, opts))
+            profile_dir = ProfileTemplate.clone(template_dir)
+            options.add_argument(f"--user-data-dir={profile_dir}")
+
+        started = time.perf_counter()
+        if Config.REMOTE_URL:
+            driver = webdriver.Remote(
+                command_executor=PooledRemoteConnection.for_url(Config.REMOTE_URL),
+                options=options
+            )
+        elif browser == "firefox":
+            driver = webdriver.Firefox(options=options)
+        else:
+            driver = cls._start_chromium(browser, options)
+
+        if profile_dir:
+            cls._remove_on_quit(driver, profile_dir)
+
+        if Config.COMMAND_TIMEOUT > 0:
+            SessionWatchdog(driver, restart=lambda: cls._restart_session(driver, options)).install()
+        if not browser_profile.is_headless() and not browser_profile.window_size:
+            driver.maximize_window()
+        logger.info(f"Started {browser} with '{browser_profile.name}' profile in {time.perf_counter() - started:.2f}s")
+        return driver
+
+    @staticmethod
+    def _remove_on_quit(driver: webdriver.Remote, profile_dir: str) -> None:
+        """Delete a session's copied profile once the browser has quit."""
+        quit_browser = driver.quit
+
+        def quit():
+            try:
+                quit_browser()
+            finally:
+                shutil.rmtree(profile_dir, ignore_errors=True)
+
+        driver.quit = quit
+
+    @staticmethod
+    def _restart_session(driver: webdriver.Remote, options) -> None:
+        """Start a new session on a driver whose browser the watchdog killed."""
+        service = getattr(driver, "service", None)
+        if service is not None and not service.is_connectable():
+            # A per-session driver process died with the browser
+            service.start()
+        driver.start_session(options.to_capabilities())
+        driver.dom_script_timeout = 0
+
+    @classmethod
+    def get_service(cls, browser: str, options):
+        """Get the shared driver service for a Chromium browser, starting it once."""
+        with cls._service_lock:
+            service = cls._services.get(browser)
+            if service is None:
+                service = SERVICE_CLASSES[browser](executable_path=DriverPathCache.get(browser, options))
+                cls._services[browser] = service
+                atexit.register(service.shutdown)
+            return service
+
+    @classmethod
+    def _start_chromium(cls, browser: str, options) -> webdriver.Remote:
+        """Start Chrome or Edge, attached to the shared driver service when enabled."""
+        driver_class = webdriver.Edge if browser == "edge" else webdriver.Chrome
+        if not Config.SHARED_DRIVER_SERVICE:
+            return driver_class(options=options)
+
+        try:
+            return driver_class(options=options, service=cls.get_service(browser, options))
+        except SessionNotCreatedException:
+            # Cached driver no longer matches the installed browser
+            logger.warning(f"Session not created with cached {browser} driver, resolving again")
+            with cls._service_lock:
+                service = cls._services.pop(browser, None)
+            if service:
+                service.shutdown()
+            DriverPathCache.invalidate(browser)
+            return driver_class(options=options, service=cls.get_service(browser, options))
+
+    @classmethod
+    def acquire(cls) -> webdriver.Remote:
+        """
+        Get a started browser, booting the next one in the background.
+
+        Returns a pre-warmed session when one is ready or booting,
+        otherwise starts a browser synchronously. With
+        Config.BROWSER_CONTEXTS enabled, returns an isolated context in
+        a shared browser instead.
+        """
+        if Config.BROWSER_CONTEXTS and Config.BROWSER.lower() != "firefox":
+            return cls.new_context()
+
+        cls._prewarm()
+        with cls._lock:
+            reserved = cls._pending > 0
+            if reserved:
+                cls._pending -= 1
+
+        if reserved:
+            started = time.perf_counter()
+            driver = cls._warm.get()
+            logger.info(f"Acquired pre-warmed driver (waited {time.perf_counter() - started:.3f}s)")
+        else:
+            driver = None
+
+        cls._prewarm()
+        if driver is None or isinstance(driver, Exception):
+            driver = cls.create_driver()
+        return driver
+
+    @classmethod
+    def new_context(cls) -> ContextDriver:
+        """Open an isolated browser context (own cookies and storage) in the worker's shared browser."""
+        with cls._context_lock:
+            if cls._context_host is None or cls._context_host.retired:
+                cls._context_host = ContextHost(cls.create_driver())
+                atexit.register(cls._context_host.quit)
+            host = cls._context_host
+        return host.new_context()
+
+    @classmethod
+    def lazy(cls) -> LazyDriver:
+        """Get a driver proxy that only acquires a browser on its first command."""
+        return LazyDriver(cls.acquire)
+
+    @classmethod
+    def release(cls, driver: webdriver.Remote) -> None:
+        """Quit a driver in the background so teardown does not block."""
+        if isinstance(driver, LazyDriver):
+            if not driver.is_started:
+                return
+            driver = driver.unwrap()
+        if isinstance(driver, ContextDriver):
+            driver.quit()
+            return
+        threading.Thread(target=cls._quit, args=(driver,), name="driver-release").start()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop pre-warming and quit browsers that were never acquired, waiting at most SHUTDOWN_WAIT."""
+        with cls._lock:
+            cls._closed = True
+            cls._pending = 0
+            threads = list(cls._boot_threads)
+
+        deadline = time.monotonic() + cls.SHUTDOWN_WAIT
+        for thread in threads:
+            thread.join(timeout=max(deadline - time.monotonic(), 0))
+
+        while True:
+            try:
+                driver = cls._warm.get_nowait()
+            except queue.Empty:
+                break
+            if not isinstance(driver, Exception):
+                cls._quit(driver)
+
+        booting = sum(thread.is_alive() for thread in threads)
+        if booting:
+            logger.warning(f"{booting} pre-warmed browser(s) still booting at shutdown; they quit once started")
+
+    @classmethod
+    def _prewarm(cls) -> None:
+        """Keep Config.PREWARM_DRIVERS browsers booting or ready."""
+        with cls._lock:
+            if cls._closed:
+                return
+            missing = Config.PREWARM_DRIVERS - cls._pending
+            cls._pending += max(missing, 0)
+            if missing > 0 and not cls._atexit_registered:
+                atexit.register(cls.shutdown)
+                cls._atexit_registered = True
+
+        for _ in range(missing):
+            thread = threading.Thread(target=cls._boot, name="driver-prewarm", daemon=True)
+            with cls._lock:
+                cls._boot_threads = [t for t in cls._boot_threads if t.is_alive()] + [thread]
+            thread.start()
+
+    @classmethod
+    def _boot(cls) -> None:
+        """Start a browser and hand it to the warm queue."""
+        try:
+            driver = cls.create_driver()
+        except Exception as e:
+            logger.error(f"Failed to pre-warm driver: {e}")
+            driver = e
+        with cls._lock:
+            closed = cls._closed
+            if not closed:
+                cls._warm.put(driver)
+        if closed and not isinstance(driver, Exception):
+            cls._quit(driver)
+
     @staticmethod
-    def create_driver():
-        """Create Chrome WebDriver instance."""
-        driver = webdriver.Chrome()
-        driver.maximize_window()
-        return driver
\ No newline at end of file
+    def _quit(driver: webdriver.Remote) -> None:
+        """Quit a driver, ignoring errors from an already dead session."""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error while quitting driver: {e}")
@@ -0,0 +1,179 @@
+"""Pool of live WebDriver sessions reused across tests."""
+
+import atexit
+import logging
+import threading
+from urllib.parse import urlparse
+
+from selenium import webdriver
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from config.config import Config
+from utils.browser_contexts import ContextDriver
+from utils.driver_factory import DriverFactory
+from utils.memory_governor import MemoryGovernor
+from utils.waits.network import NetworkMonitor
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPool:
+    """Hands out live browser sessions and resets them between tests."""
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, factory=None, base_url: str = None, reuse: bool = None, governor: MemoryGovernor = None):
+        self.factory = factory or DriverFactory.acquire
+        self.base_url = base_url or Config.BASE_URL
+        self.reuse = Config.REUSE_DRIVER if reuse is None else reuse
+        self._idle = []
+        self._in_use = set()
+        self._lock = threading.Lock()
+        self.governor = governor or MemoryGovernor()
+        self.stats = {'created': 0, 'reused': 0, 'recycled': 0, 'memory_recycled': 0}
+
+    @classmethod
+    def shared(cls) -> "DriverPool":
+        """Get the process-wide pool (one per pytest worker)."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                atexit.register(cls._shared.shutdown)
+            return cls._shared
+
+    def acquire(self) -> webdriver.Remote:
+        """Get a live driver, starting a new browser only when none is idle."""
+        with self._lock:
+            driver = self._idle.pop() if self._idle else None
+            if driver is not None:
+                self.stats['reused'] += 1
+
+        if driver is None:
+            driver = self.factory()
+            driver.get(self.base_url)
+            with self._lock:
+                self.stats['created'] += 1
+
+        with self._lock:
+            self._in_use.add(driver)
+        return driver
+
+    def release(self, driver: webdriver.Remote) -> None:
+        """Return a driver to the pool, recycling it if the reset fails or it uses too much memory."""
+        with self._lock:
+            self._in_use.discard(driver)
+
+        if not self.reuse:
+            self._quit(driver)
+            return
+
+        if not self.reset(driver):
+            with self._lock:
+                self.stats['recycled'] += 1
+            logger.warning("Driver reset failed, recycling session")
+            self._quit(driver)
+            return
+
+        if self._over_memory(driver):
+            with self._lock:
+                self.stats['memory_recycled'] += 1
+            self._quit(driver)
+            return
+
+        with self._lock:
+            self._idle.append(driver)
+
+    def _over_memory(self, driver: webdriver.Remote) -> bool:
+        """
+        Whether the driver's browser is over the memory limits. Contexts share one
+        browser, so it is measured and recycled as a whole: an over-limit host is
+        retired and quits once its last context is disposed.
+        """
+        if not isinstance(driver, ContextDriver):
+            return self.governor.should_recycle(driver)
+
+        host = driver.host
+        if host.retired:
+            return True
+        with host.lock:
+            over_limit = self.governor.should_recycle(host.driver)
+        if over_limit:
+            with self._lock:
+                idle = [other for other in self._idle if isinstance(other, ContextDriver) and other.host is host]
+                self._idle = [other for other in self._idle if other not in idle]
+            host.retire()
+            for other in idle:
+                self._quit(other)
+        return over_limit
+
+    def reset(self, driver: webdriver.Remote) -> bool:
+        """Bring a used session back to a clean state on the base URL."""
+        try:
+            self._dismiss_alert(driver)
+            self._close_extra_windows(driver)
+            driver.switch_to.default_content()
+            self._clear_cookies(driver)
+            self._clear_origin_storage(driver)
+            driver.get(self.base_url)
+            if self.base_url.startswith("http"):
+                # sessionStorage belongs to the tab, and without CDP this is the only clear
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            # The performance log only drains on read; don't let it grow across tests
+            NetworkMonitor.for_driver(driver).reset()
+            return True
+        except WebDriverException as e:
+            logger.error(f"Failed to reset driver: {e}")
+            return False
+
+    def shutdown(self) -> None:
+        """Quit every session owned by the pool."""
+        with self._lock:
+            drivers = self._idle + list(self._in_use)
+            self._idle = []
+            self._in_use.clear()
+
+        for driver in drivers:
+            self._quit(driver)
+        logger.info(f"Driver pool shut down: {self.stats}")
+
+    @staticmethod
+    def _dismiss_alert(driver: webdriver.Remote) -> None:
+        """Dismiss an alert left open by the previous test."""
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+
+    @staticmethod
+    def _close_extra_windows(driver: webdriver.Remote) -> None:
+        """Close every window except the first one."""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+    @staticmethod
+    def _clear_cookies(driver: webdriver.Remote) -> None:
+        """Clear cookies for all domains when CDP is available."""
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.delete_all_cookies()
+
+    def _clear_origin_storage(self, driver: webdriver.Remote) -> None:
+        """Clear the base URL's localStorage and IndexedDB before it loads, when CDP is available."""
+        if hasattr(driver, "execute_cdp_cmd"):
+            base = urlparse(self.base_url)
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": f"{base.scheme}://{base.netloc}",
+                "storageTypes": "local_storage,indexeddb",
+            })
+
+    @staticmethod
+    def _quit(driver: webdriver.Remote) -> None:
+        """Quit a driver, ignoring errors from an already dead session."""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error while quitting driver: {e}")
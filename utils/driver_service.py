@@ -0,0 +1,90 @@
+"""Long-lived driver service shared by every session in a worker."""
+
+import json
+import logging
+import os
+import threading
+
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.common.driver_finder import DriverFinder
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class SharedServiceMixin:
+    """Keeps one driver process running across many browser sessions."""
+
+    def start(self) -> None:
+        """Start the driver process unless it is already running."""
+        with self._start_lock:
+            process = getattr(self, "process", None)
+            if process is None or process.poll() is not None:
+                super().start()
+                logger.info(f"Started shared driver service at {self.service_url}")
+
+    def stop(self) -> None:
+        """Ignore stop requests from quitting sessions; see shutdown()."""
+
+    def shutdown(self) -> None:
+        """Stop the shared driver process."""
+        super().stop()
+
+
+class SharedChromeService(SharedServiceMixin, ChromeService):
+    """Shared chromedriver service."""
+
+    _start_lock = threading.Lock()
+
+
+class SharedEdgeService(SharedServiceMixin, EdgeService):
+    """Shared msedgedriver service."""
+
+    _start_lock = threading.Lock()
+
+
+SERVICE_CLASSES = {
+    "chrome": SharedChromeService,
+    "edge": SharedEdgeService,
+}
+
+
+class DriverPathCache:
+    """Caches resolved driver binaries on disk so Selenium Manager runs once per machine."""
+
+    @staticmethod
+    def _load() -> dict:
+        try:
+            with open(Config.DRIVER_CACHE_FILE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def get(cls, browser: str, options) -> str:
+        """Get the driver path for a browser, resolving it on a cache miss."""
+        path = cls._load().get(browser)
+        if path and os.path.isfile(path):
+            return path
+
+        service = EdgeService() if browser == "edge" else ChromeService()
+        path = DriverFinder(service, options).get_driver_path()
+        cache = cls._load()
+        cache[browser] = path
+        try:
+            os.makedirs(os.path.dirname(Config.DRIVER_CACHE_FILE), exist_ok=True)
+            with open(Config.DRIVER_CACHE_FILE, "w") as f:
+                json.dump(cache, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not write driver path cache: {e}")
+        logger.info(f"Resolved {browser} driver: {path}")
+        return path
+
+    @classmethod
+    def invalidate(cls, browser: str) -> None:
+        """Forget the cached path, e.g. after the browser was upgraded."""
+        cache = cls._load()
+        if cache.pop(browser, None):
+            with open(Config.DRIVER_CACHE_FILE, "w") as f:
+                json.dump(cache, f, indent=2)
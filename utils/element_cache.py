@@ -0,0 +1,157 @@
+"""Element handles cached per driver until the next navigation or frame switch."""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import weakref
+
+from selenium import webdriver
+from selenium.webdriver.remote.command import Command
+from config.config import Config
+from utils.lazy_driver import unwrap_driver
+
+logger = logging.getLogger(__name__)
+
+
+class ElementCache:
+    """
+    WebElements found by page objects, keyed by locator, so a page method
+    that scrolls to and then clicks the same element finds it once.
+
+    The cache sits on the driver's command path like SessionWatchdog and is
+    emptied by every command that leaves the current document or browsing
+    context. Handles that go stale in between (React re-renders, a click
+    that navigates) are evicted and found again by BasePage.
+
+    Each driver object page objects hold gets its own cache, so every
+    ContextDriver of a shared browser has one; the hook that clears them sits
+    on the real session and is only installed once something is stored, so a
+    LazyDriver does not start its browser for a lookup.
+    """
+
+    INVALIDATING_COMMANDS = (
+        Command.GET, Command.REFRESH, Command.GO_BACK, Command.GO_FORWARD,
+        Command.SWITCH_TO_FRAME, Command.SWITCH_TO_PARENT_FRAME, Command.SWITCH_TO_WINDOW, Command.CLOSE,
+    )
+
+    _lock = threading.Lock()
+    _stats = {}                  # page class -> {"lookups", "hits", "stale"}
+    _atexit_registered = False
+
+    def __init__(self, driver: webdriver.Remote):
+        self.driver = driver
+        self.elements = {}
+        self.installed = False
+
+    @classmethod
+    def for_driver(cls, driver: webdriver.Remote) -> "ElementCache":
+        """Get the cache of a driver or driver proxy, creating it on first use."""
+        # vars(), not getattr: a LazyDriver would start the browser to answer getattr
+        cache = vars(driver).get("element_cache")
+        if cache is None:
+            cache = driver.element_cache = cls(driver)
+        return cache
+
+    def install(self) -> "ElementCache":
+        """Register with the real session, so commands that navigate it clear this cache."""
+        if self.installed:
+            return self
+        session = unwrap_driver(self.driver)
+        caches = vars(session).get("element_caches")
+        if caches is None:
+            caches = session.element_caches = weakref.WeakSet()
+            execute = session.execute
+
+            def clearing_execute(driver_command: str, params: dict = None):
+                """Run a command, dropping every cached handle first if it changes document or frame."""
+                if driver_command in self.INVALIDATING_COMMANDS:
+                    for cache in list(caches):
+                        cache.elements.clear()
+                return execute(driver_command, params)
+            session.execute = clearing_execute
+        caches.add(self)
+        self.installed = True
+        return self
+
+    def lookup(self, page: str, locator: tuple):
+        """Cached element for a locator, or None; counted towards the page's hit rate."""
+        element = self.elements.get(locator)
+        self._count(page, "hits" if element is not None else None)
+        return element
+
+    def store(self, locator: tuple, element) -> None:
+        """Remember the element a locator resolved to."""
+        self.install()
+        self.elements[locator] = element
+
+    def forget(self, locator: tuple) -> None:
+        """Drop a locator, e.g. once its element has disappeared."""
+        self.elements.pop(locator, None)
+
+    def evict(self, page: str, locator: tuple) -> None:
+        """Drop a handle that went stale."""
+        self.forget(locator)
+        self._count(page, "stale", lookup=False)
+
+    @classmethod
+    def _count(cls, page: str, outcome: str = None, lookup: bool = True) -> None:
+        with cls._lock:
+            entry = cls._stats.setdefault(page, {"lookups": 0, "hits": 0, "stale": 0})
+            entry["lookups"] += lookup
+            if outcome:
+                entry[outcome] += 1
+            if not cls._atexit_registered:
+                atexit.register(cls.save)
+                cls._atexit_registered = True
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Snapshot of this process' counts per page class."""
+        with cls._lock:
+            return {page: dict(entry) for page, entry in cls._stats.items()}
+
+    @classmethod
+    def directory(cls) -> str:
+        """Where each process drops its counts."""
+        return os.path.join(Config.REPORTS_DIR, "element_cache")
+
+    @classmethod
+    def save(cls) -> None:
+        """Write this process' counts as JSON."""
+        stats = cls.stats()
+        if not stats:
+            return
+        os.makedirs(cls.directory(), exist_ok=True)
+        worker = os.environ.get("PYTEST_XDIST_WORKER", f"pid{os.getpid()}")
+        path = os.path.join(cls.directory(), f"{worker}.json")
+        with open(path, "w") as f:
+            json.dump(stats, f, indent=2)
+        logger.info(f"Element cache stats saved: {path}")
+
+    @classmethod
+    def aggregate(cls) -> dict:
+        """Merge the counts written by every process, with the hit rate per page class."""
+        merged = {}
+        if not os.path.isdir(cls.directory()):
+            return merged
+        for name in os.listdir(cls.directory()):
+            if not name.endswith(".json"):
+                continue
+            with open(os.path.join(cls.directory(), name)) as f:
+                for page, entry in json.load(f).items():
+                    total = merged.setdefault(page, {"lookups": 0, "hits": 0, "stale": 0})
+                    for key in total:
+                        total[key] += entry[key]
+        for entry in merged.values():
+            entry["hit_rate"] = round(entry["hits"] / entry["lookups"], 3) if entry["lookups"] else 0.0
+        return merged
+
+    @classmethod
+    def clear(cls) -> None:
+        """Remove counts left by a previous run."""
+        if os.path.isdir(cls.directory()):
+            for name in os.listdir(cls.directory()):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(cls.directory(), name))
@@ -0,0 +1,124 @@
+"""Drags as one W3C pointer action sequence, planned from geometry read in one script call."""
+
+import logging
+
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.actions import interaction
+from selenium.webdriver.common.actions.action_builder import ActionBuilder
+from selenium.webdriver.common.actions.pointer_input import PointerInput
+from config.config import Config
+from utils.locators import compile_locator
+from utils.waits.dom_observer import translate_locator
+
+logger = logging.getLogger(__name__)
+
+# Scrolls the source to the middle of the viewport, then, if the drop point is
+# off-screen, scrolls again so the midpoint of the drag is centred. Targets are
+# WebElements or [using, value] locators resolved here, so no find commands are sent.
+_GEOMETRY_SCRIPT = """
+const [targets, offset] = arguments;
+const find = (using, value) => using === 'xpath'
+    ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(value);
+const els = targets.map(target => Array.isArray(target) ? find(target[0], target[1]) : target);
+const missing = els.findIndex(el => !el);
+if (missing >= 0) return {missing: missing};
+const view = () => [document.documentElement.clientWidth, document.documentElement.clientHeight];
+const centre = el => {
+    const r = el.getBoundingClientRect();
+    return [r.left + r.width / 2, r.top + r.height / 2];
+};
+els[0].scrollIntoView({block: 'center', inline: 'center', behavior: 'instant'});
+const from = centre(els[0]);
+const to = offset ? [from[0] + offset[0], from[1] + offset[1]] : centre(els[els.length - 1]);
+const [width, height] = view();
+if (to[0] < 0 || to[0] >= width || to[1] < 0 || to[1] >= height) {
+    window.scrollBy({left: (from[0] + to[0] - width) / 2, top: (from[1] + to[1] - height) / 2, behavior: 'instant'});
+}
+return {view: view(), rects: els.map(el => {
+    const r = el.getBoundingClientRect();
+    return [r.left, r.top, r.width, r.height];
+})};
+"""
+
+
+class Gestures:
+    """
+    Pointer gestures sent as one action sequence (press, a fixed number of
+    interpolated moves, release), so a drag costs a geometry script and a
+    single perform() however far it goes, and moves the same way every run:
+
+        gestures = Gestures(driver)
+        gestures.drag((By.ID, "draggable"), (By.ID, "droppable"))   # sortable items, drop zones
+        gestures.drag_by(resize_handle, 50, 30)                     # draggables, resize handles
+
+    Sources and targets are WebElements or locators. Drop points outside the
+    viewport are clamped to its edge instead of failing with "move target out of bounds".
+    """
+
+    def __init__(self, driver: webdriver.Remote, steps: int = None, step_ms: int = None):
+        self.driver = driver
+        self.steps = max(1, steps or Config.GESTURE_STEPS)
+        self.step_ms = Config.GESTURE_STEP_MS if step_ms is None else step_ms
+
+    def geometry(self, *targets, offset: tuple = None) -> dict:
+        """
+        Scroll the first target into view and return every target's viewport rect
+        as (left, top, width, height), plus the viewport size, from one script call.
+
+        Args:
+            offset: Drop point relative to the first target's centre, kept on screen instead of the last target
+        """
+        args = [list(translate_locator(compile_locator(target))) if isinstance(target, tuple) else target
+                for target in targets]
+        result = self.driver.execute_script(_GEOMETRY_SCRIPT, args, list(offset) if offset else None)
+        if "missing" in result:
+            raise NoSuchElementException(f"No element matches {targets[result['missing']]}")
+        return result
+
+    def drag(self, source, target, offset: tuple = (0, 0)) -> tuple:
+        """Drag source onto target's centre, shifted by offset; returns the (start, end) viewport points."""
+        geometry = self.geometry(source, target)
+        start = _centre(geometry["rects"][0])
+        x, y = _centre(geometry["rects"][1])
+        return self._perform(start, (x + offset[0], y + offset[1]), geometry["view"])
+
+    def drag_by(self, source, x_offset: int, y_offset: int) -> tuple:
+        """Drag source by an offset from its centre, e.g. a draggable box or a resize handle."""
+        geometry = self.geometry(source, offset=(x_offset, y_offset))
+        start = _centre(geometry["rects"][0])
+        return self._perform(start, (start[0] + x_offset, start[1] + y_offset), geometry["view"])
+
+    def path(self, start: tuple, end: tuple) -> list:
+        """The points the pointer moves through after the press, ending at end."""
+        return [
+            (round(start[0] + (end[0] - start[0]) * step / self.steps),
+             round(start[1] + (end[1] - start[1]) * step / self.steps))
+            for step in range(1, self.steps + 1)
+        ]
+
+    def _perform(self, start: tuple, end: tuple, view: list) -> tuple:
+        start, end = _clamp(start, view), _clamp(end, view)
+        builder = ActionBuilder(
+            self.driver, mouse=PointerInput(interaction.POINTER_MOUSE, "mouse"), duration=self.step_ms
+        )
+        pointer = builder.pointer_action
+        pointer.move_to_location(*start).pointer_down().pause(self.step_ms / 1000)
+        for point in self.path(start, end):
+            pointer.move_to_location(*point)
+        pointer.pause(self.step_ms / 1000).pointer_up()
+        builder.perform()
+        logger.info(f"Dragged from {start} to {end} in {self.steps} moves")
+        return start, end
+
+
+def _centre(rect: list) -> tuple:
+    left, top, width, height = rect
+    return round(left + width / 2), round(top + height / 2)
+
+
+def _clamp(point: tuple, view: list) -> tuple:
+    """Keep a point inside the viewport, where pointer moves are allowed."""
+    width, height = view
+    return min(max(point[0], 0), width - 1), min(max(point[1], 0), height - 1)
@@ -0,0 +1,65 @@
+"""WebDriver proxy that starts the browser on first use."""
+
+import logging
+import threading
+
+from selenium import webdriver
+
+logger = logging.getLogger(__name__)
+
+
+def unwrap_driver(driver) -> webdriver.Remote:
+    """
+    The webdriver.Remote behind LazyDriver and ContextDriver proxies (starting
+    a lazy one), or the driver itself. Per-session hooks such as a wrapped
+    execute must go on this object: the real driver's own methods never call the proxy.
+    """
+    while callable(getattr(type(driver), "unwrap", None)):
+        driver = driver.unwrap()
+    return driver
+
+
+class LazyDriver:
+    """
+    Stands in for a WebDriver and only launches the browser when a
+    command is first issued, so API-only tests never start one.
+    """
+
+    def __init__(self, factory):
+        """
+        Args:
+            factory: Callable returning a started WebDriver
+        """
+        self._factory = factory
+        self._driver = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_started(self) -> bool:
+        """Whether the browser has been launched."""
+        return self._driver is not None
+
+    def unwrap(self) -> webdriver.Remote:
+        """Get the real driver, starting the browser if needed."""
+        if self._driver is None:
+            with self._lock:
+                if self._driver is None:
+                    logger.info("First WebDriver command issued, starting browser")
+                    self._driver = self._factory()
+        return self._driver
+
+    def quit(self) -> None:
+        """Quit the browser if it was ever started."""
+        if self._driver is not None:
+            self._driver.quit()
+            self._driver = None
+
+    def __getattr__(self, name):
+        # Only reached for attributes not defined on the proxy itself
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.unwrap(), name)
+
+    def __repr__(self) -> str:
+        state = repr(self._driver) if self._driver is not None else "not started"
+        return f"<LazyDriver {state}>"
@@ -0,0 +1,146 @@
+"""Rewrite XPath locators to CSS selectors where the two mean the same thing."""
+
+import functools
+import logging
+import re
+
+from selenium.webdriver.common.by import By
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+_LITERAL = r"""('[^']*'|"[^"]*")"""
+_NAME = r"([a-zA-Z_][\w-]*)"
+
+# XPath predicate condition -> CSS attribute operator (None: attribute exists)
+_CONDITIONS = [
+    (re.compile(rf"^@{_NAME}$"), None),
+    (re.compile(rf"^@{_NAME}\s*=\s*{_LITERAL}$"), "="),
+    (re.compile(rf"^contains\(\s*@{_NAME}\s*,\s*{_LITERAL}\s*\)$"), "*="),
+    (re.compile(rf"^starts-with\(\s*@{_NAME}\s*,\s*{_LITERAL}\s*\)$"), "^="),
+]
+_TAG = re.compile(r"^(\*|[a-zA-Z][\w-]*)")
+_POSITION = re.compile(r"^[1-9]\d*$")
+
+
+def _split(text: str, separator: str) -> list:
+    """Split on a separator that is outside quotes, brackets and parentheses."""
+    parts, depth, quote, start, i = [], 0, None, 0, 0
+    while i < len(text):
+        char = text[i]
+        if quote:
+            quote = None if char == quote else quote
+        elif depth == 0 and text.startswith(separator, i):
+            parts.append(text[start:i])
+            i += len(separator)
+            start = i
+            continue
+        elif char in "'\"":
+            quote = char
+        elif char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+        i += 1
+    parts.append(text[start:])
+    return parts
+
+
+def _condition(text: str) -> str:
+    """One predicate condition as a CSS attribute selector, or None."""
+    for pattern, operator in _CONDITIONS:
+        match = pattern.match(text)
+        if not match:
+            continue
+        if operator is None:
+            return f"[{match.group(1)}]"
+        name, literal = match.groups()
+        value = literal[1:-1]
+        if not value and operator != "=":
+            return None  # XPath matches every element here, CSS none
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'[{name}{operator}"{escaped}"]'
+    return None
+
+
+def _step(text: str) -> str:
+    """One location step (tag plus predicates) as a compound CSS selector, or None."""
+    tag = _TAG.match(text)
+    if not tag:
+        return None
+    name, rest = tag.group(1), text[tag.end():]
+    if rest and not (rest.startswith("[") and rest.endswith("]")):
+        return None
+    filters, position = "", ""
+    for predicate in (_split(rest[1:-1], "][") if rest else []):
+        predicate = predicate.strip()
+        if _POSITION.match(predicate):
+            if position:
+                return None
+            if filters:
+                # [n] after a filter counts only the siblings that passed it; the
+                # "of" selector already requires the tag and filters
+                position = f":nth-child({predicate} of {name}{filters})"
+                name, filters = "", ""
+            else:
+                position = f":nth-{'child' if name == '*' else 'of-type'}({predicate})"
+            continue
+        conditions = [_condition(part.strip()) for part in _split(predicate, " and ")]
+        if None in conditions:
+            return None
+        filters += "".join(conditions)
+    return name + filters + position
+
+
+def _path(text: str) -> str:
+    """A '//step/step//step' path as a CSS selector, or None."""
+    text = text.strip()
+    if not text.startswith("//"):
+        return None
+    css = []
+    for descendant in _split(text[2:], "//"):
+        for index, child in enumerate(_split(descendant, "/")):
+            step = _step(child.strip())
+            if step is None:
+                return None
+            if css:
+                css.append(" > " if index else " ")
+            css.append(step)
+    return "".join(css)
+
+
+def xpath_to_css(xpath: str) -> str:
+    """
+    Equivalent CSS selector for a document-level XPath, or None when there is
+    none (text(), axes, parent steps, or, last(), ...).
+
+        //label[@for='yesRadio']               ->  label[for="yesRadio"]
+        //div[@class='card mt-4 top-card'][2]  ->  :nth-child(2 of div[class="card mt-4 top-card"])
+        //h1 | //h2                            ->  h1, h2
+    """
+    paths = [_path(path) for path in _split(xpath, "|")]
+    if not paths or None in paths:
+        return None
+    return ", ".join(paths)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile(by: str, value: str) -> tuple:
+    if by == By.XPATH:
+        css = xpath_to_css(value)
+        if css is not None:
+            logger.debug(f"Compiled XPath {value!r} to CSS {css!r}")
+            return By.CSS_SELECTOR, css
+    return by, value.strip()
+
+
+def compile_locator(locator: tuple) -> tuple:
+    """
+    Locator to hand to the driver: XPath rewritten to CSS when that keeps the
+    meaning, anything else unchanged. Compiled forms are cached; COMPILE_XPATH=false
+    turns the rewrite off.
+    """
+    if not Config.COMPILE_XPATH:
+        return locator
+    by, value = locator
+    return _compile(by, value)
@@ -0,0 +1,92 @@
+"""Browser memory tracking and recycle decisions for reused sessions."""
+
+import csv
+import logging
+import os
+from datetime import datetime
+
+import psutil
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from config.config import Config
+from utils.process_tree import session_processes
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryGovernor:
+    """Samples browser memory after each test and flags sessions to recycle."""
+
+    def __init__(self, max_rss_mb: int = None, max_js_heap_mb: int = None):
+        """
+        Args:
+            max_rss_mb: Process tree limit, defaults to Config.MAX_BROWSER_RSS_MB; 0 turns it off
+            max_js_heap_mb: JS heap limit, defaults to Config.MAX_JS_HEAP_MB; 0 turns it off
+        """
+        self.max_rss_mb = Config.MAX_BROWSER_RSS_MB if max_rss_mb is None else max_rss_mb
+        self.max_js_heap_mb = Config.MAX_JS_HEAP_MB if max_js_heap_mb is None else max_js_heap_mb
+        worker = os.environ.get("PYTEST_XDIST_WORKER", f"pid{os.getpid()}")
+        self.log_file = os.path.join(Config.REPORTS_DIR, "memory", f"{worker}.csv")
+
+    def sample(self, driver: webdriver.Remote) -> dict:
+        """
+        Measure the session's memory.
+
+        Returns:
+            Dict with rss_mb (whole process tree) and js_heap_mb (None when CDP is unavailable)
+        """
+        rss = 0
+        for process in session_processes(driver):
+            try:
+                rss += process.memory_info().rss
+            except psutil.Error:
+                pass
+
+        js_heap = None
+        if hasattr(driver, "execute_cdp_cmd"):
+            try:
+                driver.execute_cdp_cmd("Performance.enable", {})
+                metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+                js_heap = next(m["value"] for m in metrics if m["name"] == "JSHeapUsedSize")
+            except (WebDriverException, StopIteration):
+                pass
+
+        return {
+            "rss_mb": round(rss / 1024 / 1024, 1),
+            "js_heap_mb": round(js_heap / 1024 / 1024, 1) if js_heap is not None else None,
+        }
+
+    def should_recycle(self, driver: webdriver.Remote) -> bool:
+        """Sample the session, log it and decide whether it is over the limits."""
+        try:
+            usage = self.sample(driver)
+        except psutil.Error as e:
+            logger.warning(f"Could not sample browser memory: {e}")
+            return False
+
+        # A limit of 0 is off
+        over_rss = self.max_rss_mb > 0 and usage["rss_mb"] > self.max_rss_mb
+        over_heap = self.max_js_heap_mb > 0 and usage["js_heap_mb"] is not None and usage["js_heap_mb"] > self.max_js_heap_mb
+        over_limit = over_rss or over_heap
+        self._log(driver, usage, over_limit)
+        if over_limit:
+            logger.warning(
+                f"Browser memory over limit (RSS {usage['rss_mb']} MB, JS heap {usage['js_heap_mb']} MB), recycling session"
+            )
+        return over_limit
+
+    def _log(self, driver: webdriver.Remote, usage: dict, recycled: bool) -> None:
+        """Append a sample to this worker's memory curve."""
+        os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
+        new_file = not os.path.exists(self.log_file)
+        with open(self.log_file, "a", newline="") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(["timestamp", "session_id", "rss_mb", "js_heap_mb", "recycled"])
+            writer.writerow([
+                datetime.now().isoformat(timespec="seconds"),
+                getattr(driver, "session_id", ""),
+                usage["rss_mb"],
+                usage["js_heap_mb"],
+                recycled
+            ])
@@ -0,0 +1,60 @@
+"""Locate the OS processes behind a WebDriver session."""
+
+import psutil
+from selenium import webdriver
+from utils.driver_service import SharedServiceMixin
+from utils.lazy_driver import unwrap_driver
+
+
+def session_root_processes(driver: webdriver.Remote) -> list:
+    """
+    Find the top-level processes that belong to a session. They are looked up
+    once per session and cached on the driver; finding a Chromium browser
+    means scanning every process on the machine.
+    """
+    session = unwrap_driver(driver)
+    cached = vars(session).get("root_processes")
+    if cached is None or cached[0] != session.session_id:
+        cached = (session.session_id, _find_root_processes(session))
+        session.root_processes = cached
+    return [process for process in cached[1] if process.is_running()]
+
+
+def _find_root_processes(driver: webdriver.Remote) -> list:
+    roots = []
+    capabilities = driver.capabilities
+
+    # Firefox reports its own pid
+    if capabilities.get("moz:processID"):
+        roots.append(psutil.Process(capabilities["moz:processID"]))
+
+    # A per-session driver process owns the browser as a child
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    if process is not None and not isinstance(service, SharedServiceMixin):
+        roots.append(psutil.Process(process.pid))
+        return roots
+
+    # Chromium browsers are identified by their user data dir
+    browser_info = capabilities.get("chrome") or capabilities.get("msedge") or {}
+    user_data_dir = browser_info.get("userDataDir")
+    if user_data_dir:
+        for candidate in psutil.process_iter(["cmdline"]):
+            cmdline = candidate.info["cmdline"] or []
+            if f"--user-data-dir={user_data_dir}" in cmdline and not any(
+                arg.startswith("--type=") for arg in cmdline
+            ):
+                roots.append(candidate)
+    return roots
+
+
+def session_processes(driver: webdriver.Remote) -> list:
+    """Get every process in the session's tree (roots and their children)."""
+    processes = []
+    for root in session_root_processes(driver):
+        try:
+            processes.append(root)
+            processes.extend(root.children(recursive=True))
+        except psutil.NoSuchProcess:
+            pass
+    return processes
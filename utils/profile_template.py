@@ -0,0 +1,89 @@
+"""Pre-initialised browser profile that sessions start from a copy of."""
+
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+
+from config.config import Config
+from utils.browser_profiles import get_profile
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileTemplate:
+    """
+    Builds one user data dir per machine with first-run finished and the
+    suite's content prefs applied, then hands each session a cheap copy.
+    """
+
+    MARKER = ".template-ready"
+    # Locks, caches and crash dumps are not worth copying
+    IGNORED = shutil.ignore_patterns("Singleton*", "lockfile", "*Cache*", "Crashpad", "BrowserMetrics*")
+
+    _lock = threading.Lock()
+
+    @classmethod
+    def template_dir(cls, browser: str) -> str:
+        """Location of the template for a browser."""
+        return f"{Config.PROFILE_TEMPLATE_DIR}-{browser}"
+
+    @classmethod
+    def ensure(cls, browser: str, launch) -> str:
+        """
+        Build the template if it does not exist yet.
+
+        Args:
+            browser: chrome or edge
+            launch: Callable taking browser options and returning a started driver
+
+        Returns:
+            Path to the template directory
+        """
+        template_dir = cls.template_dir(browser)
+        with cls._lock:
+            if not os.path.exists(os.path.join(template_dir, cls.MARKER)):
+                cls.build(browser, launch)
+        return template_dir
+
+    @classmethod
+    def build(cls, browser: str, launch) -> None:
+        """Launch the browser once on an empty profile and keep the result."""
+        template_dir = cls.template_dir(browser)
+        os.makedirs(os.path.dirname(template_dir), exist_ok=True)
+        staging_dir = tempfile.mkdtemp(prefix="profile-template-", dir=os.path.dirname(template_dir))
+
+        options = get_profile().build_options(browser)
+        options.add_argument(f"--user-data-dir={staging_dir}")
+        options.add_argument("--no-first-run")
+        options.add_argument("--no-default-browser-check")
+
+        driver = launch(options)
+        try:
+            driver.get("about:blank")
+        finally:
+            driver.quit()
+
+        with open(os.path.join(staging_dir, cls.MARKER), "w") as f:
+            f.write(datetime.now().isoformat())
+
+        # Another worker may have finished first; keep whichever landed
+        if os.path.exists(os.path.join(template_dir, cls.MARKER)):
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return
+        shutil.rmtree(template_dir, ignore_errors=True)
+        try:
+            os.rename(staging_dir, template_dir)
+            logger.info(f"Built {browser} profile template at {template_dir}")
+        except OSError:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    @classmethod
+    def clone(cls, template_dir: str) -> str:
+        """Copy the template to a fresh directory, on tmpfs when available."""
+        base = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+        target = tempfile.mkdtemp(prefix="demoqa-profile-", dir=base)
+        shutil.copytree(template_dir, target, ignore=cls.IGNORED, dirs_exist_ok=True)
+        return target
@@ -0,0 +1,137 @@
+"""Remote WebDriver executor with a shared keep-alive connection pool."""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+
+from urllib3.util.retry import Retry
+
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """Per-command latency histogram with fixed millisecond buckets."""
+
+    BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float("inf")]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.commands = {}
+
+    def record(self, command: str, seconds: float) -> None:
+        """Add one command duration."""
+        ms = seconds * 1000
+        with self._lock:
+            entry = self.commands.setdefault(command, {
+                "count": 0, "total_ms": 0.0, "max_ms": 0.0, "buckets": [0] * len(self.BUCKETS_MS)
+            })
+            entry["count"] += 1
+            entry["total_ms"] += ms
+            entry["max_ms"] = max(entry["max_ms"], ms)
+            entry["buckets"][bisect_left(self.BUCKETS_MS, ms)] += 1
+
+    def summary(self) -> dict:
+        """Histogram per command, with bucket upper bounds as keys."""
+        labels = [f"<={int(b)}ms" if b != float("inf") else ">5000ms" for b in self.BUCKETS_MS]
+        with self._lock:
+            return {
+                command: {
+                    "count": entry["count"],
+                    "mean_ms": round(entry["total_ms"] / entry["count"], 2),
+                    "max_ms": round(entry["max_ms"], 2),
+                    "histogram": {label: n for label, n in zip(labels, entry["buckets"]) if n},
+                }
+                for command, entry in sorted(self.commands.items(), key=lambda item: -item[1]["total_ms"])
+            }
+
+    def save(self, path: str) -> None:
+        """Write the summary as JSON."""
+        if not self.commands:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+        logger.info(f"Command latency histogram saved: {path}")
+
+
+class PooledRemoteConnection(RemoteConnection):
+    """Remote connection whose sessions all share one keep-alive pool and record command latency."""
+
+    _shared_pool = None
+    _pool_lock = threading.Lock()
+    _in_flight = 0
+    _exhausted_logged = False
+    latency = LatencyHistogram()
+
+    @staticmethod
+    def pool_size() -> int:
+        """
+        Connections per host: REMOTE_POOL_SIZE, or enough for the active session,
+        one quitting in the background and every pre-warmed boot.
+        """
+        return Config.REMOTE_POOL_SIZE or max(4, Config.PREWARM_DRIVERS + 2)
+
+    @classmethod
+    def for_url(cls, remote_url: str) -> "PooledRemoteConnection":
+        """Create a connection to a Grid-compatible endpoint."""
+        extra_headers = {"Accept-Encoding": "gzip"} if Config.REMOTE_GZIP else None
+        return cls(client_config=ClientConfig(
+            remote_server_addr=remote_url,
+            keep_alive=True,
+            extra_headers=extra_headers,
+        ))
+
+    def _get_connection_manager(self):
+        """Hand every session the same pool, created on first use."""
+        with PooledRemoteConnection._pool_lock:
+            if PooledRemoteConnection._shared_pool is None:
+                # Pool sizing goes through the client config so the base class still
+                # applies certificates and HTTP/SOCKS proxies; explicit settings win
+                init_args = self._client_config.init_args_for_pool_manager.setdefault("init_args_for_pool_manager", {})
+                # Only GETs are safe to send twice, e.g. after the grid dropped a kept-alive connection
+                retries = Retry(total=1, allowed_methods={"GET"})
+                for name, value in (("num_pools", 4), ("maxsize", self.pool_size()), ("block", True), ("retries", retries)):
+                    init_args.setdefault(name, value)
+                PooledRemoteConnection._shared_pool = super()._get_connection_manager()
+                worker = os.environ.get("PYTEST_XDIST_WORKER", f"pid{os.getpid()}")
+                atexit.register(
+                    self.latency.save,
+                    os.path.join(Config.REPORTS_DIR, "command_latency", f"{worker}.json")
+                )
+            return PooledRemoteConnection._shared_pool
+
+    def execute(self, command, params):
+        """Send a command and record how long the round trip took."""
+        self._enter()
+        started = time.perf_counter()
+        try:
+            return super().execute(command, params)
+        finally:
+            self.latency.record(command, time.perf_counter() - started)
+            with PooledRemoteConnection._pool_lock:
+                PooledRemoteConnection._in_flight -= 1
+
+    @classmethod
+    def _enter(cls) -> None:
+        """Count a request in flight, warning once when it has to wait for a free connection."""
+        with cls._pool_lock:
+            cls._in_flight += 1
+            exhausted = cls._in_flight > cls.pool_size() and not cls._exhausted_logged
+            if exhausted:
+                cls._exhausted_logged = True
+        if exhausted:
+            logger.warning(
+                f"Remote connection pool exhausted ({cls.pool_size()} connections), commands are queuing; "
+                f"raise REMOTE_POOL_SIZE"
+            )
+
+    def close(self):
+        """Keep the shared pool open for the other sessions."""
@@ -0,0 +1,291 @@
+"""
+Sleep-budget profiler.
+
+Intercepts time.sleep, explicit waits (WebDriverWait, Waiter, WaitStrategy,
+DomObserver, AttributeStream) and implicit-wait lookups, attributes the blocked time to the
+running test and to the test-file line that caused it, and ranks the biggest
+hotspots.
+
+As a pytest plugin (loaded from tests/conftest.py):
+    pytest --sleep-profile                 ranked report at the end of the run
+    pytest --sleep-budget=5                fail tests that block for more than 5s
+    @pytest.mark.sleep_budget(2)           per-test budget
+
+Outside pytest (the individual scripts), SLEEP_PROFILE=true installs it when
+utils.driver_factory is imported; totals go to reports/sleep_profile/<worker>.json.
+"""
+
+import atexit
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+import pytest
+import selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.wait import WebDriverWait
+from config.config import Config
+from utils.waits import AttributeStream, DomObserver, Waiter, WaitStrategy
+
+logger = logging.getLogger(__name__)
+
+# Frames in these directories are never reported as the call site
+_IGNORED_DIRS = (
+    os.path.dirname(os.path.abspath(__file__)) + os.sep,
+    os.path.dirname(os.path.abspath(selenium.__file__)) + os.sep,
+)
+
+
+class SleepProfiler:
+    """Process-wide blocked-time totals per test and per call site."""
+
+    _lock = threading.Lock()
+    _local = threading.local()
+    _installed = []              # (owner, name, original) to restore on uninstall
+    _tests = {}                  # test -> {"sleep": s, "explicit": s, "implicit": s}
+    _sites = {}                  # call site -> {"kind", "calls", "total_s", "max_s", "tests"}
+    current_test = None
+    _atexit_registered = False
+
+    @classmethod
+    def install(cls) -> None:
+        """Patch sleep and the wait entry points; safe to call twice."""
+        if cls._installed:
+            return
+        targets = [
+            (time, "sleep", "sleep"),
+            (WebDriverWait, "until", "explicit"),
+            (WebDriverWait, "until_not", "explicit"),
+            # Private loops, so the public methods keep reading their caller's frame
+            (Waiter, "_poll", "explicit"),
+            (WaitStrategy, "until", "explicit"),
+            (DomObserver, "_run", "explicit"),
+            (AttributeStream, "_await", "explicit"),
+            (WebDriver, "find_element", "implicit"),
+            (WebDriver, "find_elements", "implicit"),
+        ]
+        for owner, name, kind in targets:
+            original = getattr(owner, name)
+            setattr(owner, name, cls._wrap(original, kind))
+            cls._installed.append((owner, name, original))
+
+        original_implicitly_wait = WebDriver.implicitly_wait
+
+        def implicitly_wait(driver, time_to_wait):
+            driver.implicit_wait_s = time_to_wait
+            return original_implicitly_wait(driver, time_to_wait)
+        WebDriver.implicitly_wait = implicitly_wait
+        cls._installed.append((WebDriver, "implicitly_wait", original_implicitly_wait))
+
+    @classmethod
+    def uninstall(cls) -> None:
+        """Restore everything install() patched."""
+        while cls._installed:
+            owner, name, original = cls._installed.pop()
+            setattr(owner, name, original)
+
+    @classmethod
+    def _wrap(cls, function, kind: str):
+        """
+        Time a blocking call unless it runs inside another one already being timed,
+        or off the main thread (pre-warm, driver service and watchdog threads do not block the test).
+        """
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if threading.current_thread() is not threading.main_thread():
+                return function(*args, **kwargs)
+            if kind == "implicit" and not getattr(args[0], "implicit_wait_s", 0):
+                return function(*args, **kwargs)
+            if getattr(cls._local, "depth", 0):
+                return function(*args, **kwargs)
+            cls._local.depth = 1
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                cls._local.depth = 0
+                cls.record(kind, time.perf_counter() - started, sys._getframe(1))
+        return wrapper
+
+    @staticmethod
+    def call_site(frame) -> tuple:
+        """
+        Innermost frame in a test file, else the innermost outside this module
+        and selenium.
+
+        Returns:
+            (site label "path:line (function)", test label "path::function")
+        """
+        fallback = None
+        while frame:
+            path = os.path.abspath(frame.f_code.co_filename)
+            if not path.startswith(_IGNORED_DIRS):
+                relative = os.path.relpath(path)
+                label = f"{relative}:{frame.f_lineno} ({frame.f_code.co_name})"
+                test = f"{relative}::{frame.f_code.co_name}"
+                if f"{os.sep}tests{os.sep}" in path or os.path.basename(path).startswith("test_"):
+                    return label, test
+                fallback = fallback or (label, test)
+            frame = frame.f_back
+        return fallback or ("<unknown>", "<unknown>")
+
+    @classmethod
+    def record(cls, kind: str, seconds: float, frame) -> None:
+        """Add one blocked interval."""
+        site, script_test = cls.call_site(frame)
+        test = cls.current_test or script_test
+        with cls._lock:
+            totals = cls._tests.setdefault(test, {"sleep": 0.0, "explicit": 0.0, "implicit": 0.0})
+            totals[kind] += seconds
+            entry = cls._sites.setdefault(site, {"kind": kind, "calls": 0, "total_s": 0.0, "max_s": 0.0, "tests": []})
+            entry["calls"] += 1
+            entry["total_s"] += seconds
+            entry["max_s"] = max(entry["max_s"], seconds)
+            if test not in entry["tests"]:
+                entry["tests"].append(test)
+            if not cls._atexit_registered:
+                atexit.register(cls.save)
+                cls._atexit_registered = True
+
+    @classmethod
+    def blocked(cls, test: str) -> float:
+        """Total blocked seconds of a test so far."""
+        with cls._lock:
+            return sum(cls._tests.get(test, {}).values())
+
+    @classmethod
+    def hotspots(cls, top: int = None) -> list:
+        """Call sites by total blocked time, biggest first."""
+        with cls._lock:
+            ranked = sorted(cls._sites.items(), key=lambda item: -item[1]["total_s"])
+        return ranked[:top] if top else ranked
+
+    @staticmethod
+    def directory() -> str:
+        """Where each process drops its totals."""
+        return os.path.join(Config.REPORTS_DIR, "sleep_profile")
+
+    @classmethod
+    def save(cls) -> None:
+        """Write this process' totals as JSON."""
+        with cls._lock:
+            if not cls._sites:
+                return
+            data = {"tests": cls._tests, "sites": cls._sites}
+            os.makedirs(cls.directory(), exist_ok=True)
+            worker = os.environ.get("PYTEST_XDIST_WORKER", f"pid{os.getpid()}")
+            path = os.path.join(cls.directory(), f"{worker}.json")
+            with open(path, "w") as f:
+                json.dump(data, f, indent=2)
+        logger.info(f"Sleep profile saved: {path}")
+
+    @classmethod
+    def aggregate(cls) -> dict:
+        """Merge every process' totals: call sites ranked by blocked time and per-test totals."""
+        tests, sites = {}, {}
+        if os.path.isdir(cls.directory()):
+            for name in os.listdir(cls.directory()):
+                if not name.endswith(".json"):
+                    continue
+                with open(os.path.join(cls.directory(), name)) as f:
+                    data = json.load(f)
+                for test, totals in data["tests"].items():
+                    merged = tests.setdefault(test, {"sleep": 0.0, "explicit": 0.0, "implicit": 0.0})
+                    for kind, seconds in totals.items():
+                        merged[kind] += seconds
+                for site, entry in data["sites"].items():
+                    merged = sites.setdefault(site, {"kind": entry["kind"], "calls": 0, "total_s": 0.0, "max_s": 0.0, "tests": []})
+                    merged["calls"] += entry["calls"]
+                    merged["total_s"] += entry["total_s"]
+                    merged["max_s"] = max(merged["max_s"], entry["max_s"])
+                    merged["tests"] += [test for test in entry["tests"] if test not in merged["tests"]]
+        return {
+            "sites": dict(sorted(sites.items(), key=lambda item: -item[1]["total_s"])),
+            "tests": dict(sorted(tests.items(), key=lambda item: -sum(item[1].values()))),
+        }
+
+    @classmethod
+    def clear(cls) -> None:
+        """Remove totals left by a previous run."""
+        if os.path.isdir(cls.directory()):
+            for name in os.listdir(cls.directory()):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(cls.directory(), name))
+
+
+# pytest plugin hooks
+
+def pytest_addoption(parser):
+    """Register the profiler options."""
+    group = parser.getgroup("sleep-profile", "sleep and wait profiling")
+    group.addoption("--sleep-profile", action="store_true", default=False,
+                    help="Rank the call sites where tests block in sleeps and waits")
+    group.addoption("--sleep-budget", action="store", type=float, default=None,
+                    help="Fail tests that block in sleeps/waits for longer than this many seconds")
+    group.addoption("--sleep-profile-top", action="store", type=int, default=15,
+                    help="Number of hotspots to report")
+
+
+def _enabled(config) -> bool:
+    return bool(
+        config.getoption("--sleep-profile") or config.getoption("--sleep-budget") is not None or Config.SLEEP_PROFILE
+    )
+
+
+def pytest_configure(config):
+    """Install the interceptors when profiling or a budget is requested."""
+    config.addinivalue_line("markers", "sleep_budget(seconds): fail the test if it blocks longer than this")
+    if _enabled(config):
+        SleepProfiler.install()
+
+
+def pytest_unconfigure(config):
+    """Put time.sleep and the waits back."""
+    SleepProfiler.uninstall()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Attribute everything blocked during setup, call and teardown to the test."""
+    SleepProfiler.current_test = item.nodeid
+    yield
+    SleepProfiler.current_test = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Turn a passing call into a failure when the test went over its sleep budget."""
+    outcome = yield
+    report = outcome.get_result()
+    if call.when != "call" or not report.passed or not SleepProfiler._installed:
+        return
+    marker = item.get_closest_marker("sleep_budget")
+    budget = marker.args[0] if marker else item.config.getoption("--sleep-budget")
+    if budget is None:
+        return
+    blocked = SleepProfiler.blocked(item.nodeid)
+    if blocked > budget:
+        report.outcome = "failed"
+        report.longrepr = f"Blocked {blocked:.2f}s in sleeps and waits, over the {budget}s sleep budget"
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print the ranked hotspots."""
+    if not _enabled(config) or not SleepProfiler._sites:
+        return
+    top = config.getoption("--sleep-profile-top")
+    terminalreporter.section("sleep profile: blocked time by call site")
+    for site, entry in SleepProfiler.hotspots(top):
+        terminalreporter.write_line(
+            f"{entry['total_s']:8.2f}s  {entry['kind']:<8} x{entry['calls']:<4} max {entry['max_s']:.2f}s  {site}"
+        )
+    with SleepProfiler._lock:
+        ranked_tests = sorted(SleepProfiler._tests.items(), key=lambda item: -sum(item[1].values()))[:top]
+    terminalreporter.section("sleep profile: blocked time by test")
+    for test, totals in ranked_tests:
+        detail = ", ".join(f"{kind} {seconds:.2f}s" for kind, seconds in totals.items() if seconds)
+        terminalreporter.write_line(f"{sum(totals.values()):8.2f}s  {test}  ({detail})")
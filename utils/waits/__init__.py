@@ -0,0 +1,12 @@
+"""Condition-based waits that replace fixed time.sleep calls in the tests."""
+
+from utils.waits import conditions
+from utils.waits.attribute_stream import AttributeStream
+from utils.waits.dom_observer import DomObserver
+from utils.waits.network import NetworkMonitor
+from utils.waits.savings import WaitSavings
+from utils.waits.strategy import WaitStrategy
+from utils.waits.timeouts import AdaptiveTimeouts
+from utils.waits.waiter import Waiter
+
+__all__ = ["AdaptiveTimeouts", "AttributeStream", "conditions", "DomObserver", "NetworkMonitor", "Waiter", "WaitSavings", "WaitStrategy"]
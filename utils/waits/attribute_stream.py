@@ -0,0 +1,192 @@
+"""Stream an element's attribute changes from an in-page MutationObserver."""
+
+import itertools
+import logging
+import sys
+import time
+
+from selenium import webdriver
+from config.config import Config
+from utils.waits.conditions import _resolve
+from utils.waits.dom_observer import ensure_script_timeout
+from utils.waits.savings import WaitSavings, section_of
+
+logger = logging.getLogger(__name__)
+
+_START_SCRIPT = """
+const [el, id, names] = arguments;
+const streams = window.__attrStreams = window.__attrStreams || {};
+const stream = streams[id] = {buffer: [], listeners: new Set(), values: {}};
+names.forEach(name => stream.values[name] = el.getAttribute(name));
+stream.observer = new MutationObserver(records => {
+    const t = performance.now();
+    records.forEach(record => {
+        const value = el.getAttribute(record.attributeName);
+        stream.values[record.attributeName] = value;
+        stream.buffer.push([t, record.attributeName, value]);
+    });
+    stream.listeners.forEach(listener => listener());
+});
+stream.observer.observe(el, {attributes: true, attributeFilter: names});
+return [performance.now(), stream.values];
+"""
+
+_READ_SCRIPT = """
+const stream = (window.__attrStreams || {})[arguments[0]];
+if (!stream) return null;
+const events = stream.buffer;
+stream.buffer = [];
+if (arguments[1]) { stream.observer.disconnect(); delete window.__attrStreams[arguments[0]]; }
+return events;
+"""
+
+# Resolves when the attribute satisfies the comparison, or when it has not
+# changed for quietMs (op "quiet"), or at the timeout; drains the buffer either way.
+_AWAIT_SCRIPT = """
+const [id, name, op, target, quietMs, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const stream = (window.__attrStreams || {})[id];
+if (!stream) { done(null); return; }
+
+const compare = value => {
+    const number = Number(value), goal = Number(target);
+    switch (op) {
+        case '>=': return number >= goal;
+        case '<=': return number <= goal;
+        case '>': return number > goal;
+        case '<': return number < goal;
+        case '==': return String(value) === String(target);
+        case '!=': return String(value) !== String(target);
+    }
+    return false;
+};
+let finished = false, quietTimer = null, timeoutTimer = null;
+const finish = ok => {
+    if (finished) return;
+    finished = true;
+    stream.listeners.delete(check);
+    clearTimeout(quietTimer);
+    clearTimeout(timeoutTimer);
+    const events = stream.buffer;
+    stream.buffer = [];
+    done({ok: ok, value: stream.values[name], events: events, now: performance.now()});
+};
+const check = () => {
+    if (op === 'quiet') {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(true), quietMs);
+    } else if (compare(stream.values[name])) {
+        finish(true);
+    }
+};
+stream.listeners.add(check);
+timeoutTimer = setTimeout(() => finish(false), timeoutMs);
+check();
+"""
+
+
+class AttributeStream:
+    """
+    Records every change of some attributes of one element, with browser
+    timestamps, and waits on thresholds inside the page, e.g.
+
+        with AttributeStream(driver, (By.CSS_SELECTOR, ".progress-bar"), "aria-valuenow") as progress:
+            progress.wait_until(">=", 50)
+            progress.timeline     # [(ms since start, attribute, value), ...]
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, driver: webdriver.Remote, target, *attributes: str, timeout: float = None):
+        self.driver = driver
+        self.target = target
+        self.attributes = list(attributes) or ["aria-valuenow"]
+        self.timeout = timeout or Config.EXPLICIT_WAIT
+        self.id = f"s{next(self._ids)}"
+        self.values = {}
+        self.timeline = []
+        self.started = False
+        self._origin = 0.0
+
+    def __enter__(self) -> "AttributeStream":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> "AttributeStream":
+        """Attach the observer; the current values become the first timeline entries."""
+        if self.started:
+            return self
+        element = _resolve(self.driver, self.target)
+        self._origin, self.values = self.driver.execute_script(_START_SCRIPT, element, self.id, self.attributes)
+        self.timeline = [(0.0, name, value) for name, value in self.values.items()]
+        self.started = True
+        return self
+
+    def read(self) -> list:
+        """Drain the buffered changes in one call; returns the new timeline entries."""
+        return self._append(self.driver.execute_script(_READ_SCRIPT, self.id, False) or [])
+
+    def stop(self) -> None:
+        """Drain what is left and disconnect the observer."""
+        try:
+            self._append(self.driver.execute_script(_READ_SCRIPT, self.id, True) or [])
+        except Exception as e:
+            logger.debug(f"Could not stop attribute stream {self.id}: {e}")
+
+    def value(self, attribute: str = None) -> str:
+        """Latest value seen for an attribute (the first one by default)."""
+        return self.values.get(attribute or self.attributes[0])
+
+    def wait_until(self, op: str, target, attribute: str = None, timeout: float = None, replaces: float = 0) -> bool:
+        """
+        Block until the attribute compares true against target.
+
+        Args:
+            op: One of >=, <=, >, <, == or != (numeric for the ordering operators)
+            replaces: Length of the sleep this wait stands in for, credited to WaitSavings
+
+        Returns:
+            False if the timeout passed first
+        """
+        return self._await(attribute, op, target, 0, timeout, replaces, sys._getframe(1))
+
+    def wait_quiet(self, quiet_ms: int, attribute: str = None, timeout: float = None, replaces: float = 0) -> bool:
+        """Block until the attribute has not changed for quiet_ms, e.g. after stopping an animation."""
+        return self._await(attribute, "quiet", None, quiet_ms, timeout, replaces, sys._getframe(1))
+
+    def _await(self, attribute, op, target, quiet_ms, timeout, replaces, caller) -> bool:
+        attribute = attribute or self.attributes[0]
+        timeout = timeout or self.timeout
+        ensure_script_timeout(self.driver, timeout)
+        started = time.perf_counter()
+        result = self.driver.execute_async_script(
+            _AWAIT_SCRIPT, self.id, attribute, op, target, quiet_ms, int(timeout * 1000)
+        )
+        if replaces:
+            WaitSavings.record(section_of(caller.f_code.co_filename), replaces, time.perf_counter() - started)
+        if result is None:
+            raise RuntimeError(f"Attribute stream {self.id} is not running; was the page reloaded?")
+        self._append(result["events"])
+        return result["ok"]
+
+    def _append(self, events: list) -> list:
+        """Add browser events to the timeline, in ms since start()."""
+        entries = [(round(t - self._origin, 1), name, value) for t, name, value in events]
+        for _, name, value in entries:
+            self.values[name] = value
+        self.timeline.extend(entries)
+        return entries
+
+    def milestones(self, step: int = 20, attribute: str = None) -> list:
+        """First time (ms) a numeric attribute reached each multiple of step."""
+        attribute = attribute or self.attributes[0]
+        reached, next_mark = [], step
+        for t, name, value in self.timeline:
+            if name != attribute or value is None:
+                continue
+            while next_mark <= float(value):
+                reached.append((next_mark, t))
+                next_mark += step
+        return reached
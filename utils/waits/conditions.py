@@ -0,0 +1,273 @@
+"""
+Composable wait conditions.
+
+Every condition is a callable taking the driver and returning a truthy
+value once satisfied, so it plugs into WebDriverWait.until as well as
+Waiter. Element arguments accept either a locator tuple or a WebElement.
+"""
+
+import time
+
+from selenium.common.exceptions import NoAlertPresentException, NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+from config.config import Config
+from utils.waits.network import NetworkMonitor
+
+# Exceptions that mean "not yet" rather than "failed"
+TRANSIENT_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+
+def _resolve(driver, target) -> WebElement:
+    """Turn a locator tuple or element into an element."""
+    if isinstance(target, WebElement):
+        return target
+    return driver.find_element(*target)
+
+
+def _rect(driver, element) -> tuple:
+    """Element geometry in a single round trip."""
+    rect = driver.execute_script(
+        "const r = arguments[0].getBoundingClientRect(); return [r.x, r.y, r.width, r.height];",
+        element
+    )
+    return tuple(round(value, 1) for value in rect)
+
+
+def page_ready():
+    """document.readyState is complete."""
+    def condition(driver):
+        return driver.execute_script("return document.readyState") == "complete"
+    return condition
+
+
+def network_idle(quiet_ms: int = None):
+    """
+    The network has been quiet for quiet_ms (default Config.NETWORK_IDLE_MS)
+    after the document finished loading.
+
+    Uses DevTools Network events where the session has a performance log and
+    otherwise waits for the Resource Timing entry count to stop growing.
+    """
+    quiet_s = (quiet_ms if quiet_ms is not None else Config.NETWORK_IDLE_MS) / 1000
+    resources = {"count": None, "since": 0.0}
+
+    def condition(driver):
+        if driver.execute_script("return document.readyState") != "complete":
+            return False
+        monitor = NetworkMonitor.for_driver(driver)
+        monitor.poll()
+        if monitor.available:
+            return monitor.idle(quiet_s)
+
+        count = driver.execute_script("return performance.getEntriesByType('resource').length")
+        now = time.monotonic()
+        if count != resources["count"]:
+            resources.update(count=count, since=now)
+            return False
+        return now - resources["since"] >= quiet_s
+    return condition
+
+
+def element_present(target):
+    """Element exists in the DOM; returns the element."""
+    def condition(driver):
+        try:
+            return _resolve(driver, target)
+        except TRANSIENT_EXCEPTIONS:
+            return False
+    return condition
+
+
+def element_visible(target):
+    """Element is displayed; returns the element."""
+    def condition(driver):
+        try:
+            element = _resolve(driver, target)
+            return element if element.is_displayed() else False
+        except TRANSIENT_EXCEPTIONS:
+            return False
+    return condition
+
+
+def element_invisible(target):
+    """Element is hidden, detached or absent."""
+    def condition(driver):
+        try:
+            return not _resolve(driver, target).is_displayed()
+        except TRANSIENT_EXCEPTIONS:
+            return True
+    return condition
+
+
+def element_stable(target, samples: int = 2):
+    """Element geometry is unchanged across consecutive polls; returns the element."""
+    history = []
+
+    def condition(driver):
+        try:
+            element = _resolve(driver, target)
+            history.append(_rect(driver, element))
+        except TRANSIENT_EXCEPTIONS:
+            history.clear()
+            return False
+        recent = history[-samples:]
+        return element if len(recent) == samples and len(set(recent)) == 1 else False
+    return condition
+
+
+def animation_finished(target):
+    """No CSS/Web Animations or jQuery animations are running on the element or its children."""
+    script = """
+        const el = arguments[0];
+        const running = el.getAnimations({subtree: true}).some(a => a.playState === 'running');
+        const jq = window.jQuery && window.jQuery(el).is(':animated');
+        return !running && !jq;
+    """
+
+    def condition(driver):
+        try:
+            element = _resolve(driver, target)
+            return element if driver.execute_script(script, element) else False
+        except TRANSIENT_EXCEPTIONS:
+            return False
+    return condition
+
+
+def element_settled(target):
+    """Element has stopped moving: no animation running and geometry stable."""
+    return all_of(animation_finished(target), element_stable(target))
+
+
+def attribute_reached(target, name: str, expected):
+    """
+    Attribute matches the expected value.
+
+    Args:
+        expected: A value to compare with, or a predicate taking the attribute value
+    """
+    def condition(driver):
+        try:
+            value = _resolve(driver, target).get_attribute(name)
+        except TRANSIENT_EXCEPTIONS:
+            return False
+        matched = expected(value) if callable(expected) else value == expected
+        return (value or True) if matched else False
+    return condition
+
+
+def attribute_contains(target, name: str, fragment: str):
+    """Attribute value contains a substring, e.g. a CSS class."""
+    return attribute_reached(target, name, lambda value: value is not None and fragment in value)
+
+
+def text_changed(target, old_text: str):
+    """Element text differs from old_text; returns the new text (True if it is now empty)."""
+    def condition(driver):
+        try:
+            text = _resolve(driver, target).text
+        except TRANSIENT_EXCEPTIONS:
+            return False
+        if text == old_text:
+            return False
+        return text or True
+    return condition
+
+
+def text_contains(target, fragment: str):
+    """Element text contains a substring; returns the full text."""
+    def condition(driver):
+        try:
+            text = _resolve(driver, target).text
+        except TRANSIENT_EXCEPTIONS:
+            return False
+        return text if fragment in text else False
+    return condition
+
+
+def size_changed(target, old_size: dict):
+    """Element size differs from old_size; returns the new size."""
+    def condition(driver):
+        try:
+            size = _resolve(driver, target).size
+        except TRANSIENT_EXCEPTIONS:
+            return False
+        return size if size != old_size else False
+    return condition
+
+
+def location_changed(target, old_location: dict):
+    """Element location differs from old_location; returns the new location."""
+    def condition(driver):
+        try:
+            location = _resolve(driver, target).location
+        except TRANSIENT_EXCEPTIONS:
+            return False
+        return location if location != old_location else False
+    return condition
+
+
+def element_count(locator, predicate):
+    """Number of matching elements satisfies predicate; returns the elements."""
+    def condition(driver):
+        elements = driver.find_elements(*locator)
+        return elements if predicate(len(elements)) else False
+    return condition
+
+
+def window_count_changed(old_count: int):
+    """Number of open windows differs from old_count; returns the handles."""
+    def condition(driver):
+        handles = driver.window_handles
+        return handles if len(handles) != old_count else False
+    return condition
+
+
+def new_window(known_handles):
+    """A window handle not in known_handles exists; returns that handle."""
+    known = set(known_handles)
+
+    def condition(driver):
+        return next((handle for handle in driver.window_handles if handle not in known), False)
+    return condition
+
+
+def alert_present():
+    """A JavaScript alert, confirm or prompt is open; returns the Alert."""
+    def condition(driver):
+        try:
+            return driver.switch_to.alert
+        except NoAlertPresentException:
+            return False
+    return condition
+
+
+def url_changed(old_url: str):
+    """Current URL differs from old_url; returns the new URL."""
+    def condition(driver):
+        url = driver.current_url
+        return url if url != old_url else False
+    return condition
+
+
+def all_of(*conditions):
+    """Every condition holds; returns the list of their values."""
+    def condition(driver):
+        values = []
+        for each in conditions:
+            value = each(driver)
+            if not value:
+                return False
+            values.append(value)
+        return values
+    return condition
+
+
+def any_of(*conditions):
+    """At least one condition holds; returns the first truthy value."""
+    def condition(driver):
+        for each in conditions:
+            value = each(driver)
+            if value:
+                return value
+        return False
+    return condition
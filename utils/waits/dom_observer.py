@@ -0,0 +1,182 @@
+"""In-page MutationObserver waits: one async script call per wait instead of a polling loop."""
+
+import logging
+import sys
+import time
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+from config.config import Config
+from utils.waits.savings import WaitSavings, section_of
+
+logger = logging.getLogger(__name__)
+
+# Installed once per document; later calls find window.__domWatch and reuse it.
+# Every wait registers a check that runs on each mutation (and on a slow
+# interval for changes that only show through computed style).
+_WAIT_SCRIPT = """
+const [mode, using, value, quietMs, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+
+if (!window.__domWatch) {
+    const watch = window.__domWatch = {last: performance.now(), mutations: 0, checks: new Set()};
+    new MutationObserver(() => {
+        watch.last = performance.now();
+        watch.mutations++;
+        watch.checks.forEach(check => check());
+    }).observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+const watch = window.__domWatch;
+
+const find = () => {
+    if (using === 'xpath') {
+        return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(value);
+};
+const visible = el => !!el && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+    && getComputedStyle(el).visibility !== 'hidden';
+
+const started = performance.now();
+let finished = false, interval = null, quietTimer = null;
+const finish = result => {
+    if (finished) return;
+    finished = true;
+    watch.checks.delete(check);
+    clearInterval(interval);
+    clearTimeout(quietTimer);
+    done(Object.assign({mutations: watch.mutations, elapsedMs: performance.now() - started}, result));
+};
+const check = () => {
+    if (mode === 'quiet') {
+        clearTimeout(quietTimer);
+        const wait = Math.max(0, quietMs - (performance.now() - watch.last));
+        quietTimer = setTimeout(() => finish({ok: true}), wait);
+        return;
+    }
+    const el = find();
+    if (mode === 'present' && el) finish({ok: true, element: el});
+    else if (mode === 'visible' && visible(el)) finish({ok: true, element: el});
+    else if (mode === 'gone' && !visible(el)) finish({ok: true});
+};
+
+watch.checks.add(check);
+if (mode !== 'quiet') interval = setInterval(check, 100);
+setTimeout(() => finish({ok: false}), timeoutMs);
+check();
+"""
+
+# Locator strategies that translate to a CSS selector
+_CSS = {
+    By.ID: lambda value: f"#{value}",
+    By.CLASS_NAME: lambda value: f".{value}",
+    By.CSS_SELECTOR: lambda value: value,
+    By.TAG_NAME: lambda value: value,
+    By.NAME: lambda value: f"[name='{value}']",
+}
+
+# Link text strategies that translate to an XPath over anchors' whitespace-normalised text
+_XPATH = {
+    By.LINK_TEXT: lambda value: f"//a[normalize-space()={_xpath_literal(value.strip())}]",
+    By.PARTIAL_LINK_TEXT: lambda value: f"//a[contains(normalize-space(), {_xpath_literal(value.strip())})]",
+}
+
+
+def _xpath_literal(text: str) -> str:
+    """Quote text as an XPath 1.0 string literal, which has no escapes."""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in text.split("'")) + ")"
+
+
+def translate_locator(locator: tuple) -> tuple:
+    """Locator tuple to the (strategy, value) pair the page scripts understand: css or xpath."""
+    by, value = locator
+    if by is None:
+        return None, None
+    if by == By.XPATH:
+        return "xpath", value
+    if by in _CSS:
+        return "css", _CSS[by](value)
+    if by in _XPATH:
+        return "xpath", _XPATH[by](value)
+    raise ValueError(f"Locator strategy '{by}' cannot be resolved inside the page")
+
+
+def ensure_script_timeout(driver: webdriver.Remote, timeout: float) -> None:
+    """Give an in-page async wait room to hit its own timer before the driver (or its watchdog) gives up."""
+    needed = timeout + 5
+    if getattr(driver, "dom_script_timeout", 0) < needed:
+        driver.set_script_timeout(needed)
+        driver.dom_script_timeout = needed
+    watchdog = getattr(driver, "watchdog", None)
+    if watchdog is not None:
+        # The watchdog must outlast the script timeout, or it kills the browser first
+        command = Command.W3C_EXECUTE_SCRIPT_ASYNC
+        watchdog.deadlines[command] = max(watchdog.deadlines.get(command, watchdog.timeout), needed + watchdog.SCRIPT_MARGIN)
+
+
+class DomObserver:
+    """
+    Waits that block inside the page on a MutationObserver, so the driver
+    sends one command per wait and the result comes back the moment the
+    DOM changes rather than on the next 500 ms poll.
+    """
+
+    def __init__(self, driver: webdriver.Remote, timeout: float = None):
+        self.driver = driver
+        self.timeout = timeout or Config.EXPLICIT_WAIT
+        self.mutations = 0
+
+    def present(self, locator: tuple, timeout: float = None, replaces: float = 0,
+                required: bool = True) -> WebElement:
+        """
+        Wait until the locator matches an element; returns it.
+
+        Raises TimeoutException when it never appears, or returns None if not required.
+        """
+        return self._wait("present", locator, timeout, replaces, required, sys._getframe(1)).get("element")
+
+    def visible(self, locator: tuple, timeout: float = None, replaces: float = 0,
+                required: bool = True) -> WebElement:
+        """Wait until the locator matches a displayed element; returns it (None if not required and absent)."""
+        return self._wait("visible", locator, timeout, replaces, required, sys._getframe(1)).get("element")
+
+    def gone(self, locator: tuple, timeout: float = None, replaces: float = 0, required: bool = True) -> bool:
+        """Wait until the locator matches nothing visible (False if not required and still shown)."""
+        return self._wait("gone", locator, timeout, replaces, required, sys._getframe(1))["ok"]
+
+    def quiet(self, quiet_ms: int = None, timeout: float = None, replaces: float = 0) -> bool:
+        """
+        Wait until the DOM has had no mutation for quiet_ms (default Config.DOM_QUIET_MS).
+
+        Returns:
+            False if the page kept changing for the whole timeout
+        """
+        quiet_ms = quiet_ms if quiet_ms is not None else Config.DOM_QUIET_MS
+        result = self._run("quiet", (None, None), quiet_ms, timeout or self.timeout, replaces, sys._getframe(1))
+        return result["ok"]
+
+    def _wait(self, mode: str, locator: tuple, timeout: float, replaces: float, required: bool, caller) -> dict:
+        """Run a locator wait, raising TimeoutException when a required one never holds."""
+        timeout = timeout or self.timeout
+        result = self._run(mode, locator, 0, timeout, replaces, caller)
+        if required and not result["ok"]:
+            raise TimeoutException(f"Element {locator} not {mode} within {timeout}s")
+        return result
+
+    def _run(self, mode: str, locator: tuple, quiet_ms: int, timeout: float, replaces: float, caller) -> dict:
+        """One async script call; the page answers when the condition holds or its own timer fires."""
+        using, value = translate_locator(locator)
+        ensure_script_timeout(self.driver, timeout)
+        started = time.perf_counter()
+        result = self.driver.execute_async_script(_WAIT_SCRIPT, mode, using, value, quiet_ms, int(timeout * 1000))
+        self.mutations = result["mutations"]
+        if replaces:
+            WaitSavings.record(section_of(caller.f_code.co_filename), replaces, time.perf_counter() - started)
+        return result
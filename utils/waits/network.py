@@ -0,0 +1,95 @@
+"""Network-idle tracking from the browser's DevTools Network events."""
+
+import json
+import logging
+import time
+from collections import deque
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from config.config import Config
+from utils.lazy_driver import unwrap_driver
+
+logger = logging.getLogger(__name__)
+
+
+class NetworkMonitor:
+    """
+    Counts in-flight requests per session from the Network.* events that
+    chromedriver writes to the performance log (enabled by BrowserProfile).
+
+    The log is drained on read, so there is one monitor per driver and every
+    consumer, tests included, reads the events through it.
+    """
+
+    FINISHED = ("Network.loadingFinished", "Network.loadingFailed")
+
+    def __init__(self, driver: webdriver.Remote):
+        self.driver = driver
+        self.available = True
+        self.pending = {}                      # requestId -> start time (epoch seconds)
+        self.last_activity = 0.0
+        self.responses = deque(maxlen=500)     # URLs of received responses, newest last
+
+    @classmethod
+    def for_driver(cls, driver: webdriver.Remote) -> "NetworkMonitor":
+        """
+        Get the session's monitor, creating it on first use. It lives on the real
+        driver behind a LazyDriver/ContextDriver, since the performance log belongs
+        to the session; callers read the log straight away, so a lazy browser starts here.
+        """
+        session = unwrap_driver(driver)
+        monitor = vars(session).get("network_monitor")
+        if monitor is None:
+            monitor = session.network_monitor = cls(session)
+        return monitor
+
+    def poll(self) -> None:
+        """Drain the performance log and update the in-flight set."""
+        if not self.available:
+            return
+        try:
+            entries = self.driver.get_log("performance")
+        except (WebDriverException, AttributeError, KeyError) as e:
+            # Firefox and sessions started without performance logging
+            logger.debug(f"Performance log unavailable, falling back to resource timing: {e}")
+            self.available = False
+            return
+
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            method = message.get("method", "")
+            if not method.startswith("Network."):
+                continue
+            params = message.get("params", {})
+            request_id = params.get("requestId")
+            timestamp = entry["timestamp"] / 1000
+            self.last_activity = max(self.last_activity, timestamp)
+
+            if method == "Network.requestWillBeSent":
+                self.pending.setdefault(request_id, timestamp)
+            elif method in self.FINISHED:
+                self.pending.pop(request_id, None)
+            elif method == "Network.responseReceived":
+                self.responses.append(params["response"]["url"])
+
+    def reset(self) -> None:
+        """Drop buffered events and tracked requests, e.g. when a pooled session is handed to the next test."""
+        self.poll()
+        self.pending.clear()
+        self.responses.clear()
+        self.last_activity = 0.0
+
+    def in_flight(self, now: float = None) -> int:
+        """
+        Requests still open, ignoring ones older than NETWORK_STALL_S
+        (long polls, beacons and ad requests that never finish).
+        """
+        now = now or time.time()
+        return sum(1 for started in self.pending.values() if now - started < Config.NETWORK_STALL_S)
+
+    def idle(self, quiet_s: float) -> bool:
+        """No request in flight and no network event for quiet_s seconds, as of the last poll."""
+        now = time.time()
+        return self.in_flight(now) == 0 and now - self.last_activity >= quiet_s
+
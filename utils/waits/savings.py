@@ -0,0 +1,93 @@
+"""Bookkeeping of time saved by condition waits against the fixed sleeps they replaced."""
+
+import atexit
+import json
+import logging
+import os
+import threading
+
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def section_of(path: str) -> str:
+    """Test section a file belongs to, taken from tests/<section>/..."""
+    parts = os.path.normpath(path).split(os.sep)
+    if "tests" in parts:
+        index = len(parts) - 1 - parts[::-1].index("tests")
+        if index + 2 < len(parts):
+            return parts[index + 1]
+    return "other"
+
+
+class WaitSavings:
+    """Per-section totals of baseline sleep time vs. actual wait time."""
+
+    _lock = threading.Lock()
+    _totals = {}
+    _atexit_registered = False
+
+    @classmethod
+    def directory(cls) -> str:
+        """Where each process drops its totals."""
+        return os.path.join(Config.REPORTS_DIR, "wait_savings")
+
+    @classmethod
+    def record(cls, section: str, baseline: float, actual: float) -> None:
+        """Add one wait that replaced a sleep of `baseline` seconds."""
+        with cls._lock:
+            entry = cls._totals.setdefault(section, {"waits": 0, "baseline_s": 0.0, "actual_s": 0.0})
+            entry["waits"] += 1
+            entry["baseline_s"] += baseline
+            entry["actual_s"] += actual
+            if not cls._atexit_registered:
+                atexit.register(cls.save)
+                cls._atexit_registered = True
+
+    @classmethod
+    def totals(cls) -> dict:
+        """Snapshot of this process' totals."""
+        with cls._lock:
+            return {section: dict(entry) for section, entry in cls._totals.items()}
+
+    @classmethod
+    def save(cls) -> None:
+        """Write this process' totals as JSON."""
+        totals = cls.totals()
+        if not totals:
+            return
+        os.makedirs(cls.directory(), exist_ok=True)
+        worker = os.environ.get("PYTEST_XDIST_WORKER", f"pid{os.getpid()}")
+        path = os.path.join(cls.directory(), f"{worker}.json")
+        with open(path, "w") as f:
+            json.dump(totals, f, indent=2)
+        logger.info(f"Wait savings saved: {path}")
+
+    @classmethod
+    def aggregate(cls) -> dict:
+        """Merge the totals written by every process, with seconds saved per section."""
+        merged = {}
+        if not os.path.isdir(cls.directory()):
+            return merged
+        for name in os.listdir(cls.directory()):
+            if not name.endswith(".json"):
+                continue
+            with open(os.path.join(cls.directory(), name)) as f:
+                for section, entry in json.load(f).items():
+                    total = merged.setdefault(section, {"waits": 0, "baseline_s": 0.0, "actual_s": 0.0})
+                    for key in total:
+                        total[key] += entry[key]
+        for entry in merged.values():
+            entry["saved_s"] = round(entry["baseline_s"] - entry["actual_s"], 2)
+            entry["baseline_s"] = round(entry["baseline_s"], 2)
+            entry["actual_s"] = round(entry["actual_s"], 2)
+        return merged
+
+    @classmethod
+    def clear(cls) -> None:
+        """Remove totals left by a previous run."""
+        if os.path.isdir(cls.directory()):
+            for name in os.listdir(cls.directory()):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(cls.directory(), name))
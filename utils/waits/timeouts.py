@@ -0,0 +1,121 @@
+"""Per-locator deadlines learned from how long each locator took to appear in earlier runs."""
+
+import atexit
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(samples: list, pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class AdaptiveTimeouts:
+    """
+    Keeps the last MAX_SAMPLES appearance times per locator in
+    Config.TIMEOUT_HISTORY_FILE and turns them into a deadline of
+    p99 x ADAPTIVE_SAFETY_FACTOR, floored at ADAPTIVE_MIN_TIMEOUT and capped
+    at the caller's default, so a broken locator fails in seconds.
+    """
+
+    MAX_SAMPLES = 200
+
+    _lock = threading.Lock()
+    _history = None          # key -> samples, loaded from disk on first use
+    _new = {}                # key -> samples recorded by this process
+    _atexit_registered = False
+
+    @staticmethod
+    def key(page: str, locator: tuple) -> str:
+        """History key for a page object locator."""
+        by, value = locator
+        return f"{page}:{by}={value}"
+
+    @classmethod
+    def _load(cls) -> dict:
+        if cls._history is None:
+            try:
+                with open(Config.TIMEOUT_HISTORY_FILE) as f:
+                    cls._history = json.load(f)
+            except (OSError, ValueError):
+                cls._history = {}
+        return cls._history
+
+    @classmethod
+    def record(cls, key: str, seconds: float) -> None:
+        """Add one successful wait."""
+        if not Config.ADAPTIVE_TIMEOUTS:
+            return
+        with cls._lock:
+            samples = cls._load().setdefault(key, [])
+            samples.append(round(seconds, 3))
+            del samples[:-cls.MAX_SAMPLES]
+            cls._new.setdefault(key, []).append(round(seconds, 3))
+            if not cls._atexit_registered:
+                atexit.register(cls.save)
+                cls._atexit_registered = True
+
+    @classmethod
+    def timeout_for(cls, key: str, default: float) -> float:
+        """Learned deadline for a locator, or the default until there is enough history."""
+        if not Config.ADAPTIVE_TIMEOUTS:
+            return default
+        with cls._lock:
+            samples = list(cls._load().get(key, ()))
+        if len(samples) < Config.ADAPTIVE_MIN_SAMPLES:
+            return default
+        learned = percentile(samples, 99) * Config.ADAPTIVE_SAFETY_FACTOR
+        return round(min(default, max(Config.ADAPTIVE_MIN_TIMEOUT, learned)), 2)
+
+    @classmethod
+    def table(cls, default: float = None) -> dict:
+        """Learned statistics and deadline per locator, slowest first."""
+        default = default or Config.EXPLICIT_WAIT
+        with cls._lock:
+            history = {key: list(samples) for key, samples in cls._load().items() if samples}
+        rows = {
+            key: {
+                "samples": len(samples),
+                "p50_s": percentile(samples, 50),
+                "p99_s": percentile(samples, 99),
+                "max_s": max(samples),
+                "timeout_s": cls.timeout_for(key, default),
+            }
+            for key, samples in history.items()
+        }
+        return dict(sorted(rows.items(), key=lambda item: -item[1]["p99_s"]))
+
+    @classmethod
+    def save(cls) -> None:
+        """Merge this process' samples into the history file (other workers may have written meanwhile)."""
+        with cls._lock:
+            new = {key: list(samples) for key, samples in cls._new.items()}
+            cls._new.clear()
+        if not new:
+            return
+        try:
+            with open(Config.TIMEOUT_HISTORY_FILE) as f:
+                history = json.load(f)
+        except (OSError, ValueError):
+            history = {}
+        for key, samples in new.items():
+            history[key] = (history.get(key, []) + samples)[-cls.MAX_SAMPLES:]
+
+        directory = os.path.dirname(Config.TIMEOUT_HISTORY_FILE)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, staging = tempfile.mkstemp(dir=directory, suffix=".json")
+            with os.fdopen(fd, "w") as f:
+                json.dump(history, f, indent=1)
+            os.replace(staging, Config.TIMEOUT_HISTORY_FILE)
+        except OSError as e:
+            logger.warning(f"Could not write locator timing history: {e}")
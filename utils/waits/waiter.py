@@ -0,0 +1,103 @@
+"""Fast-polling waiter that runs the conditions in utils.waits.conditions."""
+
+import logging
+import sys
+import time
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.alert import Alert
+from config.config import Config
+from utils.waits.conditions import TRANSIENT_EXCEPTIONS, alert_present, new_window
+from utils.waits.savings import WaitSavings, section_of
+
+logger = logging.getLogger(__name__)
+
+
+class Waiter:
+    """
+    Polls a condition every `poll` seconds instead of sleeping a fixed time.
+
+    Pass `replaces` with the length of the sleep a wait stands in for, and the
+    difference is credited to the calling test's section in WaitSavings.
+    """
+
+    DEFAULT_POLL = 0.05
+
+    def __init__(self, driver: webdriver.Remote, timeout: float = None, poll: float = None):
+        self.driver = driver
+        self.timeout = timeout or Config.EXPLICIT_WAIT
+        self.poll = poll or self.DEFAULT_POLL
+
+    def until(self, condition, timeout: float = None, replaces: float = 0, message: str = ""):
+        """
+        Wait for a condition, raising TimeoutException if it never holds.
+
+        Returns:
+            The condition's truthy value
+        """
+        timeout = timeout or self.timeout
+        value, elapsed = self._poll(condition, timeout)
+        self._credit(replaces, elapsed, sys._getframe(1))
+        if not value:
+            raise TimeoutException(message or f"Condition not met within {timeout}s")
+        return value
+
+    def settle(self, condition, timeout: float, replaces: float = None):
+        """
+        Wait for a condition for at most `timeout` seconds without raising.
+
+        For sleeps that covered something which may legitimately not happen,
+        e.g. a drop that should be rejected. The baseline defaults to the timeout.
+
+        Returns:
+            The condition's value, False if it never held
+        """
+        value, elapsed = self._poll(condition, timeout)
+        self._credit(timeout if replaces is None else replaces, elapsed, sys._getframe(1))
+        return value
+
+    def new_window(self, known_handles, timeout: float = None, switch: bool = True, replaces: float = 0) -> str:
+        """
+        Wait for a window or tab that is not in known_handles.
+
+        Returns:
+            The new handle, already switched to unless switch=False
+        """
+        timeout = timeout or self.timeout
+        handle, elapsed = self._poll(new_window(known_handles), timeout)
+        self._credit(replaces, elapsed, sys._getframe(1))
+        if not handle:
+            raise TimeoutException(f"No new window opened within {timeout}s")
+        if switch:
+            self.driver.switch_to.window(handle)
+        return handle
+
+    def alert(self, timeout: float = None, replaces: float = 0) -> Alert:
+        """Wait for a JavaScript alert, confirm or prompt and return it."""
+        timeout = timeout or self.timeout
+        alert, elapsed = self._poll(alert_present(), timeout)
+        self._credit(replaces, elapsed, sys._getframe(1))
+        if not alert:
+            raise TimeoutException(f"No alert appeared within {timeout}s")
+        return alert
+
+    def _poll(self, condition, timeout: float) -> tuple:
+        """Evaluate the condition until it holds or time runs out."""
+        started = time.perf_counter()
+        deadline = started + timeout
+        while True:
+            try:
+                value = condition(self.driver)
+            except TRANSIENT_EXCEPTIONS:
+                value = False
+            now = time.perf_counter()
+            if value or now >= deadline:
+                return value, now - started
+            time.sleep(min(self.poll, deadline - now))
+
+    @staticmethod
+    def _credit(baseline: float, elapsed: float, frame) -> None:
+        """Record the wait against the sleep it replaced."""
+        if baseline:
+            WaitSavings.record(section_of(frame.f_code.co_filename), baseline, elapsed)
@@ -0,0 +1,197 @@
+"""Per-command deadlines for WebDriver sessions."""
+
+import itertools
+import logging
+import threading
+import time
+from urllib import parse
+
+import psutil
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from config.config import Config
+from utils.process_tree import session_processes
+
+logger = logging.getLogger(__name__)
+
+
+class CommandTimeoutError(WebDriverException):
+    """A WebDriver command exceeded its deadline and the browser was killed."""
+
+
+class SessionWatchdog:
+    """
+    Kills a session's browser process tree when a single command hangs,
+    so a stuck call costs seconds instead of the whole suite budget.
+
+    One monitor thread per session watches the deadlines of the commands in
+    flight. Remote sessions have no local processes, so their session is
+    deleted on the grid instead. With a restart callable, the first command
+    after a kill starts a fresh session on the same driver object, so only
+    the command that hung fails.
+    """
+
+    NAVIGATION_COMMANDS = (Command.GET, Command.REFRESH, Command.GO_BACK, Command.GO_FORWARD)
+    # Seconds an async script may run past the session's script timeout before it counts as hung
+    SCRIPT_MARGIN = 10
+
+    def __init__(self, driver: webdriver.Remote, timeout: float = None, remote: bool = None, restart=None):
+        """
+        Args:
+            remote: Session runs on a grid; defaults to whether Config.REMOTE_URL is set
+            restart: Callable starting a new session on the driver after a kill
+        """
+        self.driver = driver
+        self.timeout = timeout or Config.COMMAND_TIMEOUT
+        self.remote = bool(Config.REMOTE_URL) if remote is None else remote
+        self.restart = restart
+        # Per-command overrides in seconds, keyed by selenium Command name
+        self.deadlines = {command: Config.PAGE_LOAD_TIMEOUT + 10 for command in self.NAVIGATION_COMMANDS}
+        # The session's async script timeout (W3C default 30 s), tracked from SET_TIMEOUTS
+        self.script_timeout = 30.0
+        self.killed = False
+        self._execute = driver.execute
+        self._in_flight = {}                 # token -> (monotonic deadline, command)
+        self._tokens = itertools.count()
+        self._changed = threading.Condition()
+        self._monitor = None
+        self._closed = False
+
+    def install(self) -> webdriver.Remote:
+        """Route every command of the driver through the watchdog."""
+        self.driver.execute = self.execute
+        self.driver.watchdog = self
+        return self.driver
+
+    def deadline_for(self, command: str) -> float:
+        """Get the deadline for a command; async scripts get at least the script timeout plus a margin."""
+        deadline = self.deadlines.get(command, self.timeout)
+        if command == Command.W3C_EXECUTE_SCRIPT_ASYNC:
+            deadline = max(deadline, self.script_timeout + self.SCRIPT_MARGIN)
+        return deadline
+
+    def execute(self, driver_command: str, params: dict = None):
+        """Run a command, killing the browser if it outlives its deadline."""
+        if self.killed:
+            if driver_command == Command.QUIT:
+                return self._quit_killed()
+            self._recover()
+        if driver_command == Command.SET_TIMEOUTS and (params or {}).get("script") is not None:
+            self.script_timeout = params["script"] / 1000
+
+        token = self._arm(driver_command)
+        try:
+            return self._execute(driver_command, params)
+        except Exception as e:
+            if self.killed:
+                raise CommandTimeoutError(
+                    f"Command '{driver_command}' exceeded {self.deadline_for(driver_command)}s and the browser was killed"
+                ) from e
+            raise
+        finally:
+            self._disarm(token)
+            if driver_command == Command.QUIT:
+                self.close()
+
+    def close(self) -> None:
+        """Stop the monitor thread."""
+        with self._changed:
+            self._closed = True
+            self._changed.notify()
+
+    def _arm(self, command: str) -> int:
+        """Register a command's deadline, starting the monitor on first use."""
+        with self._changed:
+            token = next(self._tokens)
+            self._in_flight[token] = (time.monotonic() + self.deadline_for(command), command)
+            if self._monitor is None:
+                self._closed = False
+                self._monitor = threading.Thread(target=self._watch, name="session-watchdog", daemon=True)
+                self._monitor.start()
+            self._changed.notify()
+        return token
+
+    def _disarm(self, token: int) -> None:
+        with self._changed:
+            self._in_flight.pop(token, None)
+            self._changed.notify()
+
+    def _watch(self) -> None:
+        """Sleep until the earliest deadline in flight; kill the session if it passes."""
+        with self._changed:
+            while not self._closed:
+                if not self._in_flight:
+                    self._changed.wait()
+                    continue
+                token, (deadline, command) = min(self._in_flight.items(), key=lambda item: item[1][0])
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._changed.wait(remaining)
+                    continue
+                self._in_flight.clear()
+                self._monitor = None
+                break
+            else:
+                self._monitor = None
+                return
+        self._on_hang(command)
+
+    def _on_hang(self, command: str) -> None:
+        """Deadline expired: end the session so the blocked call returns."""
+        self.killed = True
+        logger.error(f"WebDriver command '{command}' hung for {self.deadline_for(command)}s, killing browser")
+        try:
+            if self.remote:
+                self.delete_remote_session()
+            else:
+                self.kill_process_tree()
+        except (psutil.Error, WebDriverException, OSError) as e:
+            logger.error(f"Watchdog could not end the session: {e}")
+
+    def _recover(self) -> None:
+        """Start a fresh session after a kill, or fail every command if that is not possible."""
+        if self.restart is None:
+            raise CommandTimeoutError("Session was killed by the watchdog after a hung command")
+        self.killed = False
+        self.script_timeout = 30.0
+        try:
+            self.restart()
+        except Exception as e:
+            self.killed = True
+            raise CommandTimeoutError("Session was killed by the watchdog and could not be restarted") from e
+        logger.info(f"Watchdog started a fresh session {self.driver.session_id} after a kill")
+
+    def _quit_killed(self) -> None:
+        """Quit a killed session without starting a new one just to close it."""
+        self.close()
+        try:
+            self._execute(Command.QUIT, None)
+        except WebDriverException as e:
+            logger.debug(f"Quit of a killed session failed as expected: {e}")
+
+    def kill_process_tree(self) -> None:
+        """Kill the session's browser (and its own driver, if not shared) and reap the children."""
+        processes = session_processes(self.driver)
+        for process in processes:
+            try:
+                process.kill()
+            except psutil.NoSuchProcess:
+                pass
+        gone, alive = psutil.wait_procs(processes, timeout=5)
+        logger.info(f"Watchdog killed {len(gone)} processes, {len(alive)} still alive")
+
+    def delete_remote_session(self) -> None:
+        """
+        Delete the session on the grid over a fresh connection, so the blocked
+        command gets an error back; the shared pool may have no free slot.
+        """
+        executor = self.driver.command_executor
+        url = f"{executor._client_config.remote_server_addr.rstrip('/')}/session/{self.driver.session_id}"
+        headers = RemoteConnection.get_remote_connection_headers(parse.urlparse(url))
+        headers.update(executor._client_config.get_auth_header() or {})
+        # The base class builds a one-off manager with the same TLS and proxy settings
+        with RemoteConnection._get_connection_manager(executor) as http:
+            response = http.request("DELETE", url, headers=headers, timeout=10)
+        logger.info(f"Watchdog deleted remote session {self.driver.session_id}: HTTP {response.status}")
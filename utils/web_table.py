@@ -0,0 +1,145 @@
+"""Whole-table reads of react-table grids into a columnar model queried in Python."""
+
+import logging
+import re
+
+from selenium import webdriver
+from config.config import Config
+from utils.waits.dom_observer import ensure_script_timeout
+
+logger = logging.getLogger(__name__)
+
+# Walks every page of a react-table (.rt-table) from the first to the last,
+# collecting the cell text of real rows, then goes back to the page the user
+# was on. Page turns are real clicks, each awaited until the page number changes.
+_READ_TABLE_SCRIPT = """
+const [selector, maxPages] = arguments;
+const done = arguments[arguments.length - 1];
+const root = document.querySelector(selector);
+if (!root) { done(null); return; }
+const container = root.closest('.ReactTable') || root.parentElement;
+const text = el => (el.innerText || el.textContent || '').trim();
+const button = name => container.querySelector(`.-${name} button`);
+const enabled = el => !!el && !el.disabled;
+const pageJump = () => container.querySelector('.-pageJump input');
+const page = () => pageJump() ? Number(pageJump().value) : 1;
+const tick = () => new Promise(resolve => setTimeout(resolve, 10));
+const turn = async name => {
+    const before = page();
+    button(name).click();
+    for (let i = 0; i < 200 && page() === before; i++) await tick();
+};
+
+(async () => {
+    const columns = [...root.querySelectorAll('.rt-thead.-header .rt-th')].map(text);
+    const start = page();
+    while (enabled(button('previous'))) await turn('previous');
+    const rows = [];
+    let pages = 1;
+    while (true) {
+        root.querySelectorAll('.rt-tbody .rt-tr:not(.-padRow)').forEach(row => {
+            const cells = [...row.querySelectorAll('.rt-td')].map(text);
+            if (cells.some(cell => cell !== '')) rows.push(cells);
+        });
+        if (!enabled(button('next')) || pages >= maxPages) break;
+        await turn('next');
+        pages++;
+    }
+    while (page() > start && enabled(button('previous'))) await turn('previous');
+    done({columns: columns, rows: rows, pages: pages});
+})().catch(error => done({error: String(error)}));
+"""
+
+_NUMBER = re.compile(r"^-?\d+(\.\d+)?$")
+
+
+class WebTable:
+    """
+    Column-oriented copy of a table: one list of cell strings per column.
+
+        table = WebTable.read(driver)
+        table.column("Age")                         # ['39', '45', '29']
+        table.where(Department="Legal").rows()      # [{'First Name': 'Alden', ...}]
+        table.search("cierra")                      # rows with a matching cell, like the search box
+        table.is_sorted("Salary")
+    """
+
+    def __init__(self, columns: list, data: dict, pages: int = 1):
+        self.columns = columns
+        self.data = data
+        self.pages = pages
+
+    @classmethod
+    def from_rows(cls, columns: list, rows: list, pages: int = 1) -> "WebTable":
+        """Build from row lists; short rows are padded with empty cells."""
+        data = {name: [row[index] if index < len(row) else "" for row in rows] for index, name in enumerate(columns)}
+        return cls(columns, data, pages)
+
+    @classmethod
+    def read(cls, driver: webdriver.Remote, selector: str = ".rt-table", max_pages: int = 500) -> "WebTable":
+        """Read headers and the rows of every page in one async script call."""
+        ensure_script_timeout(driver, Config.EXPLICIT_WAIT)
+        result = driver.execute_async_script(_READ_TABLE_SCRIPT, selector, max_pages)
+        if result is None:
+            raise ValueError(f"No table matches {selector!r}")
+        if "error" in result:
+            raise RuntimeError(f"Could not read table {selector!r}: {result['error']}")
+        logger.info(f"Read {len(result['rows'])} rows over {result['pages']} pages from {selector}")
+        return cls.from_rows(result["columns"], result["rows"], result["pages"])
+
+    def __len__(self) -> int:
+        return len(self.data[self.columns[0]]) if self.columns else 0
+
+    def __repr__(self) -> str:
+        return f"<WebTable {len(self)} rows x {len(self.columns)} columns>"
+
+    def column(self, name: str) -> list:
+        """Cell values of one column, top to bottom."""
+        return self.data[name]
+
+    def row(self, index: int) -> dict:
+        """One row as {column: value}."""
+        return {name: self.data[name][index] for name in self.columns}
+
+    def rows(self) -> list:
+        return [self.row(index) for index in range(len(self))]
+
+    def _take(self, indexes: list) -> "WebTable":
+        data = {name: [values[index] for index in indexes] for name, values in self.data.items()}
+        return WebTable(self.columns, data, self.pages)
+
+    def filter(self, predicate) -> "WebTable":
+        """Rows for which predicate(row dict) is true."""
+        return self._take([index for index in range(len(self)) if predicate(self.row(index))])
+
+    def where(self, **equals) -> "WebTable":
+        """Rows whose columns equal the given values; underscores stand for spaces in column names."""
+        wanted = {name.replace("_", " "): str(value) for name, value in equals.items()}
+        return self._take([
+            index for index in range(len(self))
+            if all(self.data[name][index] == value for name, value in wanted.items())
+        ])
+
+    def search(self, text: str) -> "WebTable":
+        """Rows with any cell containing text, case-insensitively."""
+        needle = text.lower()
+        return self._take([
+            index for index in range(len(self))
+            if any(needle in self.data[name][index].lower() for name in self.columns)
+        ])
+
+    def _sort_key(self, name: str):
+        values = self.data[name]
+        if values and all(_NUMBER.match(value) for value in values):
+            return lambda index: float(values[index])
+        return lambda index: values[index].lower()
+
+    def sort_by(self, name: str, reverse: bool = False) -> "WebTable":
+        """Rows ordered by a column, numerically when every value is a number."""
+        return self._take(sorted(range(len(self)), key=self._sort_key(name), reverse=reverse))
+
+    def is_sorted(self, name: str, reverse: bool = False) -> bool:
+        """Whether the rows are already in sort_by(name, reverse) order (ties in any order)."""
+        key = self._sort_key(name)
+        keys = [key(index) for index in range(len(self))]
+        return keys == sorted(keys, reverse=reverse)